@@ -0,0 +1,473 @@
+"""
+Offline synthetic-load benchmarks for DonationLogger.
+
+Run from the repository root in an environment that has Red-DiscordBot and noobutils installed:
+
+    python -m benchmarks.bench_donationlogger --sizes 1000 10000 100000 --output results.json
+
+Nothing connects to Discord. The cog runs against fake guilds, members, roles and channels,
+and its config is backed by an in-memory driver. Results are written as JSON so runs can be
+compared between commits.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import pickle
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+from redbot.core import Config, commands, data_manager
+from redbot.core.drivers.base import BaseDriver, IdentifierData
+
+from donationlogger import DonationLogger
+from donationlogger.hybrids import HYBRIDS
+
+
+BANK = "main"
+MILESTONES = [10_000, 100_000, 1_000_000, 10_000_000, 100_000_000]
+
+
+class MemoryDriver(BaseDriver):
+    """Config driver that keeps everything in a dict, with the JSON driver's semantics."""
+
+    def __init__(self, cog_name: str, identifier: str, **kwargs) -> None:
+        super().__init__(cog_name, identifier)
+        self.data: Dict[str, Any] = {}
+
+    @classmethod
+    async def initialize(cls, **storage_details) -> None:
+        pass
+
+    @classmethod
+    async def teardown(cls) -> None:
+        pass
+
+    @staticmethod
+    def get_config_details() -> Dict[str, Any]:
+        return {}
+
+    async def get(self, identifier_data: IdentifierData) -> Any:
+        partial = self.data
+        for key in identifier_data.to_tuple()[1:]:
+            partial = partial[key]
+        return pickle.loads(pickle.dumps(partial, -1))
+
+    async def set(self, identifier_data: IdentifierData, value=None) -> None:
+        keys = identifier_data.to_tuple()[1:]
+        partial = self.data
+        for key in keys[:-1]:
+            partial = partial.setdefault(key, {})
+        # Round-trip through JSON so int keys become strings, as they would on disk.
+        partial[keys[-1]] = json.loads(json.dumps(value))
+
+    async def clear(self, identifier_data: IdentifierData) -> None:
+        keys = identifier_data.to_tuple()[1:]
+        partial = self.data
+        try:
+            for key in keys[:-1]:
+                partial = partial[key]
+            del partial[keys[-1]]
+        except KeyError:
+            pass
+
+    @classmethod
+    async def aiter_cogs(cls):
+        return
+        yield
+
+
+class FakeAsset:
+    url = "https://cdn.discordapp.com/embed/avatars/0.png"
+
+
+class FakePermissions:
+    embed_links = True
+
+
+class FakeRole:
+    def __init__(self, role_id: int, position: int) -> None:
+        self.id = role_id
+        self.name = f"role-{role_id}"
+        self.position = position
+        self.mention = f"<@&{role_id}>"
+
+    def __lt__(self, other: "FakeRole") -> bool:
+        return self.position < other.position
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+class FakeMember:
+    def __init__(self, member_id: int, guild: "FakeGuild") -> None:
+        self.id = member_id
+        self.guild = guild
+        self.name = self.display_name = f"member{member_id}"
+        self.mention = f"<@{member_id}>"
+        self.colour = self.color = discord.Colour.default()
+        self.bot = False
+        self.avatar = self.display_avatar = FakeAsset()
+        self.roles: List[FakeRole] = [guild.default_role]
+
+    @property
+    def _roles(self) -> List[int]:
+        return [role.id for role in self.roles[1:]]
+
+    @property
+    def top_role(self) -> FakeRole:
+        return max(self.roles)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return next((role for role in self.roles if role.id == role_id), None)
+
+    async def add_roles(self, *roles: FakeRole, reason: str = None) -> None:
+        self.roles.extend(role for role in roles if role not in self.roles)
+
+    async def remove_roles(self, *roles: FakeRole, reason: str = None) -> None:
+        self.roles = [role for role in self.roles if role not in roles]
+
+    async def edit(self, *, roles: List[FakeRole] = None, reason: str = None) -> None:
+        if roles is not None:
+            self.roles = [self.guild.default_role, *roles]
+
+
+class FakeMessage:
+    def __init__(self, channel: "FakeChannel", author: FakeMember) -> None:
+        self.id = channel.next_id()
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.jump_url = (
+            f"https://discord.com/channels/{self.guild.id}/{channel.id}/{self.id}"
+        )
+
+    def to_reference(self, *, fail_if_not_exists: bool = True) -> None:
+        return None
+
+    async def edit(self, **kwargs) -> "FakeMessage":
+        return self
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, guild: "FakeGuild") -> None:
+        self.id = channel_id
+        self.guild = guild
+        self.name = f"channel-{channel_id}"
+        self.mention = f"<#{channel_id}>"
+        self.sent = 0
+        self._counter = channel_id
+
+    def next_id(self) -> int:
+        self._counter += 1
+        return self._counter
+
+    def permissions_for(self, member: FakeMember) -> FakePermissions:
+        return FakePermissions()
+
+    async def send(self, content: str = None, **kwargs) -> FakeMessage:
+        self.sent += 1
+        return FakeMessage(self, self.guild.me)
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int, size: int) -> None:
+        self.id = guild_id
+        self.name = f"Benchmark Guild ({size} donators)"
+        self.icon = None
+        self.default_role = FakeRole(guild_id, 0)
+        self.roles: Dict[int, FakeRole] = {guild_id: self.default_role}
+        for position, _ in enumerate(MILESTONES, 1):
+            role = FakeRole(guild_id + position, position)
+            self.roles[role.id] = role
+        self.members: Dict[int, FakeMember] = {}
+        for offset in range(1, size + 1):
+            self.members[guild_id + 1000 + offset] = FakeMember(
+                guild_id + 1000 + offset, self
+            )
+        self.me = FakeMember(guild_id + 999, self)
+        self.me.roles.append(FakeRole(guild_id + 998, len(MILESTONES) + 1))
+        self.members[self.me.id] = self.me
+        self.command_channel = FakeChannel(guild_id + 100, self)
+        self.log_channel = FakeChannel(guild_id + 200, self)
+        self.channels = {
+            channel.id: channel for channel in (self.command_channel, self.log_channel)
+        }
+
+    @property
+    def member_count(self) -> int:
+        return len(self.members)
+
+    def get_member(self, member_id: int) -> Optional[FakeMember]:
+        return self.members.get(member_id)
+
+    def get_role(self, role_id: int) -> Optional[FakeRole]:
+        return self.roles.get(role_id)
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channels.get(channel_id)
+
+
+class FakeBot:
+    def __init__(self) -> None:
+        self.guilds: Dict[int, FakeGuild] = {}
+
+    def get_guild(self, guild_id: int) -> Optional[FakeGuild]:
+        return self.guilds.get(guild_id)
+
+    async def get_embed_colour(self, location) -> discord.Colour:
+        return discord.Colour.red()
+
+    async def get_valid_prefixes(self, guild: FakeGuild = None) -> List[str]:
+        return ["!"]
+
+    async def wait_until_red_ready(self) -> None:
+        pass
+
+    def add_dev_env_value(self, name: str, value: Callable) -> None:
+        pass
+
+    def remove_dev_env_value(self, name: str) -> None:
+        pass
+
+
+class FakeContext(commands.Context):
+    """A prefix command invocation that only carries what the hybrids read."""
+
+    def __init__(self, bot: FakeBot, message: FakeMessage) -> None:
+        self.bot = bot
+        self.message = message
+        self.prefix = "!"
+
+    async def send(self, content: str = None, **kwargs) -> FakeMessage:
+        return await self.channel.send(content=content, **kwargs)
+
+    async def send_help(self, *args, **kwargs) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def memory_config():
+    """Build every Config on the in-memory driver for the duration of the block."""
+    original = Config.get_conf
+
+    def get_conf(
+        cls,
+        cog_instance,
+        identifier: int,
+        force_registration: bool = False,
+        cog_name: str = None,
+        allow_old: bool = False,
+    ):
+        name = cog_name or cog_instance.__class__.__name__
+        return cls(
+            cog_name=name,
+            unique_identifier=str(identifier),
+            driver=MemoryDriver(name, str(identifier)),
+            force_registration=force_registration,
+        )
+
+    Config.get_conf = classmethod(get_conf)
+    try:
+        yield
+    finally:
+        Config.get_conf = original
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ms = [s * 1000 for s in samples]
+    return {
+        "count": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "median_ms": round(statistics.median(ms), 4),
+        "p95_ms": round(
+            statistics.quantiles(ms, n=20)[18] if len(ms) > 1 else ms[0], 4
+        ),
+        "min_ms": round(min(ms), 4),
+        "max_ms": round(max(ms), 4),
+    }
+
+
+async def measure(
+    iterations: int,
+    call: Callable[[int], Awaitable[Any]],
+    before: Callable[[int], Any] = None,
+) -> Dict[str, float]:
+    samples = []
+    for i in range(iterations):
+        if before:
+            before(i)
+        start = time.perf_counter()
+        await call(i)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def seed(
+    cog: DonationLogger, guild: FakeGuild, size: int, rng: random.Random
+) -> None:
+    donators = {
+        str(member_id): rng.randint(1, 200_000_000)
+        for member_id in list(guild.members)[:size]
+    }
+    roles = {
+        str(threshold): [guild.id + position]
+        for position, threshold in enumerate(MILESTONES, 1)
+    }
+    await cog.config.guild(guild).set(
+        {
+            "managers": [],
+            "banks": {
+                BANK: {
+                    "hidden": False,
+                    "emoji": "⏣",
+                    "roles": roles,
+                    "donators": donators,
+                }
+            },
+            "log_channel": guild.log_channel.id,
+            "auto_role": True,
+            "setup": True,
+            "reconcile": {},
+        }
+    )
+
+
+async def run_size(
+    bot: FakeBot, size: int, iterations: int, rng: random.Random
+) -> List[Dict[str, Any]]:
+    guild = FakeGuild(10**17 + size, size)
+    bot.guilds[guild.id] = guild
+    cog = DonationLogger(bot)
+    await seed(cog, guild, size, rng)
+    start = time.perf_counter()
+    await cog.bank_store.load()
+    load_time = time.perf_counter() - start
+    await cog.ledger.open()
+    cog.bank_store.ledger = cog.ledger
+
+    member_ids = [m for m in guild.members if m != guild.me.id]
+    amounts = sorted(cog.bank_store.get(guild.id)[BANK]["donators"].values())
+    median_amount = amounts[len(amounts) // 2]
+
+    def context() -> FakeContext:
+        return FakeContext(bot, FakeMessage(guild.command_channel, guild.me))
+
+    def member(i: int) -> FakeMember:
+        return guild.members[member_ids[(i * 7919) % len(member_ids)]]
+
+    results: Dict[str, Dict[str, float]] = {"load": summarize([load_time])}
+    results["hybrid_add"] = await measure(
+        iterations,
+        lambda i: HYBRIDS.hybrid_add(
+            cog, context(), BANK, rng.randint(1, 5_000_000), member(i)
+        ),
+    )
+    results["hybrid_leaderboard_cold"] = await measure(
+        iterations,
+        lambda i: HYBRIDS.hybrid_leaderboard(cog, context(), BANK, 10, False),
+        before=lambda i: cog.bank_store.touch(guild.id, BANK),
+    )
+    results["hybrid_leaderboard_warm"] = await measure(
+        iterations,
+        lambda i: HYBRIDS.hybrid_leaderboard(cog, context(), BANK, 10, False),
+    )
+    results["hybrid_donationcheck_all"] = await measure(
+        iterations,
+        lambda i: HYBRIDS.hybrid_donationcheck(cog, context(), BANK, "all"),
+    )
+    results["hybrid_donationcheck_more"] = await measure(
+        iterations,
+        lambda i: HYBRIDS.hybrid_donationcheck(
+            cog, context(), BANK, "more", median_amount
+        ),
+    )
+    results["get_user_balance_bank"] = await measure(
+        iterations,
+        lambda i: cog.get_user_balance(guild, member(i).id, BANK),
+    )
+    results["get_user_balance_all"] = await measure(
+        iterations,
+        lambda i: cog.get_user_balance(guild, member(i).id),
+    )
+    results["red_delete_data_for_user"] = await measure(
+        iterations,
+        lambda i: cog.red_delete_data_for_user(
+            requester="user", user_id=member(i + iterations).id
+        ),
+    )
+
+    await cog.log_dispatcher.close()
+    await cog.ledger.close()
+    del bot.guilds[guild.id]
+    return [
+        {"size": size, "operation": operation, **stats}
+        for operation, stats in results.items()
+    ]
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    bot = FakeBot()
+    with tempfile.TemporaryDirectory() as tmp, memory_config():
+        data_manager.basic_config = {
+            "DATA_PATH": tmp,
+            "STORAGE_TYPE": "JSON",
+            "STORAGE_DETAILS": {},
+        }
+        results = []
+        for size in args.sizes:
+            print(f"Benchmarking {size} donators...", file=sys.stderr)
+            results.extend(await run_size(bot, size, args.iterations, rng))
+            # Each size gets its own ledger file.
+            for path in Path(tmp).rglob("ledger.sqlite3*"):
+                path.unlink()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "discord.py": discord.__version__,
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "results": results,
+    }
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Synthetic-load benchmarks for DonationLogger."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", type=Path, help="Write the JSON report here instead of stdout."
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    dump = json.dumps(report, indent=4)
+    if args.output:
+        args.output.write_text(dump + "\n", encoding="utf-8")
+    else:
+        print(dump)
@@ -17,7 +17,7 @@ async def check_if_setup_done(
         if isinstance(obj, commands.Context)
         else obj.client.get_cog("DonationLogger")
     )
-    return await cog.config.guild(obj.guild).setup() if obj.guild else False
+    return (await cog.get_guild_settings(obj.guild))["setup"] if obj.guild else False
 
 
 def is_setup_done():
@@ -37,14 +37,18 @@ async def check_if_is_a_dono_manager_or_higher(
         author = obj.user
         bot = obj.client
     cog: "DonationLogger" = bot.get_cog("DonationLogger")
-    managers = await cog.config.guild(obj.guild).managers()
-    return (
-        await bot.is_owner(author)
+    if (decision := cog.get_manager_decision(obj.guild.id, author.id)) is not None:
+        return decision
+    managers = (await cog.get_guild_settings(obj.guild))["managers"]
+    decision = (
+        any(role_id in managers for role_id in author._roles)
         or author.guild_permissions.manage_guild
+        or await bot.is_owner(author)
         or await mod.is_mod_or_superior(bot, author)
-        or any(role_id in author._roles for role_id in managers)
         or False
     )
+    cog.set_manager_decision(obj.guild.id, author.id, decision)
+    return decision
 
 
 def is_a_dono_manager_or_higher():
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 class AmountConverter(app_commands.Transformer):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> int:
+        return cls.parse(argument)
+
+    @staticmethod
+    def parse(argument: str) -> int:
         try:
             argument = argument.strip().replace(",", "")
             amount_dict = {
@@ -56,9 +60,8 @@ class AmountConverter(app_commands.Transformer):
                 "You need to be a donationlogger manager or higher to run this command.",
                 True,
             ]
-        context = interaction.client.get_context(interaction)
         try:
-            return await cls.convert(context, value)
+            return cls.parse(value)
         except AmountConversionFailure as e:
             return [str(e), False]
 
@@ -95,8 +98,11 @@ class MemberOrUserConverter(app_commands.Transformer):
 class BankConverter(app_commands.Transformer):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> str:
-        cog: "DonationLogger" = ctx.bot.get_cog("DonationLogger")
-        banks = await cog.config.guild(ctx.guild).banks()
+        return cls.check(ctx.bot.get_cog("DonationLogger"), ctx.guild, argument)
+
+    @staticmethod
+    def check(cog: "DonationLogger", guild: discord.Guild, argument: str) -> str:
+        banks = cog.bank_store.get(guild.id)
         if not banks.get(argument.strip().lower()):
             raise BankConversionFailure(f'Bank "{argument}" does not exist.')
         return argument.strip().lower()
@@ -115,9 +121,10 @@ class BankConverter(app_commands.Transformer):
                 True,
             ]
 
-        context = await interaction.client.get_context(interaction)
         try:
-            return await cls.convert(context, value)
+            return cls.check(
+                interaction.client.get_cog("DonationLogger"), interaction.guild, value
+            )
         except BankConversionFailure as e:
             return [str(e), False]
 
@@ -125,12 +132,9 @@ class BankConverter(app_commands.Transformer):
         self, interaction: discord.Interaction[Red], value: int | float | str
     ) -> List[app_commands.Choice[str | int | float]]:
         cog: "DonationLogger" = interaction.client.get_cog("DonationLogger")
-        banks = await cog.config.guild(interaction.guild).banks()
-        bank_list: List[str] = [
-            bank for bank, bank_info in banks.items() if not bank_info["hidden"]
-        ]
+        value = value.lower()
         return [
-            app_commands.Choice(name=choice.title(), value=choice)
-            for choice in bank_list
-            if value.lower() in choice.lower()
-        ]
+            choice
+            for choice in cog.bank_store.choices(interaction.guild.id)
+            if value in choice.value
+        ][:25]
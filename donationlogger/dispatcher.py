@@ -0,0 +1,169 @@
+import asyncio
+import discord
+
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import DonationLogger
+
+
+MAX_EMBEDS = 10
+MAX_CHARACTERS = 6000
+FLUSH_WINDOW = 2.0
+CLOSE_TIMEOUT = 10.0
+WARNING = (
+    "⚠️ Warning: `Log channel not found or I do not have permission to "
+    "send message in the log channel please report this to the admins.`"
+)
+
+
+class LogEntry:
+    __slots__ = ("channel_id", "embed", "jump_url", "fallback")
+
+    def __init__(
+        self,
+        channel_id: int,
+        embed: discord.Embed,
+        jump_url: Optional[str],
+        fallback: discord.abc.Messageable,
+    ) -> None:
+        self.channel_id = channel_id
+        self.embed = embed
+        self.jump_url = jump_url
+        self.fallback = fallback
+
+
+class LogDispatcher:
+    """
+    Per-guild queue that coalesces log-channel embeds into as few messages as possible.
+
+    A guild's queue is flushed after a short window or as soon as a message worth of embeds
+    is waiting. Entries that can not be delivered to the log channel are sent back to the
+    channel the command was used in with a warning.
+    """
+
+    def __init__(self, cog: "DonationLogger", window: float = FLUSH_WINDOW) -> None:
+        self.cog = cog
+        self.window = window
+        self._queues: Dict[int, List[LogEntry]] = {}
+        self._full: Dict[int, asyncio.Event] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._closing = False
+
+    def enqueue(self, guild: discord.Guild, entry: LogEntry) -> None:
+        if self._closing:
+            self.cog.log.warning(
+                f"Dropped a log message in guild {guild.id}, the dispatcher is closed."
+            )
+            return
+        queue = self._queues.setdefault(guild.id, [])
+        queue.append(entry)
+        event = self._full.setdefault(guild.id, asyncio.Event())
+        if len(queue) >= MAX_EMBEDS:
+            event.set()
+        task = self._tasks.get(guild.id)
+        if task is None or task.done():
+            self._tasks[guild.id] = asyncio.create_task(self._worker(guild))
+
+    async def _worker(self, guild: discord.Guild) -> None:
+        event = self._full[guild.id]
+        while self._queues.get(guild.id):
+            if not self._closing:
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=self.window)
+                except asyncio.TimeoutError:
+                    pass
+            event.clear()
+            try:
+                await self.flush(guild)
+            except Exception as e:
+                self.cog.log.exception(
+                    f"Failed to dispatch log messages in guild {guild.id}.", exc_info=e
+                )
+
+    async def flush(self, guild: discord.Guild) -> None:
+        """Send everything queued for a guild right away."""
+        while queue := self._queues.get(guild.id):
+            batch = self._take(queue)
+            if len(queue) < MAX_EMBEDS:
+                self._full[guild.id].clear()
+            await self._send(guild, batch)
+
+    async def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """
+        Stop accepting entries and let the workers send what is queued before stopping them.
+
+        Workers still running after `timeout` seconds are cancelled, anything they left queued
+        is then flushed here.
+        """
+        self._closing = True
+        for event in self._full.values():
+            event.set()
+        if tasks := [task for task in self._tasks.values() if not task.done()]:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        for guild_id in list(self._queues):
+            if guild := self.cog.bot.get_guild(guild_id):
+                try:
+                    await self.flush(guild)
+                except Exception as e:
+                    self.cog.log.exception(
+                        f"Failed to dispatch log messages in guild {guild_id}.",
+                        exc_info=e,
+                    )
+        self._queues.clear()
+        self._tasks.clear()
+
+    @staticmethod
+    def _take(queue: List[LogEntry]) -> List[LogEntry]:
+        """Pop the longest run of entries for one channel that fits in a single message."""
+        batch: List[LogEntry] = []
+        size = 0
+        while queue and len(batch) < MAX_EMBEDS:
+            entry = queue[0]
+            if batch and (
+                entry.channel_id != batch[0].channel_id
+                or size + len(entry.embed) > MAX_CHARACTERS
+            ):
+                break
+            batch.append(queue.pop(0))
+            size += len(entry.embed)
+        return batch
+
+    async def _send(self, guild: discord.Guild, batch: List[LogEntry]) -> None:
+        view = discord.ui.View()
+        for index, entry in enumerate(batch, 1):
+            if entry.jump_url:
+                view.add_item(
+                    discord.ui.Button(
+                        label=(
+                            "Jump To Command"
+                            if len(batch) == 1
+                            else f"Jump To Command #{index}"
+                        ),
+                        url=entry.jump_url,
+                    )
+                )
+        embeds = [entry.embed for entry in batch]
+        channel = guild.get_channel(batch[0].channel_id)
+        while channel:
+            try:
+                await channel.send(embeds=embeds, view=view)
+                return
+            except discord.HTTPException as e:
+                if e.status != 429:
+                    break
+                await asyncio.sleep(float(e.response.headers.get("Retry-After", 1)))
+        fallbacks: Dict[int, List[LogEntry]] = {}
+        for entry in batch:
+            fallbacks.setdefault(id(entry.fallback), []).append(entry)
+        for entries in fallbacks.values():
+            try:
+                await entries[0].fallback.send(
+                    content=WARNING, embeds=[entry.embed for entry in entries]
+                )
+            except discord.HTTPException:
+                continue
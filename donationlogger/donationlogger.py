@@ -1,10 +1,16 @@
+import asyncio
+import datetime as dt
 import discord
 import noobutils as nu
+import tempfile
+import time
 
 from redbot.core.bot import app_commands, commands, Red
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils import chat_formatting as cf, mod
 
-from typing import Dict, Literal, List, Optional, Union
+from discord.ext import tasks
+from typing import Any, Dict, Literal, List, Optional, Set, Tuple, Union
 
 from .checks import is_a_dono_manager_or_higher, is_setup_done
 from .converters import (
@@ -13,9 +19,22 @@ from .converters import (
     DLEmojiConverter,
     MemberOrUserConverter,
 )
-from .exceptions import MoreThanThreeRoles
+from .dispatcher import LogDispatcher, LogEntry
+from .exceptions import MoreThanThreeRoles, TransactionFailure
 from .hybrids import HYBRIDS
-from .utilities import verify_amount_roles
+from .ledger import DonationLedger
+from .metrics import LatencyMetrics
+from .objects import BankStore, DonationResult, Invocation, MilestoneIndex
+from .reconcile import RoleReconciler
+from .storage import SQLiteDonatorStore
+from .utilities import (
+    iter_export_lines,
+    iter_export_rows,
+    parse_donation_csv,
+    verify_amount_roles,
+    write_in_chunks,
+)
+from .views import DonatorPageSource
 
 
 DEFAULT_GUILD = {
@@ -24,7 +43,10 @@ DEFAULT_GUILD = {
     "log_channel": None,
     "auto_role": False,
     "setup": False,
+    "reconcile": {},
 }
+DEFAULT_GLOBAL = {"ledger_retention": 0, "storage": "config", "latency_stats": False}
+MANAGER_CACHE_TTL = 60
 
 
 class DonationLogger(nu.Cog):
@@ -47,7 +69,19 @@ class DonationLogger(nu.Cog):
             **kwargs,
         )
         self.config.register_guild(**DEFAULT_GUILD)
+        self.config.register_global(**DEFAULT_GLOBAL)
         self.setupcache = []
+        self.bank_store = BankStore(self.config)
+        self.ledger = DonationLedger(cog_data_path(self) / "ledger.sqlite3")
+        self.reconcilers: Dict[int, RoleReconciler] = {}
+        self.log_dispatcher = LogDispatcher(self)
+        self.settings_cache: Dict[int, Dict[str, Any]] = {}
+        self.manager_cache: Dict[int, Dict[int, Tuple[bool, float]]] = {}
+        self.metrics = LatencyMetrics()
+        self.leaderboard_cache: Dict[
+            int, Dict[Tuple[str, int, bool], Tuple[int, discord.Embed, Set[int]]]
+        ] = {}
+        self.resume_task: Optional[asyncio.Task] = None
 
     async def red_delete_data_for_user(
         self,
@@ -60,53 +94,234 @@ class DonationLogger(nu.Cog):
 
         Users can remove their data at anytime.
         """
-        for g in (await self.config.all_guilds()).keys():
-            async with self.config.guild_from_id(g).banks() as banks:
-                for bank in banks.values():
-                    try:
-                        del bank["donators"][str(user_id)]
-                    except KeyError:
-                        continue
+        for guild_id, banks in list(self.bank_store.user_banks(user_id).items()):
+            for name in list(banks):
+                self.bank_store.set_donation(guild_id, name, user_id, None)
+        await self.flush_banks()
+        await self.ledger.delete_user(user_id)
+
+    async def cog_load(self):
+        self.bot.add_dev_env_value("donationlogger", lambda _: self)
+        if await self.config.storage() == "sqlite":
+            self.bank_store.backend = await self.open_sqlite_storage()
+        await self.bank_store.load()
+        self.metrics.enabled = await self.config.latency_stats()
+        await self.ledger.open()
+        self.bank_store.ledger = self.ledger
+        self.save_banks_loop.start()
+        self.ledger_snapshot_loop.start()
+        self.resume_task = asyncio.create_task(self.resume_reconcilers())
+        self.resume_task.add_done_callback(self.resume_task_done)
+        self.log.info(
+            "DonationLogger banks loaded, save banks and ledger snapshot task started."
+        )
 
-    async def get_dc_from_bank(
-        self, context: commands.Context, bank_name: str
-    ) -> List[discord.Embed]:
-        banks = await self.config.guild(context.guild).banks()
-        bank_info = banks.get(bank_name)
+    async def cog_unload(self):
+        self.bot.remove_dev_env_value("donationlogger")
+        self.save_banks_loop.cancel()
+        self.ledger_snapshot_loop.cancel()
+        if self.resume_task:
+            self.resume_task.cancel()
+        for reconciler in self.reconcilers.values():
+            reconciler.cancel()
+        await self.log_dispatcher.close()
+        await self.flush_banks()
+        await self.ledger.close()
+        if self.bank_store.backend:
+            await self.bank_store.backend.close()
+        self.log.info("Save banks and ledger snapshot task cancelled, banks flushed.")
+
+    async def open_sqlite_storage(self) -> SQLiteDonatorStore:
+        backend = SQLiteDonatorStore(cog_data_path(self) / "donators.sqlite3")
+        await backend.open()
+        return backend
+
+    async def flush_banks(self):
+        try:
+            await self.bank_store.flush()
+        except Exception as e:
+            self.log.exception(str(e), exc_info=e)
+        try:
+            await self.ledger.flush()
+        except Exception as e:
+            self.log.exception("Failed to flush the donation ledger.", exc_info=e)
+
+    @tasks.loop(seconds=30)
+    async def save_banks_loop(self):
+        if self.bank_store.dirty or self.ledger.pending:
+            await self.flush_banks()
+
+    @tasks.loop(hours=24)
+    async def ledger_snapshot_loop(self):
+        retention = await self.config.ledger_retention()
+        for guild_id, banks in self.bank_store.all().copy().items():
+            try:
+                await self.ledger.snapshot(guild_id, banks, retention * 86400)
+            except Exception as e:
+                self.log.exception(
+                    f"Failed to snapshot the ledger for guild {guild_id}.", exc_info=e
+                )
 
-        if not bank_info or bank_info["hidden"]:
-            return []
+    @ledger_snapshot_loop.before_loop
+    async def ledger_snapshot_before_loop(self):
+        await self.bot.wait_until_red_ready()
+
+    async def get_guild_settings(self, guild: discord.Guild) -> Dict[str, Any]:
+        """Return the guild's cached managers, setup, log channel and autorole settings."""
+        if (settings := self.settings_cache.get(guild.id)) is None:
+            data = await self.config.guild(guild).all()
+            settings = self.settings_cache[guild.id] = {
+                "managers": set(data["managers"]),
+                "setup": data["setup"],
+                "log_channel": data["log_channel"],
+                "auto_role": data["auto_role"],
+            }
+        return settings
 
-        sorted_donators = sorted(
-            bank_info["donators"].items(), key=lambda x: x[1], reverse=True
+    def invalidate_guild_settings(self, guild_id: int = None):
+        """Drop cached settings and manager decisions of a guild, or of every guild."""
+        if guild_id is None:
+            self.settings_cache.clear()
+            self.manager_cache.clear()
+        else:
+            self.settings_cache.pop(guild_id, None)
+            self.manager_cache.pop(guild_id, None)
+
+    def get_manager_decision(self, guild_id: int, member_id: int) -> Optional[bool]:
+        cached = self.manager_cache.get(guild_id, {}).get(member_id)
+        if cached is None or cached[1] < time.monotonic():
+            return None
+        return cached[0]
+
+    def set_manager_decision(self, guild_id: int, member_id: int, decision: bool):
+        self.manager_cache.setdefault(guild_id, {})[member_id] = (
+            decision,
+            time.monotonic() + MANAGER_CACHE_TTL,
         )
 
-        final = []
-        for index, (k, v) in enumerate(sorted_donators, 1):
-            member = context.guild.get_member(int(k))
-            e = "➡️ " if member == context.author else ""
-            final.append(
-                f"{e}{index}. {member.mention} (`{member.id}`): **{cf.humanize_number(v)}**\n"
-                if member
-                else f"{index}. [Member not found in guild] (`{k}`): **{cf.humanize_number(v)}**\n"
-            )
+    @commands.Cog.listener("on_member_update")
+    async def manager_cache_listener(
+        self, before: discord.Member, after: discord.Member
+    ):
+        if before._roles != after._roles:
+            self.manager_cache.get(after.guild.id, {}).pop(after.id, None)
+
+    def get_cached_leaderboard(
+        self, guild_id: int, bank_name: str, top: int, show_left_users: bool
+    ) -> Optional[discord.Embed]:
+        """Return the rendered leaderboard embed if the bank has not changed since."""
+        key = (bank_name, top, show_left_users)
+        cached = self.leaderboard_cache.get(guild_id, {}).get(key)
+        if cached is None:
+            return None
+        if cached[0] != self.bank_store.revision(guild_id, bank_name):
+            del self.leaderboard_cache[guild_id][key]
+            return None
+        return cached[1]
+
+    def cache_leaderboard(
+        self,
+        guild_id: int,
+        bank_name: str,
+        top: int,
+        show_left_users: bool,
+        embed: discord.Embed,
+        member_ids: Set[int],
+    ):
+        self.leaderboard_cache.setdefault(guild_id, {})[
+            (bank_name, top, show_left_users)
+        ] = (self.bank_store.revision(guild_id, bank_name), embed, member_ids)
+
+    def drop_cached_leaderboards(self, guild_id: int, member_id: int, banks: Set[str]):
+        """Drop cached leaderboards that show the member or may need to show them again."""
+        cache = self.leaderboard_cache.get(guild_id)
+        if not cache:
+            return
+        for key, (_, _, member_ids) in list(cache.items()):
+            if member_id in member_ids or key[0] in banks:
+                del cache[key]
+
+    @commands.Cog.listener("on_member_remove")
+    async def leaderboard_cache_remove_listener(self, member: discord.Member):
+        self.drop_cached_leaderboards(member.guild.id, member.id, set())
+
+    @commands.Cog.listener("on_member_join")
+    async def leaderboard_cache_join_listener(self, member: discord.Member):
+        self.drop_cached_leaderboards(
+            member.guild.id,
+            member.id,
+            set(self.bank_store.member_banks(member.guild.id, member.id)),
+        )
 
-        return await nu.pagify_this(
-            "\n".join(final),
-            "\n",
-            "".join([f"{context.guild.name}", " | Page ({index}/{pages})"]),
-            embed_title=f"All of the donors for [{bank_name.title()}]",
-            embed_colour=await context.embed_colour(),
-            footer_icon=nu.is_have_avatar(context.guild),
+    async def resume_reconcilers(self):
+        await self.bot.wait_until_red_ready()
+        for guild_id, data in (await self.config.all_guilds()).items():
+            if not data["reconcile"] or not (guild := self.bot.get_guild(guild_id)):
+                continue
+            self.reconcilers[guild_id] = RoleReconciler(self, guild, data["reconcile"])
+            self.reconcilers[guild_id].start()
+            self.log.info(f"Resumed amount-role reconciliation in guild {guild_id}.")
+
+    def resume_task_done(self, task: asyncio.Task):
+        if not task.cancelled() and (e := task.exception()):
+            self.log.error("Failed to resume amount-role reconciliation.", exc_info=e)
+
+    async def start_reconciler(
+        self, guild: discord.Guild, bank_name: str, author_id: int
+    ) -> RoleReconciler:
+        """Start reconciling a bank's amount-roles, replacing any job running in the guild."""
+        if old := self.reconcilers.pop(guild.id, None):
+            old.cancel()
+        reconciler = RoleReconciler.new(self, guild, bank_name, author_id)
+        await reconciler.save()
+        self.reconcilers[guild.id] = reconciler
+        reconciler.start()
+        return reconciler
+
+    async def cancel_reconciler(self, guild: discord.Guild) -> bool:
+        if not (reconciler := self.reconcilers.pop(guild.id, None)):
+            return False
+        reconciler.cancel()
+        await self.config.guild(guild).reconcile.clear()
+        return True
+
+    async def reconcile_after_amountroles_change(
+        self, context: commands.Context, bank_name: str
+    ):
+        if not (await self.get_guild_settings(context.guild))["auto_role"]:
+            return
+        if not self.bank_store.get(context.guild.id)[bank_name]["donators"]:
+            return
+        await self.start_reconciler(context.guild, bank_name, context.author.id)
+        await context.send(
+            content="Updating existing donators' amount-roles in the background, see "
+            f"`{context.prefix}dlset bank amountroles reconcilestatus`."
+        )
+
+    async def get_dc_from_bank(
+        self, context: Invocation, bank_name: str
+    ) -> Optional[DonatorPageSource]:
+        bank_info = self.bank_store.get(context.guild.id).get(bank_name)
+
+        if not bank_info or bank_info["hidden"]:
+            return None
+
+        return DonatorPageSource(
+            context.guild,
+            self.bank_store.index(context.guild.id, bank_name),
+            title=f"All of the donors for [{bank_name.title()}]",
+            colour=await context.embed_colour(),
+            viewer_id=context.author.id,
         )
 
     async def get_user_balance(
         self, guild: discord.Guild, user_id: int, bank_name: str = None
     ) -> discord.Embed:
-        banks = await self.config.guild(guild).banks()
+        banks = self.bank_store.get(guild.id)
+        balances = self.bank_store.member_banks(guild.id, user_id)
         if bank_name:
             bank = banks[bank_name.lower()]
-            donations = bank["donators"].get(str(user_id))
+            donations = balances.get(bank_name.lower())
             embed = discord.Embed(
                 title=f"[Member not found in guild] ({user_id})",
                 timestamp=discord.utils.utcnow(),
@@ -120,15 +335,7 @@ class DonationLogger(nu.Cog):
                 embed.description = "This uesr has no data in this guild."
             return embed
 
-        _dict: Dict[str, Dict[str, Union[str, int]]] = {}
-        for k, v in banks.items():
-            if v["hidden"]:
-                continue
-            donos = v["donators"].get(str(user_id), 0)
-            _dict[k] = {"donations": donos, "emoji": v["emoji"]}
-
-        new_dict = dict(filter(lambda x: x[1]["donations"], _dict.items()))
-        if not new_dict:
+        if not any(amount and not banks[k]["hidden"] for k, amount in balances.items()):
             return discord.Embed(
                 title=f"[Member not found in guild] ({user_id})",
                 description="This user has no data in this guild.",
@@ -136,13 +343,12 @@ class DonationLogger(nu.Cog):
             )
 
         final: Dict[str, str] = {}
-        final_overall = []
-        for key, value in _dict.items():
-            donos = value["donations"]
-            final[key] = f"{value['emoji']} {cf.humanize_number(donos)}"
-            final_overall.append(donos)
+        for k, v in banks.items():
+            if v["hidden"]:
+                continue
+            final[k] = f"{v['emoji']} {cf.humanize_number(balances.get(k, 0))}"
 
-        overall = sum(final_overall)
+        overall = self.bank_store.member_total(guild.id, user_id)
         embed = discord.Embed(
             description=f"Overall combined bank donation amount: {cf.humanize_number(overall)}",
             timestamp=discord.utils.utcnow(),
@@ -165,16 +371,13 @@ class DonationLogger(nu.Cog):
         self, guild: discord.Guild, member: discord.Member
     ) -> discord.Embed:
         final: Dict[str, str] = {}
-        final_overall = []
-        async with self.config.guild(guild).banks() as banks:
-            for k, v in banks.items():
-                if v["hidden"]:
-                    continue
-                donations = v["donators"].get(str(member.id), 0)
-                final[k] = f"{v['emoji']} {cf.humanize_number(donations)}"
-                final_overall.append(donations)
-
-        overall = sum(final_overall)
+        balances = self.bank_store.member_banks(guild.id, member.id)
+        for k, v in self.bank_store.get(guild.id).items():
+            if v["hidden"]:
+                continue
+            final[k] = f"{v['emoji']} {cf.humanize_number(balances.get(k, 0))}"
+
+        overall = self.bank_store.member_total(guild.id, member.id)
         embed = discord.Embed(
             description=f"Overall combined bank donation amount: {cf.humanize_number(overall)}",
             timestamp=discord.utils.utcnow(),
@@ -198,14 +401,22 @@ class DonationLogger(nu.Cog):
 
     async def update_dono_roles(
         self,
-        context: commands.Context,
+        context: Invocation,
         d_type: str,
-        donated_amount: int,
+        previous: int,
+        updated: int,
         member: discord.Member,
-        roles: Dict[str, List[int]],
+        milestones: MilestoneIndex,
     ) -> List[discord.Role]:
-        if not await self.config.guild(context.guild).auto_role():
+        if not (await self.get_guild_settings(context.guild))["auto_role"]:
             return []
+        roles_to_modify = self.get_dono_role_changes(
+            context.guild, d_type, previous, updated, member, milestones
+        )
+
+        if not roles_to_modify:
+            return []
+
         audit_reason = mod.get_audit_reason(
             author=context.author,
             reason=(
@@ -218,33 +429,91 @@ class DonationLogger(nu.Cog):
             ),
         )
         action = member.add_roles if d_type == "add" else member.remove_roles
-        roles_to_modify: List[discord.Role] = []
-        for k, v in roles.items():
-            for r in v:
-                role = context.guild.get_role(r)
-                if role and (
-                    (
-                        d_type == "add"
-                        and donated_amount >= int(k)
-                        and role not in member.roles
-                    )
-                    or (
-                        d_type == "remove"
-                        and donated_amount < int(k)
-                        and role in member.roles
-                    )
-                ):
-                    roles_to_modify.append(role)
+        await action(*roles_to_modify, reason=audit_reason)
+        return roles_to_modify
 
-        if not roles_to_modify:
+    @staticmethod
+    def get_dono_role_changes(
+        guild: discord.Guild,
+        d_type: str,
+        previous: int,
+        updated: int,
+        member: discord.Member,
+        milestones: MilestoneIndex,
+    ) -> List[discord.Role]:
+        """Return the milestone roles crossed between two balances that the member needs changed."""
+        if updated == previous or (d_type == "add") != (updated > previous):
             return []
-
-        await action(*roles_to_modify, reason=audit_reason)
+        roles_to_modify: List[discord.Role] = []
+        for role_id in milestones.crossed(previous, updated):
+            if (member.get_role(role_id) is None) != (d_type == "add"):
+                continue
+            role = guild.get_role(role_id)
+            if role and role not in roles_to_modify:
+                roles_to_modify.append(role)
         return roles_to_modify
 
+    async def update_bulk_dono_roles(
+        self, context: Invocation, results: List[DonationResult]
+    ) -> Dict[int, Tuple[List[discord.Role], List[discord.Role]]]:
+        """
+        Apply the net donation role changes of a bulk transaction once per member.
+
+        Returns `{member_id: (added_roles, removed_roles)}`.
+        """
+        if not (await self.get_guild_settings(context.guild))["auto_role"]:
+            return {}
+        first: Dict[Tuple[int, str], int] = {}
+        final: Dict[Tuple[int, str], DonationResult] = {}
+        for result in results:
+            first.setdefault((result.member_id, result.bank_name), result.previous)
+            final[(result.member_id, result.bank_name)] = result
+        per_member: Dict[int, Tuple[List[discord.Role], List[discord.Role]]] = {}
+        for (member_id, bank_name), result in final.items():
+            member = context.guild.get_member(member_id)
+            if not member:
+                continue
+            to_add, to_remove = per_member.setdefault(member_id, ([], []))
+            for d_type, bucket in (("add", to_add), ("remove", to_remove)):
+                for role in self.get_dono_role_changes(
+                    context.guild,
+                    d_type,
+                    first[(member_id, bank_name)],
+                    result.updated,
+                    member,
+                    result.milestones,
+                ):
+                    if role not in bucket:
+                        bucket.append(role)
+        changes = {}
+        for member_id, (to_add, to_remove) in per_member.items():
+            # A role earned on one bank is kept even if another bank no longer qualifies.
+            to_remove = [role for role in to_remove if role not in to_add]
+            if not to_add and not to_remove:
+                continue
+            member = context.guild.get_member(member_id)
+            if to_add:
+                await member.add_roles(
+                    *to_add,
+                    reason=mod.get_audit_reason(
+                        author=context.author,
+                        reason="Automatically added donation roles after a bulk donation import.",
+                    ),
+                )
+            if to_remove:
+                await member.remove_roles(
+                    *to_remove,
+                    reason=mod.get_audit_reason(
+                        author=context.author,
+                        reason="Automatically removed donation roles after a bulk donation import.",
+                    ),
+                )
+            changes[member_id] = (to_add, to_remove)
+        return changes
+
     async def send_to_log_channel(
         self,
-        context: commands.Context,
+        context: Invocation,
         d_type: str,
         bank_name: str,
         emoji: str,
@@ -255,12 +524,10 @@ class DonationLogger(nu.Cog):
         roles: str = None,
         note: str = None,
     ):
-        logchan = await self.config.guild(context.guild).log_channel()
-        if not logchan:
+        settings = await self.get_guild_settings(context.guild)
+        if not (logchan := settings["log_channel"]):
             return
 
-        channel = context.guild.get_channel(logchan)
-
         actions = {
             "add": ("was added to", "Roles Added:", "**__Donation Added!__**"),
             "remove": (
@@ -311,25 +578,138 @@ class DonationLogger(nu.Cog):
 
         if roles:
             embed.add_field(name=ra, value=roles, inline=False)
-        elif not await self.config.guild(context.guild).auto_role():
+        elif not settings["auto_role"]:
             embed.add_field(
                 name=ra,
-                value=f"> Autorole is currently disabled. `{context.prefix}dlset autorole`",
+                value=f"> Autorole is currently disabled. `{await context.get_prefix()}dlset autorole`",
                 inline=False,
             )
 
-        view = discord.ui.View().add_item(
-            discord.ui.Button(label="Jump To Command", url=context.message.jump_url)
+        self.log_dispatcher.enqueue(
+            context.guild,
+            LogEntry(logchan, embed, context.jump_url, context.channel),
         )
 
-        try:
-            await channel.send(embed=embed, view=view)
-        except Exception:
-            await context.send(
-                content="⚠️ Warning: `Log channel not found or I do not have permission to "
-                "send message in the log channel please report this to the admins.`",
-                embed=embed,
-                view=view,
+    async def apply_donation(
+        self,
+        context: Union[commands.Context, discord.Interaction[Red], Invocation],
+        d_type: Literal["add", "remove", "set"],
+        bank_name: str,
+        amount: int,
+        member: discord.Member,
+        note: str = None,
+        *,
+        update_roles: bool = True,
+        log: bool = True,
+    ) -> DonationResult:
+        """
+        Mutate a member's bank balance from another cog without invoking a command.
+
+        Nothing is sent to the invoking channel, callers reply however they see fit.
+        Donation roles and the log channel entry are handled unless turned off.
+        Raises `TransactionFailure` when the guild is not set up, the bank does not exist
+        or the mutation is rejected.
+        """
+        ctx = context if isinstance(context, Invocation) else Invocation(context)
+        bank_name = bank_name.lower()
+        if not (await self.get_guild_settings(ctx.guild))["setup"]:
+            raise TransactionFailure(
+                "DonationLogger has not been setup in this guild yet."
+            )
+        if bank_name not in self.bank_store.get(ctx.guild.id):
+            raise TransactionFailure(f'Bank "{bank_name}" does not exist.')
+        result = await self.bank_store.transact(
+            ctx.guild.id,
+            bank_name,
+            member.id,
+            d_type,
+            amount,
+            ctx.author.id,
+            note,
+        )
+        if update_roles:
+            for action in ("add", "remove") if d_type == "set" else (d_type,):
+                result.roles += await self.update_dono_roles(
+                    ctx,
+                    action,
+                    result.previous,
+                    result.updated,
+                    member,
+                    result.milestones,
+                )
+        if log:
+            await self.send_to_log_channel(
+                ctx,
+                d_type,
+                bank_name,
+                result.emoji,
+                result.amount,
+                result.previous,
+                result.updated,
+                member,
+                cf.humanize_list([role.mention for role in result.roles]),
+                note,
+            )
+        return result
+
+    async def send_bulk_to_log_channel(
+        self,
+        context: Invocation,
+        results: List[DonationResult],
+        role_changes: Dict[int, Tuple[List[discord.Role], List[discord.Role]]],
+        note: str = None,
+    ):
+        settings = await self.get_guild_settings(context.guild)
+        if not (logchan := settings["log_channel"]):
+            return
+
+        lines = []
+        for result in results:
+            member = context.guild.get_member(result.member_id)
+            name = member.display_name if member else result.member_id
+            lines.append(
+                f"`{result.d_type.title()}` {result.emoji} {cf.humanize_number(result.amount)} "
+                f"**{name}** on **{result.bank_name.title()}** "
+                f"({cf.humanize_number(result.previous)} ➡️ {cf.humanize_number(result.updated)})"
+            )
+        for member_id, (added, removed) in role_changes.items():
+            if added:
+                lines.append(
+                    f"<@{member_id}> roles added: "
+                    + cf.humanize_list([role.mention for role in added])
+                )
+            if removed:
+                lines.append(
+                    f"<@{member_id}> roles removed: "
+                    + cf.humanize_list([role.mention for role in removed])
+                )
+
+        colour = await context.embed_colour()
+        embeds = []
+        for page in cf.pagify("\n".join(lines), page_length=1900):
+            embed = discord.Embed(
+                title="**__Bulk Donations Logged!__**",
+                description=page,
+                colour=colour,
+                timestamp=discord.utils.utcnow(),
+            )
+            embed.set_footer(
+                text=f"Authorized by: {context.author} ({context.author.id})",
+                icon_url=nu.is_have_avatar(context.author),
+            )
+            embeds.append(embed)
+        embeds[0].add_field(name="Rows:", value=cf.humanize_number(len(results)))
+        embeds[0].add_field(
+            name="Members:",
+            value=cf.humanize_number(len({r.member_id for r in results})),
+        )
+        if note:
+            embeds[0].add_field(name="Note:", value=note, inline=False)
+
+        for index, embed in enumerate(embeds):
+            jump_url = None if index else context.jump_url
+            self.log_dispatcher.enqueue(
+                context.guild, LogEntry(logchan, embed, jump_url, context.channel)
             )
 
     @commands.group(name="donationlogger", aliases=["d", "dl", "dono", "donolog"])
@@ -355,7 +735,16 @@ class DonationLogger(nu.Cog):
         await view.wait()
 
         if view.value:
+            for reconciler in self.reconcilers.values():
+                reconciler.cancel()
+            self.reconcilers.clear()
+            self.bank_store.clear()
+            self.leaderboard_cache.clear()
+            if self.bank_store.backend:
+                await self.bank_store.backend.delete_guild()
+            await self.ledger.delete_guild()
             await self.config.clear_all_guilds()
+            self.invalidate_guild_settings()
 
     @donationlogger.command(name="setup")
     @commands.admin_or_permissions(manage_guild=True)
@@ -518,6 +907,197 @@ class DonationLogger(nu.Cog):
 
         await HYBRIDS.hybrid_set(self, context, bank_name, amount, member)
 
+    @donationlogger.command(name="bulk")
+    @is_setup_done()
+    @is_a_dono_manager_or_higher()
+    async def donationlogger_bulk(
+        self, context: commands.Context, *, note: Optional[str] = None
+    ):
+        """
+        Add, remove or set many donations at once from an attached CSV file.
+
+        Each row should be `member,bank,amount[,type]` where member is a mention, ID or name and type is `add`, `remove` or `set`. (defaults to `add`)
+        Every row is applied in a single transaction, if any row fails nothing is applied.
+        """
+        if not context.message.attachments:
+            return await context.send(content="Attach a CSV file to import.")
+        attachment = context.message.attachments[0]
+        if not attachment.filename.lower().endswith(".csv"):
+            return await context.send(
+                content="The attached file must be a `.csv` file."
+            )
+        if attachment.size > 1024 * 1024:
+            return await context.send(content="The CSV file must be at most 1 MB.")
+        if note and len(note) > 1024:
+            return await context.send(
+                content="Limit your note into 1024 characters due to embed field limits."
+            )
+
+        progress = await context.send(content="Reading the CSV file...")
+        try:
+            content = (await attachment.read()).decode("utf-8-sig")
+        except (discord.HTTPException, UnicodeDecodeError):
+            return await progress.edit(content="I could not read that CSV file.")
+        banks = self.bank_store.get(context.guild.id)
+        with self.metrics.phase("bulk", "parse"):
+            rows, errors = await parse_donation_csv(context, banks, content)
+        if errors:
+            return await progress.edit(
+                content=cf.box(
+                    "\n".join(errors[:20])
+                    + (f"\n...and {len(errors) - 20} more." if len(errors) > 20 else "")
+                )
+                + "\nNothing was applied."
+            )
+        if not rows:
+            return await progress.edit(content="The CSV file has no donation rows.")
+
+        await progress.edit(
+            content=f"Applying {cf.humanize_number(len(rows))} donation rows..."
+        )
+        try:
+            with self.metrics.phase("bulk", "mutation"):
+                results = await self.bank_store.transact_many(
+                    context.guild.id, rows, context.author.id, note
+                )
+        except TransactionFailure as e:
+            errors = str(e).split("\n")
+            return await progress.edit(
+                content=cf.box(
+                    "\n".join(errors[:20])
+                    + (f"\n...and {len(errors) - 20} more." if len(errors) > 20 else "")
+                )
+                + "\nNothing was applied."
+            )
+
+        await progress.edit(
+            content=f"Applied {cf.humanize_number(len(results))} donation rows, "
+            "updating donation roles..."
+        )
+        invocation = Invocation(context)
+        with self.metrics.phase("bulk", "roles"):
+            role_changes = await self.update_bulk_dono_roles(invocation, results)
+        with self.metrics.phase("bulk", "log"):
+            await self.send_bulk_to_log_channel(invocation, results, role_changes, note)
+        await progress.edit(
+            content=f"Done. Applied **{cf.humanize_number(len(results))}** donation rows "
+            f"for **{cf.humanize_number(len({r.member_id for r in results}))}** members and "
+            f"updated donation roles of **{cf.humanize_number(len(role_changes))}** members."
+        )
+
+    @donationlogger.command(name="history")
+    @is_setup_done()
+    @is_a_dono_manager_or_higher()
+    async def donationlogger_history(
+        self,
+        context: commands.Context,
+        member: Optional[MemberOrUserConverter] = None,
+        bank_name: BankConverter = None,
+    ):
+        """
+        See the donation ledger of a member.
+
+        Shows every add, remove, set and reset with the entry ID to use for `[p]dono revert`.
+        """
+        if not member:
+            member = context.author
+        entries = await self.ledger.member_history(
+            context.guild.id, member.id, bank_name
+        )
+        banks = self.bank_store.get(context.guild.id)
+        final = []
+        for entry in entries:
+            emoji = banks.get(entry.bank, {}).get("emoji", "")
+            updated = (
+                "None" if entry.updated is None else cf.humanize_number(entry.updated)
+            )
+            final.append(
+                f"`#{entry.id}` <t:{entry.ts}:f> **{entry.action.title()}** {emoji} "
+                f"{cf.humanize_number(entry.amount)} on **{entry.bank.title()}** "
+                f"({cf.humanize_number(entry.previous)} ➡️ {updated})"
+                + (f" by <@{entry.author_id}>" if entry.author_id else "")
+                + (f"\n> {entry.note}" if entry.note else "")
+            )
+        pages = await nu.pagify_this(
+            "\n".join(final or ["This member has no donation ledger entries."]),
+            "\n",
+            "Page ({index}/{pages})",
+            embed_title=f"Donation ledger of {member} ({member.id})",
+            embed_colour=await context.embed_colour(),
+        )
+        await nu.NoobPaginator(pages).start(context)
+
+    @donationlogger.command(name="recent")
+    @is_setup_done()
+    async def donationlogger_recent(
+        self,
+        context: commands.Context,
+        bank_name: BankConverter,
+        days: Optional[int] = 7,
+        top: Optional[int] = 10,
+    ):
+        """
+        See who has donated the most from a bank in the last few days.
+
+        **days**: How many days to look back. (max 365)
+        **top**: The top number to show. (max 25)
+        """
+        if days > 365 or days < 1:
+            return await context.send(content="Days must be between 1-365.")
+        if top > 25 or top < 1:
+            return await context.send(content="Top number must be between 1-25.")
+        bank = self.bank_store.get(context.guild.id)[bank_name]
+        if bank["hidden"]:
+            return await context.send(content="This bank is hidden.")
+        since = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=days)
+        donors = await self.ledger.top_in_window(
+            context.guild.id, bank_name, round(since.timestamp()), top
+        )
+        embed = discord.Embed(
+            title=f"Top {top} donators for [{bank_name.title()}] in the last {days} day(s)",
+            colour=await context.embed_colour(),
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.set_footer(text=context.guild.name)
+        embed.set_thumbnail(url=nu.is_have_avatar(context.guild))
+        if not donors:
+            embed.description = "It seems no one has donated from this bank lately."
+        for index, (member_id, amount) in enumerate(donors, 1):
+            member = context.guild.get_member(member_id)
+            embed.add_field(
+                name=f"{index}. {member.name if member else f'[Member not found in guild] ({member_id})'}",
+                value=f"{bank['emoji']} {cf.humanize_number(amount)}",
+                inline=False,
+            )
+        await context.send(embed=embed)
+
+    @donationlogger.command(name="revert")
+    @is_setup_done()
+    @is_a_dono_manager_or_higher()
+    async def donationlogger_revert(self, context: commands.Context, entry_id: int):
+        """
+        Revert a donation ledger entry.
+
+        Sets the member's balance back to what it was before that entry.
+        See `[p]dono history` for the entry IDs.
+        """
+        entry = await self.ledger.get_entry(context.guild.id, entry_id)
+        if not entry or entry.action == "resetbank":
+            return await context.send(content="That ledger entry can not be reverted.")
+        if entry.bank not in self.bank_store.get(context.guild.id):
+            return await context.send(content="That bank no longer exists.")
+        member = context.guild.get_member(entry.member_id)
+        if not member:
+            return await context.send(content="That member is no longer in this guild.")
+        await HYBRIDS.hybrid_set(
+            self,
+            context,
+            entry.bank,
+            entry.previous,
+            member,
+            f"Reverted ledger entry `#{entry.id}`.",
+        )
+
     @commands.group(
         name="donationloggerset", aliases=["dlset", "donologset", "donoset"]
     )
@@ -554,7 +1134,7 @@ class DonationLogger(nu.Cog):
         `[p]donoset bank multi set dank 2.0`
         """
         if add_or_remove_or_list == "list":
-            banks = await self.config.guild(context.guild).banks()
+            banks = self.bank_store.get(context.guild.id)
             desc = [
                 f"{k}: **x{v['multi']}**" for k, v in banks.items() if v.get("multi")
             ]
@@ -586,8 +1166,8 @@ class DonationLogger(nu.Cog):
             else:
                 await context.send(content="The multi for that bank has been removed.")
 
-            async with self.config.guild(context.guild).banks() as banks:
-                banks[bank_name]["multi"] = multiplier
+            self.bank_store.get(context.guild.id)[bank_name]["multi"] = multiplier
+            self.bank_store.mark_dirty(context.guild.id)
 
     @donationloggerset_bank.command(name="add")
     async def donationloggerset_bank_add(
@@ -600,21 +1180,23 @@ class DonationLogger(nu.Cog):
         """
         Add a new bank.
         """
-        async with self.config.guild(context.guild).banks() as banks:
-            if len(banks) > 25:
-                return await context.send(
-                    content="You can only have a maximum of 25 banks per guild."
-                )
-            if bank_name in banks:
-                return await context.send(content="This bank already exists.")
-            banks |= {
-                bank_name.lower(): {
-                    "hidden": hidden,
-                    "emoji": str(emoji),
-                    "roles": {},
-                    "donators": {},
-                }
+        banks = self.bank_store.get(context.guild.id)
+        if len(banks) > 25:
+            return await context.send(
+                content="You can only have a maximum of 25 banks per guild."
+            )
+        if bank_name in banks:
+            return await context.send(content="This bank already exists.")
+        banks |= {
+            bank_name.lower(): {
+                "hidden": hidden,
+                "emoji": str(emoji),
+                "roles": {},
+                "donators": {},
             }
+        }
+        self.bank_store.invalidate(context.guild.id, bank_name.lower())
+        self.bank_store.mark_dirty(context.guild.id)
         await context.send(
             content=f"Added {bank_name} with the emoji {str(emoji)} to the banks list."
         )
@@ -626,13 +1208,14 @@ class DonationLogger(nu.Cog):
         """
         Remove a bank.
         """
-
-        async with self.config.guild(context.guild).banks() as banks:
-            if len(list(banks.keys())) == 1:
-                return await context.send(
-                    content="This bank is the guild's only bank, you can not remove it."
-                )
-            del banks[bank_name]
+        banks = self.bank_store.get(context.guild.id)
+        if len(list(banks.keys())) == 1:
+            return await context.send(
+                content="This bank is the guild's only bank, you can not remove it."
+            )
+        self.bank_store.reset_donators(context.guild.id, bank_name, context.author.id)
+        del banks[bank_name]
+        self.bank_store.invalidate(context.guild.id, bank_name)
         await context.send(content="That bank is deleted.")
 
     @donationloggerset_bank.command(name="list")
@@ -640,7 +1223,7 @@ class DonationLogger(nu.Cog):
         """
         See the list of registered banks.
         """
-        all_banks = await self.config.guild(context.guild).banks()
+        all_banks = self.bank_store.get(context.guild.id)
         banks = {k: v for k, v in all_banks.items() if not v["hidden"]}
         enumerated_banks = [
             f"{index}. {v['emoji']} {k.title()}"
@@ -683,10 +1266,12 @@ class DonationLogger(nu.Cog):
                     content="Those do not seem to be valid roles or invalid amount."
                 )
 
-            async with self.config.guild(context.guild).banks() as banks:
-                banks[bank_name]["roles"] |= {
-                    k: [r.id for r in v] for k, v in arole.items()
-                }
+            roles = self.bank_store.get(context.guild.id)[bank_name]["roles"]
+            self.bank_store.set_roles(
+                context.guild.id,
+                bank_name,
+                roles | {k: [r.id for r in v] for k, v in arole.items()},
+            )
 
             embed = discord.Embed(
                 title="Amount roles has been set.",
@@ -700,6 +1285,7 @@ class DonationLogger(nu.Cog):
                 timestamp=discord.utils.utcnow(),
             )
             await context.send(embed=embed)
+            await self.reconcile_after_amountroles_change(context, bank_name)
         except MoreThanThreeRoles:
             return await context.send(
                 content="The maximum roles you can assign to an amount should be no more than 3."
@@ -715,12 +1301,14 @@ class DonationLogger(nu.Cog):
         """
         Remove an amount from the roles milestone.
         """
-        async with self.config.guild(context.guild).banks() as banks:
-            try:
-                del banks[bank_name]["roles"][str(amount)]
-                await context.send(content="That amount has been removed.")
-            except KeyError:
-                await context.send(content="You haven't registered that amount yet.")
+        roles = dict(self.bank_store.get(context.guild.id)[bank_name]["roles"])
+        try:
+            del roles[str(amount)]
+        except KeyError:
+            return await context.send(content="You haven't registered that amount yet.")
+        self.bank_store.set_roles(context.guild.id, bank_name, roles)
+        await context.send(content="That amount has been removed.")
+        await self.reconcile_after_amountroles_change(context, bank_name)
 
     @donationloggerset_bank_amountroles.command(name="list")
     async def donationloggerset_bank_amountroles_list(
@@ -729,7 +1317,7 @@ class DonationLogger(nu.Cog):
         """
         See the list of amountroles on a bank.
         """
-        banks = await self.config.guild(context.guild).banks()
+        banks = self.bank_store.get(context.guild.id)
         aroles = banks[bank_name]["roles"]
         sorted_aroles = dict(sorted(aroles.items(), key=lambda j: int(j[0])))
         aroles2 = [
@@ -745,6 +1333,78 @@ class DonationLogger(nu.Cog):
         )
         await context.send(embed=embed)
 
+    @donationloggerset_bank_amountroles.command(name="reconcile")
+    async def donationloggerset_bank_amountroles_reconcile(
+        self, context: commands.Context, bank_name: BankConverter
+    ):
+        """
+        Update every existing donator's amount-roles of a bank to match their balance.
+
+        Runs in the background and resumes after a cog reload.
+        Only one reconciliation can run per guild, starting a new one replaces the old one.
+        """
+        if not context.guild.me.guild_permissions.manage_roles:
+            return await context.send(
+                content='I require the "Manage Roles" permission to reconcile roles.'
+            )
+        reconciler = await self.start_reconciler(
+            context.guild, bank_name, context.author.id
+        )
+        await context.send(
+            content=f"Reconciling amount-roles of **{reconciler.state['total']}** donator(s) "
+            f"on **{bank_name.title()}**, see `{context.prefix}dlset bank amountroles "
+            "reconcilestatus`."
+        )
+
+    @donationloggerset_bank_amountroles.command(name="reconcilestatus")
+    async def donationloggerset_bank_amountroles_reconcilestatus(
+        self, context: commands.Context
+    ):
+        """
+        See the status of the running amount-role reconciliation.
+        """
+        reconciler = self.reconcilers.get(context.guild.id)
+        if not reconciler:
+            return await context.send(
+                content="There is no amount-role reconciliation running."
+            )
+        state = reconciler.state
+        eta = reconciler.eta
+        embed = discord.Embed(
+            title=f"Amount-role reconciliation for [{state['bank'].title()}]",
+            colour=await context.embed_colour(),
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.add_field(
+            name="Progress:",
+            value=f"{cf.humanize_number(state['done'])}/{cf.humanize_number(state['total'])}",
+        )
+        embed.add_field(name="Updated:", value=cf.humanize_number(state["changed"]))
+        embed.add_field(name="Failed:", value=cf.humanize_number(state["failed"]))
+        embed.add_field(name="Started:", value=f"<t:{state['started']}:R>")
+        embed.add_field(
+            name="ETA:",
+            value=(
+                f"<t:{round(dt.datetime.now(dt.timezone.utc).timestamp() + eta)}:R>"
+                if eta is not None
+                else "Calculating..."
+            ),
+        )
+        await context.send(embed=embed)
+
+    @donationloggerset_bank_amountroles.command(name="reconcilecancel")
+    async def donationloggerset_bank_amountroles_reconcilecancel(
+        self, context: commands.Context
+    ):
+        """
+        Cancel the running amount-role reconciliation.
+        """
+        if not await self.cancel_reconciler(context.guild):
+            return await context.send(
+                content="There is no amount-role reconciliation running."
+            )
+        await context.send(content="Amount-role reconciliation cancelled.")
+
     @donationloggerset_bank.command(name="resetbank")
     async def donationloggerset_bank_resetbank(
         self,
@@ -755,14 +1415,13 @@ class DonationLogger(nu.Cog):
         """
         Reset a banks donations or amountroles.
         """
-        async with self.config.guild(context.guild).banks() as banks:
-            if roles_or_donators == "amountroles":
-                banks[bank_name]["roles"] = {}
-            elif roles_or_donators == "donators":
-                banks[bank_name]["donators"] = {}
-            else:
-                banks[bank_name]["roles"] = {}
-                banks[bank_name]["donators"] = {}
+        if roles_or_donators in ["amountroles", "both"]:
+            self.bank_store.set_roles(context.guild.id, bank_name, {})
+        if roles_or_donators in ["donators", "both"]:
+            self.bank_store.reset_donators(
+                context.guild.id, bank_name, context.author.id
+            )
+        self.bank_store.mark_dirty(context.guild.id)
         _type = (
             roles_or_donators
             if roles_or_donators == "amountroles"
@@ -784,10 +1443,55 @@ class DonationLogger(nu.Cog):
         """
         Change a bank's emoji.
         """
-        async with self.config.guild(context.guild).banks() as banks:
-            banks[bank_name]["emoji"] = str(emoji)
+        self.bank_store.get(context.guild.id)[bank_name]["emoji"] = str(emoji)
+        self.bank_store.touch(context.guild.id, bank_name)
+        self.bank_store.mark_dirty(context.guild.id)
+        await context.send(
+            content=f"Successfully changed **{bank_name}**'s emoji to {str(emoji)}"
+        )
+
+    @donationloggerset_bank.command(name="export")
+    @commands.bot_has_permissions(attach_files=True)
+    async def donationloggerset_bank_export(
+        self,
+        context: commands.Context,
+        bank_name: str,
+        file_format: Literal["csv", "jsonl"] = "csv",
+        with_names: bool = False,
+    ):
+        """
+        Export a bank's donators, or every bank's with `*`, as a CSV or JSON Lines file.
+
+        `all` also exports every bank, unless there is a bank actually named `all`.
+        **with_names**: Also include member names, only members in the bot's cache are resolved.
+        """
+        banks = self.bank_store.get(context.guild.id)
+        bank_name = bank_name.strip().lower()
+        if bank_name in banks:
+            bank_names = [bank_name]
+        elif bank_name in ("*", "all"):
+            bank_names = list(banks)
+            bank_name = "all"
+        else:
+            return await context.send(content=f'Bank "{bank_name}" does not exist.')
+        if not bank_names:
+            return await context.send(content="There are no registered banks yet.")
+
+        rows = iter_export_rows(context.guild, self.bank_store, bank_names, with_names)
+        lines = iter_export_lines(rows, file_format, with_names)
+        with tempfile.TemporaryFile() as fp:
+            await write_in_chunks(lines, fp)
+            if fp.tell() > context.guild.filesize_limit:
+                return await context.send(
+                    content="The export is too large to upload in this guild."
+                )
+            fp.seek(0)
             await context.send(
-                content=f"Successfully changed **{bank_name}**'s emoji to {str(emoji)}"
+                content=f"Exported {cf.humanize_list([b.title() for b in bank_names])}.",
+                file=discord.File(
+                    fp,
+                    filename=f"donations-{context.guild.id}-{bank_name}.{file_format}",
+                ),
             )
 
     @donationloggerset_bank.command(name="hidden")
@@ -803,12 +1507,11 @@ class DonationLogger(nu.Cog):
         if hidden in ["hide", "unhide"]:
             if not bank_name:
                 return await context.send_help()
-            async with self.config.guild(context.guild).banks() as banks:
-                banks[bank_name]["hidden"] = hidden == "hide"
-                status = "is now" if hidden == "hide" else "is no longer"
-                await context.send(content=f"Bank **{bank_name}** {status} hidden.")
+            self.bank_store.set_hidden(context.guild.id, bank_name, hidden == "hide")
+            status = "is now" if hidden == "hide" else "is no longer"
+            await context.send(content=f"Bank **{bank_name}** {status} hidden.")
         else:
-            all_banks = await self.config.guild(context.guild).banks()
+            all_banks = self.bank_store.get(context.guild.id)
             banks = {k: v for k, v in all_banks.items() if v["hidden"]}
             enumerated_banks = [
                 f"{index}. {v['emoji']} {k.title()}"
@@ -824,6 +1527,192 @@ class DonationLogger(nu.Cog):
             )
             await context.send(embed=embed)
 
+    @donationloggerset.group(name="ledger")
+    async def donationloggerset_ledger(self, context: commands.Context):
+        """
+        Donation ledger settings commands.
+        """
+        pass
+
+    @donationloggerset_ledger.command(name="snapshot")
+    async def donationloggerset_ledger_snapshot(self, context: commands.Context):
+        """
+        Take a snapshot of this guild's donation totals and compact the ledger.
+
+        Snapshots are also taken automatically once a day.
+        """
+        retention = await self.config.ledger_retention()
+        await self.ledger.snapshot(
+            context.guild.id, self.bank_store.get(context.guild.id), retention * 86400
+        )
+        await context.send(content="Donation ledger snapshot taken.")
+
+    @donationloggerset_ledger.command(name="rebuild")
+    async def donationloggerset_ledger_rebuild(self, context: commands.Context):
+        """
+        Rebuild this guild's donation totals from the latest ledger snapshot and every entry after it.
+        """
+        if not await self.ledger.last_snapshot(context.guild.id):
+            return await context.send(
+                content="There is no ledger snapshot for this guild yet, "
+                "take one with `[p]dlset ledger snapshot` first."
+            )
+        act = "This guild's donation totals have been rebuilt from the ledger."
+        conf = "Are you sure you want to rebuild this guild's donation totals from the ledger?"
+        view = nu.NoobConfirmation()
+        await view.start(context, act, content=conf)
+        await view.wait()
+        if not view.value:
+            return
+        totals = await self.ledger.rebuild(context.guild.id)
+        for name in self.bank_store.get(context.guild.id):
+            self.bank_store.replace_donators(
+                context.guild.id, name, totals.get(name, {})
+            )
+
+    @donationloggerset_ledger.command(name="retention")
+    @commands.is_owner()
+    async def donationloggerset_ledger_retention(
+        self, context: commands.Context, days: int = None
+    ):
+        """
+        Set how many days of ledger entries to keep after a snapshot.
+
+        Pass 0 to keep every entry forever.
+        """
+        if days is None:
+            days = await self.config.ledger_retention()
+            return await context.send(
+                content=(
+                    f"Ledger entries are kept for **{days}** day(s)."
+                    if days
+                    else "Ledger entries are kept forever."
+                )
+            )
+        if days < 0:
+            return await context.send(content="Days can not be negative.")
+        await self.config.ledger_retention.set(days)
+        await context.send(
+            content=(
+                f"Ledger entries will now be kept for **{days}** day(s) after a snapshot."
+                if days
+                else "Ledger entries will now be kept forever."
+            )
+        )
+
+    @donationloggerset.command(name="storage")
+    @commands.is_owner()
+    async def donationloggerset_storage(
+        self,
+        context: commands.Context,
+        storage: Literal["config", "sqlite"] = None,
+    ):
+        """
+        See or change where donator balances are stored.
+
+        `sqlite` keeps one row per donator in a local SQLite database so donations are single-row writes.
+        Changing the storage migrates every guild's donators to the new one.
+        """
+        current = await self.config.storage()
+        if not storage:
+            return await context.send(
+                content=f"Donators are currently stored in **{current}**."
+            )
+        if storage == current:
+            return await context.send(
+                content=f"Donators are already stored in **{current}**."
+            )
+        act = f"Migrating donators to **{storage}**..."
+        conf = f"Are you sure you want to migrate every donator from **{current}** to **{storage}**?"
+        view = nu.NoobConfirmation()
+        await view.start(context, act, content=conf)
+        await view.wait()
+        if not view.value:
+            return
+        old = self.bank_store.backend
+        new = None
+        async with context.typing():
+            try:
+                if storage == "sqlite":
+                    new = await self.open_sqlite_storage()
+                await self.bank_store.migrate(
+                    new, lambda: self.config.storage.set(storage)
+                )
+            except Exception as e:
+                self.log.exception(
+                    f"Failed to migrate donators to {storage}.", exc_info=e
+                )
+                if new:
+                    await new.close()
+                return await context.send(
+                    content=f"Migration failed, donators are still stored in **{current}**: {e}"
+                )
+            if old:
+                try:
+                    await old.delete_guild()
+                except Exception as e:
+                    self.log.exception(
+                        "Failed to clear the old SQLite donators.", exc_info=e
+                    )
+                await old.close()
+        await context.send(content=f"Donators have been migrated to **{storage}**.")
+
+    @donationloggerset.command(name="stats")
+    @commands.is_owner()
+    async def donationloggerset_stats(
+        self,
+        context: commands.Context,
+        action: Literal["enable", "disable", "reset"] = None,
+        command: str = None,
+    ):
+        """
+        See the p50/p95/p99 latency of each donation command phase.
+
+        Phases are `config` (settings read), `mutation` (balance change), `roles` (donation role updates), `reply` and `log` (log channel dispatch).
+        Only the most recent 1000 runs of each phase are kept, in memory.
+        Use `enable` or `disable` to toggle recording and `reset` to clear the histograms.
+        """
+        if action in ("enable", "disable"):
+            self.metrics.enabled = action == "enable"
+            await self.config.latency_stats.set(self.metrics.enabled)
+            return await context.send(
+                content=f"Latency stats recording has been {action}d."
+            )
+        if action == "reset":
+            self.metrics.reset()
+            return await context.send(content="Latency stats have been reset.")
+        summary = self.metrics.summary(command)
+        if not summary:
+            return await context.send(
+                content=(
+                    "No latency stats have been recorded yet."
+                    if self.metrics.enabled
+                    else f"Latency stats recording is disabled, enable it with `{context.clean_prefix}dlset stats enable`."
+                )
+            )
+        embed = discord.Embed(
+            title="DonationLogger command latency",
+            description=(
+                "Recording is enabled."
+                if self.metrics.enabled
+                else "Recording is disabled."
+            ),
+            colour=await context.embed_colour(),
+            timestamp=discord.utils.utcnow(),
+        )
+        for cmd, phases in list(summary.items())[:25]:
+            embed.add_field(
+                name=cmd,
+                value="\n".join(
+                    f"`{phase}` ({cf.humanize_number(count)}): "
+                    + " / ".join(f"{ms:.1f}" for ms in percentiles)
+                    for phase, count, percentiles in phases
+                ),
+                inline=False,
+            )
+        embed.set_footer(text="Per phase: runs, then p50 / p95 / p99 in ms.")
+        await context.send(embed=embed)
+
     @donationloggerset.command(name="manager")
     async def donationloggerset_manager(
         self,
@@ -865,6 +1754,7 @@ class DonationLogger(nu.Cog):
                     else:
                         managers.remove(role.id)
                     success.append(role.mention)
+            self.invalidate_guild_settings(context.guild.id)
             _type = "added" if add_remove_list == "add" else "removed"
             _type2 = "to" if add_remove_list == "add" else "from"
             if success:
@@ -885,6 +1775,7 @@ class DonationLogger(nu.Cog):
         """
         Set or remove the log channel.
         """
+        self.invalidate_guild_settings(context.guild.id)
         if not channel:
             await self.config.guild(context.guild).log_channel.clear()
             return await context.send(content="The log channel has been cleared.")
@@ -902,7 +1793,14 @@ class DonationLogger(nu.Cog):
         await view.start(context, act, content=conf)
         await view.wait()
         if view.value:
+            await self.cancel_reconciler(context.guild)
+            self.bank_store.drop(context.guild.id)
+            self.leaderboard_cache.pop(context.guild.id, None)
+            if self.bank_store.backend:
+                await self.bank_store.backend.delete_guild(context.guild.id)
+            await self.ledger.delete_guild(context.guild.id)
             await self.config.guild(context.guild).clear()
+            self.invalidate_guild_settings(context.guild.id)
 
     @donationloggerset.command(name="autorole")
     async def donationloggerset_autorole(self, context: commands.Context):
@@ -911,6 +1809,7 @@ class DonationLogger(nu.Cog):
         """
         current = await self.config.guild(context.guild).auto_role()
         await self.config.guild(context.guild).auto_role.set(not current)
+        self.invalidate_guild_settings(context.guild.id)
         status = "will no longer" if current else "will now"
         await context.send(content=f"I {status} automatically add or remove roles.")
 
@@ -921,7 +1820,7 @@ class DonationLogger(nu.Cog):
         """
         managers = await self.config.guild(context.guild).managers()
         autorole = await self.config.guild(context.guild).auto_role()
-        banks = await self.config.guild(context.guild).banks()
+        banks = self.bank_store.get(context.guild.id)
         log_channel = await self.config.guild(context.guild).log_channel()
         bank_list = [f"{k.title()}" for k in banks.keys()]
         banks_list_hidden = [f"{k.title()}" for k, v in banks.items() if v["hidden"]]
@@ -1,4 +1,4 @@
-from redbot.core.commands import BadArgument
+from redbot.core.commands import BadArgument, CommandError
 
 
 class AmountConversionFailure(BadArgument):
@@ -15,3 +15,10 @@ class MoreThanThreeRoles(BadArgument):
 
 class BankConversionFailure(BadArgument):
     pass
+
+
+class TransactionFailure(CommandError):
+    def __init__(self, message: str = None, *args, ephemeral: bool = False) -> None:
+        super().__init__(message, *args)
+        # Whether slash command replies about this failure should only be seen by the author.
+        self.ephemeral = ephemeral
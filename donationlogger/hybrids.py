@@ -13,7 +13,15 @@ from .checks import (
     check_if_setup_done,
     has_dono_permissions,
 )
-from .views import DonationLoggerSetupView, TotalDonoView
+from .exceptions import TransactionFailure
+from .metrics import timed
+from .objects import Invocation
+from .views import (
+    DonationLoggerSetupView,
+    DonatorPageSource,
+    LazyPaginator,
+    TotalDonoView,
+)
 
 if TYPE_CHECKING:
     from . import DonationLogger
@@ -109,7 +117,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -121,6 +129,7 @@ class HYBRIDS:
                     content="You need to be a donationlogger manager or higher to run this command.",
                     ephemeral=True,
                 )
+        author = obj.author if isinstance(obj, commands.Context) else obj.user
         if not bank_name:
             act = f"Successfully cleared all bank donations from **{user.name}**."
             conf = f"Are you sure you want to erase all bank donations from **{user.name}**?"
@@ -128,11 +137,16 @@ class HYBRIDS:
             await view.start(obj, act, content=conf)
             await view.wait()
             if view.value:
-                async with cog.config.guild(obj.guild).banks() as banks:
-                    for bank in banks.values():
-                        donos = bank["donators"].get(str(user.id))
-                        if donos is not None:
-                            del bank["donators"][str(user.id)]
+                for name, bank in cog.bank_store.get(obj.guild.id).items():
+                    if str(user.id) in bank["donators"]:
+                        cog.bank_store.set_donation(
+                            obj.guild.id,
+                            name,
+                            user.id,
+                            None,
+                            action="reset",
+                            author_id=author.id,
+                        )
             return
         act = f"Successfully cleared **{bank_name.title()}** donations from **{user.name}**."
         conf = f"Are you sure you want to clear **{bank_name.title()}** donations from **{user.name}**"
@@ -140,12 +154,17 @@ class HYBRIDS:
         await view.start(obj, act, content=conf)
         await view.wait()
         if view.value:
-            async with cog.config.guild(obj.guild).banks() as banks:
-                donations = banks[bank_name.lower()]["donators"].get(str(user.id))
-                if donations is not None:
-                    del banks[bank_name.lower()]["donators"][str(user.id)]
+            cog.bank_store.set_donation(
+                obj.guild.id,
+                bank_name.lower(),
+                user.id,
+                None,
+                action="reset",
+                author_id=author.id,
+            )
 
     @classmethod
+    @timed("balance")
     async def hybrid_balance(
         cls,
         cog: "DonationLogger",
@@ -163,30 +182,34 @@ class HYBRIDS:
                 ephemeral=True,
             )
         if bank_name:
-            async with cog.config.guild(obj.guild).banks() as banks:
-                bank = banks[bank_name.lower()]
-                if bank["hidden"]:
-                    return await cls.hybrid_send(obj, content="This bank is hidden")
-                donations = bank["donators"].get(str(member.id), 0)
-                embed = discord.Embed(
-                    title=f"{member.name} ({member.id})",
-                    description=(
-                        f"Bank: {bank_name.title()}\n"
-                        f"Total amount donated: {bank['emoji']} {cf.humanize_number(donations)}"
-                    ),
-                    timestamp=discord.utils.utcnow(),
-                    colour=member.colour,
-                )
-                embed.set_thumbnail(url=nu.is_have_avatar(member))
-                embed.set_footer(
-                    text=f"{obj.guild.name} admires your donations!",
-                    icon_url=nu.is_have_avatar(obj.guild),
-                )
+            banks = cog.bank_store.get(obj.guild.id)
+            bank = banks[bank_name.lower()]
+            if bank["hidden"]:
+                return await cls.hybrid_send(obj, content="This bank is hidden")
+            donations = bank["donators"].get(str(member.id), 0)
+            embed = discord.Embed(
+                title=f"{member.name} ({member.id})",
+                description=(
+                    f"Bank: {bank_name.title()}\n"
+                    f"Total amount donated: {bank['emoji']} {cf.humanize_number(donations)}"
+                ),
+                timestamp=discord.utils.utcnow(),
+                colour=member.colour,
+            )
+            embed.set_thumbnail(url=nu.is_have_avatar(member))
+            embed.set_footer(
+                text=f"{obj.guild.name} admires your donations!",
+                icon_url=nu.is_have_avatar(obj.guild),
+            )
+            with cog.metrics.phase("balance", "reply"):
                 return await cls.hybrid_send(obj, embed=embed)
-        embed = await cog.get_all_bank_member_dono(obj.guild, member)
-        await cls.hybrid_send(obj, embed=embed)
+        with cog.metrics.phase("balance", "render"):
+            embed = await cog.get_all_bank_member_dono(obj.guild, member)
+        with cog.metrics.phase("balance", "reply"):
+            await cls.hybrid_send(obj, embed=embed)
 
     @classmethod
+    @timed("donationcheck")
     async def hybrid_donationcheck(
         cls,
         cog: "DonationLogger",
@@ -204,70 +227,43 @@ class HYBRIDS:
                 content='I require the "Embed Links" permission to run this command.',
                 ephemeral=True,
             )
-        if isinstance(obj, commands.Context):
-            ctx: commands.Context = obj
-        else:
-            ctx: commands.Context = await obj.client.get_context(obj)
+        ctx = Invocation(obj)
         if mla == "all":
-            embeds = await cog.get_dc_from_bank(ctx, bank_name)
-            if not embeds:
+            source = await cog.get_dc_from_bank(ctx, bank_name)
+            if not source:
                 return await cls.hybrid_send(obj, content="This bank is hidden.")
-            await nu.NoobPaginator(embeds).start(obj)
+            with cog.metrics.phase("donationcheck", "reply"):
+                await LazyPaginator(source).start(obj)
             return
 
         if not amount:
-            return await ctx.send_help()
+            if isinstance(obj, commands.Context):
+                return await obj.send_help()
+            return await cls.hybrid_send(
+                obj, content="Provide an amount to check.", ephemeral=True
+            )
 
-        banks_config = await cog.config.guild(obj.guild).banks()
+        banks_config = cog.bank_store.get(obj.guild.id)
         bank_data = banks_config.get(bank_name.lower(), {})
         if bank_data.get("hidden"):
             return await cls.hybrid_send(obj, content="This bank is hidden.")
 
-        donators = bank_data.get("donators", {})
-        filtered_donators = {
-            k: v
-            for k, v in donators.items()
-            if (mla == "more" and v >= amount) or (mla == "less" and v < amount)
-        }
-
-        sorted_donators = sorted(
-            filtered_donators.items(), key=lambda u: u[1], reverse=(mla == "more")
-        )
-
-        output_list = []
-        for index, (donator_id, donation_amount) in enumerate(sorted_donators, 1):
-            member = obj.guild.get_member(int(donator_id))
-            mention = (
-                f"{member.mention} (`{member.id}`)"
-                if member
-                else f"Member not found in server. (`{donator_id}`)"
-            )
-            e = (
-                "➡️ "
-                if member and member.id == (getattr(obj, "user", obj.author)).id
-                else ""
-            )
-            output_list.append(
-                f"{e}{index}. {mention}: **{cf.humanize_number(donation_amount)}**"
-            )
-
-        output_text = "\n".join(
-            output_list
-            or [f"No one has donated {mla} than **{cf.humanize_number(amount)}** yet."]
-        )
-
-        paginated_output = await nu.pagify_this(
-            output_text,
-            "\n",
-            "Page ({index}/{pages})",
-            embed_title=f"All members who have donated {mla} than {cf.humanize_number(amount)} "
+        source = DonatorPageSource(
+            obj.guild,
+            cog.bank_store.index(obj.guild.id, bank_name.lower()),
+            title=f"All members who have donated {mla} than {cf.humanize_number(amount)} "
             f"for [{bank_name.title()}]",
-            embed_colour=await ctx.embed_colour(),
+            colour=await ctx.embed_colour(),
+            viewer_id=ctx.author.id,
+            at_least=amount if mla == "more" else None,
+            less_than=amount if mla == "less" else None,
+            empty=f"No one has donated {mla} than **{cf.humanize_number(amount)}** yet.",
         )
-
-        await nu.NoobPaginator(paginated_output).start(obj)
+        with cog.metrics.phase("donationcheck", "reply"):
+            await LazyPaginator(source).start(obj)
 
     @classmethod
+    @timed("leaderboard")
     async def hybrid_leaderboard(
         cls,
         cog: "DonationLogger",
@@ -285,44 +281,53 @@ class HYBRIDS:
                 content='I require the "Embed Links" permission to run this command.',
                 ephemeral=True,
             )
-        banks = await cog.config.guild(obj.guild).banks()
+        banks = cog.bank_store.get(obj.guild.id)
         if banks[bank_name.lower()]["hidden"]:
             return await cls.hybrid_send(obj, content="This bank is hidden.")
-        donors = banks[bank_name.lower()]["donators"]
-        emoji = banks[bank_name.lower()]["emoji"]
-        filtered_donors = {}
-        for i, j in donors.items():
-            if j <= 0:
-                continue
-            memb = obj.guild.get_member(int(i))
-            if not memb and not show_left_users:
-                continue
-            member = memb.name if memb else f"[Member not found in guild] ({i})"
-            filtered_donors[member] = j
+        if embed := cog.get_cached_leaderboard(
+            obj.guild.id, bank_name.lower(), top, show_left_users
+        ):
+            with cog.metrics.phase("leaderboard", "reply"):
+                return await cls.hybrid_send(obj, embed=embed)
+        with cog.metrics.phase("leaderboard", "render"):
+            emoji = banks[bank_name.lower()]["emoji"]
+            sorted_donors = []
+            member_ids = set()
+            for i, j in cog.bank_store.index(
+                obj.guild.id, bank_name.lower()
+            ).iter_desc():
+                if j <= 0 or len(sorted_donors) >= top:
+                    break
+                memb = obj.guild.get_member(i)
+                if not memb and not show_left_users:
+                    continue
+                member = memb.name if memb else f"[Member not found in guild] ({i})"
+                sorted_donors.append((member, j))
+                member_ids.add(i)
 
-        sorted_donors = dict(
-            sorted(filtered_donors.items(), key=lambda m: m[1], reverse=True)
-        )
-        embed = discord.Embed(
-            title=f"Top {top} donators for [{bank_name.title()}]",
-            colour=random.randint(0, 0xFFFFFF),
-            timestamp=discord.utils.utcnow(),
-        )
-        embed.set_footer(text=obj.guild.name)
-        embed.set_thumbnail(url=nu.is_have_avatar(obj.guild))
-        if not sorted_donors:
-            embed.description = "It seems no one has donated from this bank yet."
-        for index, (k, v) in enumerate(sorted_donors.items(), 1):
-            if index > top:
-                break
-            embed.add_field(
-                name=f"{index}. {k}",
-                value=f"{emoji} {cf.humanize_number(v)}",
-                inline=False,
+            embed = discord.Embed(
+                title=f"Top {top} donators for [{bank_name.title()}]",
+                colour=random.randint(0, 0xFFFFFF),
+                timestamp=discord.utils.utcnow(),
             )
-        await cls.hybrid_send(obj, embed=embed)
+            embed.set_footer(text=obj.guild.name)
+            embed.set_thumbnail(url=nu.is_have_avatar(obj.guild))
+            if not sorted_donors:
+                embed.description = "It seems no one has donated from this bank yet."
+            for index, (k, v) in enumerate(sorted_donors, 1):
+                embed.add_field(
+                    name=f"{index}. {k}",
+                    value=f"{emoji} {cf.humanize_number(v)}",
+                    inline=False,
+                )
+        cog.cache_leaderboard(
+            obj.guild.id, bank_name.lower(), top, show_left_users, embed, member_ids
+        )
+        with cog.metrics.phase("leaderboard", "reply"):
+            await cls.hybrid_send(obj, embed=embed)
 
     @classmethod
+    @timed("add")
     async def hybrid_add(
         cls,
         cog: "DonationLogger",
@@ -339,7 +344,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -351,68 +356,67 @@ class HYBRIDS:
                     content="You need to be a donationlogger manager or higher to run this command.",
                     ephemeral=True,
                 )
-        if isinstance(obj, commands.Context):
-            ctx = obj
-        else:
-            ctx = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            emoji = bank["emoji"]
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            multi = bank.get("multi")
-            if multi:
-                amount = round(amount * multi)
-            if amount > 999999999999999:
-                return await cls.hybrid_send(
-                    obj,
-                    ephemeral=True,
-                    content="The amount you provided is way too high, consider adding something reasonable.",
+        ctx = Invocation(obj)
+        with cog.metrics.phase("add", "config"):
+            await cog.get_guild_settings(obj.guild)
+        try:
+            with cog.metrics.phase("add", "mutation"):
+                result = await cog.bank_store.transact(
+                    obj.guild.id,
+                    bank_name.lower(),
+                    member.id,
+                    "add",
+                    amount,
+                    ctx.author.id,
+                    note,
                 )
-            bank["donators"].setdefault(str(member.id), 0)
-            bank["donators"][str(member.id)] += amount
-            updated = bank["donators"][str(member.id)]
-            previous = updated - amount
-            donated = cf.humanize_number(amount)
-            total = cf.humanize_number(updated)
+        except TransactionFailure as e:
+            return await cls.hybrid_send(obj, content=str(e), ephemeral=e.ephemeral)
+        emoji, multi = result.emoji, result.multi
+        donated = cf.humanize_number(result.amount)
+        total = cf.humanize_number(result.updated)
+        with cog.metrics.phase("add", "roles"):
             roles = await cog.update_dono_roles(
-                ctx, "add", updated, member, bank["roles"]
-            )
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{donated}** was added to **{member.name}**'s **__{bank_name.title()}__** "
-                f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
-                f"**__{bank_name.title()}__**."
+                ctx, "add", result.previous, result.updated, member, result.milestones
             )
-            embed = discord.Embed(
-                title="Successfully Added",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow(),
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{donated}** was added to **{member.name}**'s **__{bank_name.title()}__** "
+            f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
+            f"**__{bank_name.title()}__**."
+        )
+        embed = discord.Embed(
+            title="Successfully Added",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow(),
+        )
+        if multi:
+            embed.set_footer(text=f"Donation Multiplier: x{multi}")
+        if humanized_roles:
+            embed.add_field(
+                name="Added Donation Roles:", value=humanized_roles, inline=False
             )
-            if multi:
-                embed.set_footer(text=f"Donation Multiplier: x{multi}")
-            if humanized_roles:
-                embed.add_field(
-                    name="Added Donation Roles:", value=humanized_roles, inline=False
-                )
+        with cog.metrics.phase("add", "reply"):
             await TotalDonoView(cog).start(
                 ctx, member, content=member.mention, embed=embed
             )
+        with cog.metrics.phase("add", "log"):
             await cog.send_to_log_channel(
                 ctx,
                 "add",
                 bank_name,
                 emoji,
-                amount,
-                previous,
-                updated,
+                result.amount,
+                result.previous,
+                result.updated,
                 member,
                 humanized_roles,
                 note,
             )
 
     @classmethod
+    @timed("remove")
     async def hybrid_remove(
         cls,
         cog: "DonationLogger",
@@ -429,7 +433,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -441,66 +445,70 @@ class HYBRIDS:
                     content="You need to be a donationlogger manager or higher to run this command.",
                     ephemeral=True,
                 )
-        if isinstance(obj, commands.Context):
-            ctx: commands.Context = obj
-        else:
-            ctx: commands.Context = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            donators = bank["donators"]
-            emoji = bank["emoji"]
-            member_id = str(member.id)
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            d = donators.get(member_id)
-            if d == 0 or d is None:
-                return await cls.hybrid_send(
-                    obj, content="This member has 0 donation balance for this bank."
+        ctx = Invocation(obj)
+        with cog.metrics.phase("remove", "config"):
+            await cog.get_guild_settings(obj.guild)
+        try:
+            with cog.metrics.phase("remove", "mutation"):
+                result = await cog.bank_store.transact(
+                    obj.guild.id,
+                    bank_name.lower(),
+                    member.id,
+                    "remove",
+                    amount,
+                    ctx.author.id,
+                    note,
                 )
-            donators[member_id] -= amount
-            updated1 = donators[member_id]
-            if updated1 < 0:
-                del donators[member_id]
-            updated2 = donators.get(member_id, 0)
-            previous = updated1 + amount
-            donated = cf.humanize_number(amount)
-            total = cf.humanize_number(updated2)
+        except TransactionFailure as e:
+            return await cls.hybrid_send(obj, content=str(e), ephemeral=e.ephemeral)
+        emoji = result.emoji
+        donated = cf.humanize_number(amount)
+        total = cf.humanize_number(result.updated)
+        with cog.metrics.phase("remove", "roles"):
             roles = await cog.update_dono_roles(
-                ctx, "remove", updated2, member, bank["roles"]
-            )
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{donated}** was removed from **{member.name}**'s **__{bank_name.title()}__** "
-                f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
-                f"**__{bank_name.title()}__**."
+                ctx,
+                "remove",
+                result.previous,
+                result.updated,
+                member,
+                result.milestones,
             )
-            embed = discord.Embed(
-                title="Successfully Removed",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow(),
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{donated}** was removed from **{member.name}**'s **__{bank_name.title()}__** "
+            f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
+            f"**__{bank_name.title()}__**."
+        )
+        embed = discord.Embed(
+            title="Successfully Removed",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow(),
+        )
+        if humanized_roles:
+            embed.add_field(
+                name="Removed Donation Roles:", value=humanized_roles, inline=False
             )
-            if humanized_roles:
-                embed.add_field(
-                    name="Removed Donation Roles:", value=humanized_roles, inline=False
-                )
+        with cog.metrics.phase("remove", "reply"):
             await TotalDonoView(cog).start(
                 ctx, member, content=member.mention, embed=embed
             )
+        with cog.metrics.phase("remove", "log"):
             await cog.send_to_log_channel(
                 ctx,
                 "remove",
                 bank_name,
                 emoji,
                 amount,
-                previous,
-                updated2,
+                result.previous,
+                result.updated,
                 member,
                 humanized_roles,
                 note,
             )
 
     @classmethod
+    @timed("set")
     async def hybrid_set(
         cls,
         cog: "DonationLogger",
@@ -508,6 +516,7 @@ class HYBRIDS:
         bank_name: str,
         amount: int,
         member: discord.Member,
+        note: str = None,
     ):
         if isinstance(obj, discord.Interaction):
             if not obj.channel.permissions_for(obj.guild.me).embed_links:
@@ -516,7 +525,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -528,54 +537,67 @@ class HYBRIDS:
                     content="You need to be a donationlogger manager or higher to run this command.",
                     ephemeral=True,
                 )
-        if isinstance(obj, commands.Context):
-            ctx: commands.Context = obj
-        else:
-            ctx: commands.Context = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            donators = bank["donators"]
-            emoji = bank["emoji"]
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            donators.setdefault(str(member.id), 0)
-            previous = donators[str(member.id)]
-            donators[str(member.id)] = amount
+        ctx = Invocation(obj)
+        with cog.metrics.phase("set", "config"):
+            await cog.get_guild_settings(obj.guild)
+        try:
+            with cog.metrics.phase("set", "mutation"):
+                result = await cog.bank_store.transact(
+                    obj.guild.id,
+                    bank_name.lower(),
+                    member.id,
+                    "set",
+                    amount,
+                    ctx.author.id,
+                    note,
+                )
+        except TransactionFailure as e:
+            return await cls.hybrid_send(obj, content=str(e), ephemeral=e.ephemeral)
+        emoji = result.emoji
+        with cog.metrics.phase("set", "roles"):
             aroles = await cog.update_dono_roles(
-                ctx, "add", amount, member, bank["roles"]
+                ctx, "add", result.previous, result.updated, member, result.milestones
             )
             rrole = await cog.update_dono_roles(
-                ctx, "remove", amount, member, bank["roles"]
-            )
-            roles = aroles + rrole
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{cf.humanize_number(amount)}** was set as **{member.name}**'s "
-                f"**__{bank_name.title()}__** donation balance."
+                ctx,
+                "remove",
+                result.previous,
+                result.updated,
+                member,
+                result.milestones,
             )
-            embed = discord.Embed(
-                title="Successfully Set",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow(),
+        roles = aroles + rrole
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{cf.humanize_number(amount)}** was set as **{member.name}**'s "
+            f"**__{bank_name.title()}__** donation balance."
+        )
+        embed = discord.Embed(
+            title="Successfully Set",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow(),
+        )
+        if humanized_roles:
+            embed.add_field(
+                name="Added/Removed Donation Roles:",
+                value=humanized_roles,
+                inline=False,
             )
-            if humanized_roles:
-                embed.add_field(
-                    name="Added/Removed Donation Roles:",
-                    value=humanized_roles,
-                    inline=False,
-                )
+        with cog.metrics.phase("set", "reply"):
             await TotalDonoView(cog).start(
                 ctx, member, content=member.mention, embed=embed
             )
+        with cog.metrics.phase("set", "log"):
             await cog.send_to_log_channel(
                 ctx,
                 "set",
                 bank_name,
                 emoji,
                 amount,
-                previous,
+                result.previous,
                 amount,
                 member,
                 humanized_roles,
+                note,
             )
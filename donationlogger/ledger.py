@@ -0,0 +1,327 @@
+import asyncio
+import sqlite3
+import time
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    bank TEXT NOT NULL,
+    member_id INTEGER NOT NULL,
+    author_id INTEGER,
+    action TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    previous INTEGER NOT NULL,
+    updated INTEGER,
+    delta INTEGER NOT NULL,
+    note TEXT,
+    ts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_window ON entries (guild_id, bank, ts);
+CREATE INDEX IF NOT EXISTS ix_entries_member ON entries (guild_id, member_id, ts);
+CREATE TABLE IF NOT EXISTS snapshots (
+    guild_id INTEGER PRIMARY KEY,
+    last_entry_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshot_rows (
+    guild_id INTEGER NOT NULL,
+    bank TEXT NOT NULL,
+    member_id INTEGER NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (guild_id, bank, member_id)
+);
+"""
+
+
+class LedgerEntry:
+    __slots__ = (
+        "id",
+        "guild_id",
+        "bank",
+        "member_id",
+        "author_id",
+        "action",
+        "amount",
+        "previous",
+        "updated",
+        "delta",
+        "note",
+        "ts",
+    )
+
+    def __init__(self, row: tuple) -> None:
+        (
+            self.id,
+            self.guild_id,
+            self.bank,
+            self.member_id,
+            self.author_id,
+            self.action,
+            self.amount,
+            self.previous,
+            self.updated,
+            self.delta,
+            self.note,
+            self.ts,
+        ) = row
+
+
+class DonationLedger:
+    """
+    Append-only, timestamped ledger of every donation mutation.
+
+    Entries are buffered in memory and written in batches. Each entry carries the absolute
+    balance after the change, so totals can be rebuilt from the latest snapshot plus the tail.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection = None
+        self._pending: List[tuple] = []
+        self._lock = asyncio.Lock()
+
+    async def open(self) -> None:
+        def _open():
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            return conn
+
+        self._conn = await asyncio.to_thread(_open)
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._conn:
+            async with self._lock:
+                await asyncio.to_thread(self._conn.close)
+            self._conn = None
+
+    async def _run(self, func, *args):
+        async with self._lock:
+            return await asyncio.to_thread(func, *args)
+
+    def append(
+        self,
+        guild_id: int,
+        bank: str,
+        member_id: int,
+        action: str,
+        amount: int,
+        previous: int,
+        updated: Optional[int],
+        author_id: int = None,
+        note: str = None,
+    ) -> None:
+        self._pending.append(
+            (
+                guild_id,
+                bank,
+                member_id,
+                author_id,
+                action,
+                amount,
+                previous,
+                updated,
+                (updated or 0) - previous,
+                note,
+                int(time.time()),
+            )
+        )
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> None:
+        if not self._pending or not self._conn:
+            return
+        async with self._lock:
+            await self._flush_locked()
+
+    async def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+
+        def _write():
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO entries (guild_id, bank, member_id, author_id, action, amount, "
+                    "previous, updated, delta, note, ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+        try:
+            await asyncio.to_thread(_write)
+        except Exception:
+            self._pending[:0] = rows
+            raise
+
+    async def snapshot(
+        self, guild_id: int, banks: Dict[str, Dict[str, Any]], retention: int = 0
+    ) -> None:
+        """
+        Store the guild's current totals and compact the ledger.
+
+        Entries older than `retention` seconds that are covered by the snapshot are dropped.
+        A retention of 0 keeps every entry.
+        """
+
+        def _write(rows: List[Tuple[int, str, int, int]]):
+            with self._conn:
+                (last_id,) = self._conn.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM entries WHERE guild_id = ?",
+                    (guild_id,),
+                ).fetchone()
+                self._conn.execute(
+                    "DELETE FROM snapshot_rows WHERE guild_id = ?", (guild_id,)
+                )
+                self._conn.executemany(
+                    "INSERT INTO snapshot_rows VALUES (?, ?, ?, ?)", rows
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                    (guild_id, last_id, int(time.time())),
+                )
+                if retention:
+                    self._conn.execute(
+                        "DELETE FROM entries WHERE guild_id = ? AND id <= ? AND ts < ?",
+                        (guild_id, last_id, int(time.time()) - retention),
+                    )
+
+        # Holding the lock keeps entries appended after the totals are read out of the
+        # snapshot's range, so they are replayed on rebuild.
+        async with self._lock:
+            await self._flush_locked()
+            rows = [
+                (guild_id, name, int(member_id), amount)
+                for name, bank in banks.items()
+                for member_id, amount in bank["donators"].items()
+            ]
+            await asyncio.to_thread(_write, rows)
+
+    async def last_snapshot(self, guild_id: int) -> Optional[int]:
+        def _read():
+            return self._conn.execute(
+                "SELECT ts FROM snapshots WHERE guild_id = ?", (guild_id,)
+            ).fetchone()
+
+        row = await self._run(_read)
+        return row[0] if row else None
+
+    async def rebuild(self, guild_id: int) -> Dict[str, Dict[str, int]]:
+        """Rebuild the guild's totals from its latest snapshot plus the ledger tail."""
+        await self.flush()
+
+        def _read():
+            totals: Dict[str, Dict[str, int]] = {}
+            snap = self._conn.execute(
+                "SELECT last_entry_id FROM snapshots WHERE guild_id = ?", (guild_id,)
+            ).fetchone()
+            last_id = snap[0] if snap else 0
+            for bank, member_id, amount in self._conn.execute(
+                "SELECT bank, member_id, amount FROM snapshot_rows WHERE guild_id = ?",
+                (guild_id,),
+            ):
+                totals.setdefault(bank, {})[str(member_id)] = amount
+            for bank, member_id, action, updated in self._conn.execute(
+                "SELECT bank, member_id, action, updated FROM entries "
+                "WHERE guild_id = ? AND id > ? ORDER BY id",
+                (guild_id, last_id),
+            ):
+                if action == "resetbank":
+                    totals[bank] = {}
+                elif updated is None:
+                    totals.setdefault(bank, {}).pop(str(member_id), None)
+                else:
+                    totals.setdefault(bank, {})[str(member_id)] = updated
+            return totals
+
+        return await self._run(_read)
+
+    async def top_in_window(
+        self, guild_id: int, bank: str, since: int, limit: int
+    ) -> List[Tuple[int, int]]:
+        """Return `(member_id, net_amount)` of the top donors since a unix timestamp."""
+        await self.flush()
+
+        def _read():
+            return self._conn.execute(
+                "SELECT member_id, SUM(delta) AS total FROM entries "
+                "WHERE guild_id = ? AND bank = ? AND ts >= ? AND action != 'resetbank' "
+                "GROUP BY member_id HAVING total > 0 ORDER BY total DESC LIMIT ?",
+                (guild_id, bank, since, limit),
+            ).fetchall()
+
+        return await self._run(_read)
+
+    async def member_history(
+        self, guild_id: int, member_id: int, bank: str = None, limit: int = 100
+    ) -> List[LedgerEntry]:
+        await self.flush()
+
+        def _read():
+            query = "SELECT * FROM entries WHERE guild_id = ? AND member_id = ?"
+            params = [guild_id, member_id]
+            if bank:
+                query += " AND bank = ?"
+                params.append(bank)
+            query += " ORDER BY ts DESC, id DESC LIMIT ?"
+            params.append(limit)
+            return [LedgerEntry(r) for r in self._conn.execute(query, params)]
+
+        return await self._run(_read)
+
+    async def get_entry(self, guild_id: int, entry_id: int) -> Optional[LedgerEntry]:
+        await self.flush()
+
+        def _read():
+            row = self._conn.execute(
+                "SELECT * FROM entries WHERE guild_id = ? AND id = ?",
+                (guild_id, entry_id),
+            ).fetchone()
+            return LedgerEntry(row) if row else None
+
+        return await self._run(_read)
+
+    async def delete_user(self, user_id: int) -> None:
+        self._pending = [r for r in self._pending if r[2] != user_id]
+
+        def _write():
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE member_id = ?", (user_id,)
+                )
+                self._conn.execute(
+                    "UPDATE entries SET author_id = NULL WHERE author_id = ?",
+                    (user_id,),
+                )
+                self._conn.execute(
+                    "DELETE FROM snapshot_rows WHERE member_id = ?", (user_id,)
+                )
+
+        await self._run(_write)
+
+    async def delete_guild(self, guild_id: int = None) -> None:
+        """Delete a guild's ledger, or every guild's when no guild is given."""
+        self._pending = [
+            r for r in self._pending if guild_id is not None and r[0] != guild_id
+        ]
+
+        def _write():
+            with self._conn:
+                for table in ("entries", "snapshots", "snapshot_rows"):
+                    if guild_id is None:
+                        self._conn.execute(f"DELETE FROM {table}")
+                    else:
+                        self._conn.execute(
+                            f"DELETE FROM {table} WHERE guild_id = ?", (guild_id,)
+                        )
+
+        await self._run(_write)
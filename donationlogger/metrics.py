@@ -0,0 +1,112 @@
+import functools
+import time
+
+from collections import deque
+from typing import Deque, Dict, List, Tuple
+
+
+WINDOW = 1000
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """The most recent `WINDOW` samples of one phase, in seconds."""
+
+    __slots__ = ("samples", "count")
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentiles(self) -> Tuple[float, ...]:
+        """Return the nearest-rank `PERCENTILES` of the window in milliseconds."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return tuple(0.0 for _ in PERCENTILES)
+        last = len(ordered) - 1
+        return tuple(ordered[round(last * p / 100)] * 1000 for p in PERCENTILES)
+
+
+class NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "NullTimer":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+NULL_TIMER = NullTimer()
+
+
+class PhaseTimer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: LatencyHistogram) -> None:
+        self.histogram = histogram
+        self.start = 0.0
+
+    def __enter__(self) -> "PhaseTimer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.histogram.add(time.perf_counter() - self.start)
+        return False
+
+
+class LatencyMetrics:
+    """
+    Rolling per-command, per-phase latency histograms.
+
+    While disabled `phase` hands out a shared no-op timer, so instrumented code only pays for
+    one attribute check.
+    """
+
+    def __init__(self, window: int = WINDOW) -> None:
+        self.enabled = False
+        self.window = window
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def phase(self, command: str, phase: str):
+        if not self.enabled:
+            return NULL_TIMER
+        key = (command, phase)
+        if (histogram := self._histograms.get(key)) is None:
+            histogram = self._histograms[key] = LatencyHistogram(self.window)
+        return PhaseTimer(histogram)
+
+    def reset(self) -> None:
+        self._histograms.clear()
+
+    def summary(
+        self, command: str = None
+    ) -> Dict[str, List[Tuple[str, int, Tuple[float, ...]]]]:
+        """Return `{command: [(phase, count, (p50, p95, p99)), ...]}` sorted by command."""
+        data: Dict[str, List[Tuple[str, int, Tuple[float, ...]]]] = {}
+        for (cmd, phase), histogram in sorted(self._histograms.items()):
+            if command and cmd != command:
+                continue
+            data.setdefault(cmd, []).append(
+                (phase, histogram.count, histogram.percentiles())
+            )
+        return data
+
+
+def timed(command: str):
+    """Record the whole run of a `HYBRIDS` classmethod as the command's `total` phase."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(cls, cog, *args, **kwargs):
+            with cog.metrics.phase(command, "total"):
+                return await func(cls, cog, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
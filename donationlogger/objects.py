@@ -0,0 +1,704 @@
+import asyncio
+import bisect
+import discord
+
+from discord import app_commands
+from redbot.core import Config, commands
+from redbot.core.bot import Red
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .exceptions import TransactionFailure
+from .ledger import DonationLedger
+from .storage import SQLiteDonatorStore
+
+
+class Invocation:
+    """
+    The parts of a Context or an Interaction that donation side effects need.
+
+    Slash paths use this instead of building a full Context with `get_context`.
+    """
+
+    __slots__ = ("obj", "guild", "author", "channel", "bot", "message", "jump_url")
+
+    def __init__(self, obj: Union[commands.Context, discord.Interaction[Red]]) -> None:
+        self.obj = obj
+        self.guild: discord.Guild = obj.guild
+        self.channel: discord.abc.MessageableChannel = obj.channel
+        if isinstance(obj, commands.Context):
+            self.author: discord.Member = obj.author
+            self.bot: Red = obj.bot
+            self.message: Optional[discord.Message] = obj.message
+            self.jump_url: Optional[str] = obj.message.jump_url
+        else:
+            self.author: discord.Member = obj.user
+            self.bot: Red = obj.client
+            self.message: Optional[discord.Message] = None
+            # Filled in with the first response message.
+            self.jump_url: Optional[str] = None
+
+    async def embed_colour(self) -> discord.Colour:
+        return await self.bot.get_embed_colour(self.channel)
+
+    async def get_prefix(self) -> str:
+        if isinstance(self.obj, commands.Context):
+            return self.obj.clean_prefix
+        return (await self.bot.get_valid_prefixes(self.guild))[0]
+
+    async def send(self, **kwargs) -> discord.Message:
+        if isinstance(self.obj, commands.Context):
+            return await self.obj.send(**kwargs)
+        kwargs.pop("reference", None)
+        kwargs.pop("mention_author", None)
+        if self.obj.response.is_done():
+            message = await self.obj.followup.send(wait=True, **kwargs)
+        else:
+            await self.obj.response.send_message(**kwargs)
+            message = await self.obj.original_response()
+        if self.jump_url is None:
+            self.jump_url = message.jump_url
+        return message
+
+
+class DonationResult:
+    """The committed outcome of a single add/remove/set transaction."""
+
+    __slots__ = (
+        "d_type",
+        "bank_name",
+        "member_id",
+        "amount",
+        "previous",
+        "updated",
+        "multi",
+        "emoji",
+        "milestones",
+        "roles",
+    )
+
+    def __init__(self, **payload) -> None:
+        self.d_type: str = payload.get("d_type")
+        self.bank_name: str = payload.get("bank_name")
+        self.member_id: int = payload.get("member_id")
+        self.amount: int = payload.get("amount")
+        self.previous: int = payload.get("previous", 0)
+        self.updated: int = payload.get("updated", 0)
+        self.multi: Optional[float] = payload.get("multi")
+        self.emoji: str = payload.get("emoji")
+        self.milestones: MilestoneIndex = payload.get("milestones", MilestoneIndex({}))
+        # Donation roles added or removed because of this transaction, if they were applied.
+        self.roles: List[discord.Role] = payload.get("roles", [])
+
+
+class DonatorIndex:
+    """
+    Ordered index of a bank's donators, highest amount first.
+
+    Entries are stored as `(-amount, member_id)` so ties are broken by member ID.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, donators: Dict[str, int]) -> None:
+        self._keys: List[Tuple[int, int]] = sorted(
+            (-amount, int(member_id)) for member_id, amount in donators.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, position: int) -> Tuple[int, int]:
+        """Return `(member_id, amount)` at a 0-based position, highest amount first."""
+        neg, member_id = self._keys[position]
+        return member_id, -neg
+
+    def update(
+        self, member_id: int, before: Optional[int], after: Optional[int]
+    ) -> None:
+        if before is not None:
+            key = (-before, member_id)
+            i = bisect.bisect_left(self._keys, key)
+            if i < len(self._keys) and self._keys[i] == key:
+                del self._keys[i]
+        if after is not None:
+            bisect.insort(self._keys, (-after, member_id))
+
+    def iter_desc(self, start: int = 0) -> Iterator[Tuple[int, int]]:
+        """Yield `(member_id, amount)` from the highest amount down, starting at `start`."""
+        for i in range(start, len(self._keys)):
+            neg, member_id = self._keys[i]
+            yield member_id, -neg
+
+    def top(self, n: int) -> List[Tuple[int, int]]:
+        return [(member_id, -neg) for neg, member_id in self._keys[:n]]
+
+    def rank(self, member_id: int, amount: int) -> Optional[int]:
+        """Return the 1-based position of a member in this bank, or None if absent."""
+        key = (-amount, member_id)
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return i + 1
+        return None
+
+    def count_at_least(self, amount: int) -> int:
+        return bisect.bisect_right(self._keys, (-amount, float("inf")))
+
+    def at_least(self, amount: int) -> Iterator[Tuple[int, int]]:
+        """Yield donators with at least `amount`, highest first."""
+        for i in range(self.count_at_least(amount)):
+            neg, member_id = self._keys[i]
+            yield member_id, -neg
+
+    def less_than(self, amount: int) -> Iterator[Tuple[int, int]]:
+        """Yield donators with less than `amount`, lowest first."""
+        for i in range(len(self._keys) - 1, self.count_at_least(amount) - 1, -1):
+            neg, member_id = self._keys[i]
+            yield member_id, -neg
+
+
+class MilestoneIndex:
+    """
+    A bank's amount-roles compiled into a sorted threshold array.
+
+    A milestone is reached when the balance is at least its threshold.
+    """
+
+    __slots__ = ("thresholds", "role_ids")
+
+    def __init__(self, roles: Dict[str, List[int]]) -> None:
+        items = sorted((int(k), v) for k, v in roles.items())
+        self.thresholds: List[int] = [k for k, _ in items]
+        self.role_ids: List[List[int]] = [v for _, v in items]
+
+    def __len__(self) -> int:
+        return len(self.thresholds)
+
+    def crossed(self, before: int, after: int) -> Iterator[int]:
+        """Yield the role IDs of milestones between two balances, lower exclusive."""
+        low, high = sorted((before or 0, after or 0))
+        start = bisect.bisect_right(self.thresholds, low)
+        stop = bisect.bisect_right(self.thresholds, high)
+        for i in range(start, stop):
+            yield from self.role_ids[i]
+
+    def reached(self, amount: int) -> Iterator[int]:
+        """Yield the role IDs of every milestone reached at this balance."""
+        for i in range(bisect.bisect_right(self.thresholds, amount or 0)):
+            yield from self.role_ids[i]
+
+    def all_role_ids(self) -> Set[int]:
+        return {r for ids in self.role_ids for r in ids}
+
+
+class BankStore:
+    """
+    In-memory write-behind cache of every guild's banks.
+
+    Reads are served from memory, writes mark the guild dirty and are flushed to config in batches.
+    """
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self._banks: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        self._dirty: Set[int] = set()
+        self._indexes: Dict[int, Dict[str, DonatorIndex]] = {}
+        self._milestones: Dict[int, Dict[str, MilestoneIndex]] = {}
+        self._choices: Dict[int, List[app_commands.Choice[str]]] = {}
+        self._users: Dict[int, Dict[int, Dict[str, int]]] = {}
+        self._totals: Dict[int, Dict[int, int]] = {}
+        self._revisions: Dict[Tuple[int, str], int] = {}
+        self._clock = 0
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self.ledger: Optional[DonationLedger] = None
+        self.backend: Optional[SQLiteDonatorStore] = None
+        self._rows: Dict[Tuple[int, str, int], Optional[int]] = {}
+        # While migrating, rows are tracked even without a backend so none are missed.
+        self._migrating = False
+
+    async def load(self) -> None:
+        self._banks = {
+            guild_id: data["banks"]
+            for guild_id, data in (await self.config.all_guilds()).items()
+        }
+        if self.backend:
+            donators = await self.backend.load()
+            for guild_id, banks in self._banks.items():
+                for bank_name, bank in banks.items():
+                    bank["donators"] = donators.get(guild_id, {}).get(bank_name, {})
+        self._rows.clear()
+        self._dirty.clear()
+        self._indexes.clear()
+        self._milestones.clear()
+        self._choices.clear()
+        self._users.clear()
+        self._totals.clear()
+        for guild_id, banks in self._banks.items():
+            for bank_name, bank in banks.items():
+                for member_id, amount in bank["donators"].items():
+                    self._index_user(guild_id, bank_name, int(member_id), None, amount)
+
+    def get(self, guild_id: int) -> Dict[str, Dict[str, Any]]:
+        return self._banks.setdefault(guild_id, {})
+
+    def all(self) -> Dict[int, Dict[str, Dict[str, Any]]]:
+        return self._banks
+
+    def mark_dirty(self, guild_id: int) -> None:
+        self._dirty.add(guild_id)
+
+    def index(self, guild_id: int, bank_name: str) -> DonatorIndex:
+        guild_indexes = self._indexes.setdefault(guild_id, {})
+        if (index := guild_indexes.get(bank_name)) is None:
+            index = guild_indexes[bank_name] = DonatorIndex(
+                self.get(guild_id)[bank_name]["donators"]
+            )
+        return index
+
+    def milestones(self, guild_id: int, bank_name: str) -> MilestoneIndex:
+        guild_milestones = self._milestones.setdefault(guild_id, {})
+        if (milestones := guild_milestones.get(bank_name)) is None:
+            milestones = guild_milestones[bank_name] = MilestoneIndex(
+                self.get(guild_id)[bank_name]["roles"]
+            )
+        return milestones
+
+    def choices(self, guild_id: int) -> List[app_commands.Choice[str]]:
+        """Return the prebuilt autocomplete choices of the guild's visible banks."""
+        if (choices := self._choices.get(guild_id)) is None:
+            choices = self._choices[guild_id] = [
+                app_commands.Choice(name=name.title(), value=name)
+                for name, bank in self.get(guild_id).items()
+                if not bank["hidden"]
+            ]
+        return choices
+
+    def invalidate_choices(self, guild_id: int) -> None:
+        """Drop the autocomplete choices after a bank was added, removed or (un)hidden."""
+        self._choices.pop(guild_id, None)
+
+    def set_roles(
+        self, guild_id: int, bank_name: str, roles: Dict[str, List[int]]
+    ) -> None:
+        self.get(guild_id)[bank_name]["roles"] = roles
+        self._milestones.get(guild_id, {}).pop(bank_name, None)
+        self.mark_dirty(guild_id)
+
+    def _index_user(
+        self,
+        guild_id: int,
+        bank_name: str,
+        member_id: int,
+        before: Optional[int],
+        after: Optional[int],
+    ) -> None:
+        """Keep the reverse user index and the visible cross-bank totals in sync."""
+        guilds = self._users.setdefault(member_id, {})
+        banks = guilds.setdefault(guild_id, {})
+        if after is None:
+            banks.pop(bank_name, None)
+            if not banks:
+                del guilds[guild_id]
+            if not guilds:
+                del self._users[member_id]
+        else:
+            banks[bank_name] = after
+        if self.get(guild_id)[bank_name]["hidden"]:
+            return
+        totals = self._totals.setdefault(guild_id, {})
+        if total := totals.get(member_id, 0) - (before or 0) + (after or 0):
+            totals[member_id] = total
+        else:
+            totals.pop(member_id, None)
+
+    def user_banks(self, user_id: int) -> Dict[int, Dict[str, int]]:
+        """Return `{guild_id: {bank_name: amount}}` of every balance a user has."""
+        return self._users.get(user_id, {})
+
+    def member_banks(self, guild_id: int, member_id: int) -> Dict[str, int]:
+        return self._users.get(member_id, {}).get(guild_id, {})
+
+    def member_total(self, guild_id: int, member_id: int) -> int:
+        """Return a member's combined balance over the guild's visible banks."""
+        return self._totals.get(guild_id, {}).get(member_id, 0)
+
+    def set_hidden(self, guild_id: int, bank_name: str, hidden: bool) -> None:
+        bank = self.get(guild_id)[bank_name]
+        if bank["hidden"] != hidden:
+            totals = self._totals.setdefault(guild_id, {})
+            sign = -1 if hidden else 1
+            for member_id, amount in bank["donators"].items():
+                member_id = int(member_id)
+                if total := totals.get(member_id, 0) + sign * amount:
+                    totals[member_id] = total
+                else:
+                    totals.pop(member_id, None)
+            bank["hidden"] = hidden
+        self.touch(guild_id, bank_name)
+        self.invalidate_choices(guild_id)
+        self.mark_dirty(guild_id)
+
+    def revision(self, guild_id: int, bank_name: str) -> int:
+        """Return a number that changes whenever the bank's balances or display change."""
+        return self._revisions.get((guild_id, bank_name), 0)
+
+    def touch(self, guild_id: int, bank_name: str = None) -> None:
+        """Bump the revision of a bank, or of every bank in the guild."""
+        self._clock += 1
+        for name in [bank_name] if bank_name else list(self._banks.get(guild_id, {})):
+            self._revisions[(guild_id, name)] = self._clock
+
+    def invalidate(self, guild_id: int, bank_name: str = None) -> None:
+        """Drop cached indexes after a bank was replaced wholesale."""
+        self.invalidate_choices(guild_id)
+        self.touch(guild_id, bank_name)
+        if bank_name is None:
+            self._indexes.pop(guild_id, None)
+            self._milestones.pop(guild_id, None)
+        else:
+            self._indexes.get(guild_id, {}).pop(bank_name, None)
+            self._milestones.get(guild_id, {}).pop(bank_name, None)
+
+    def set_donation(
+        self,
+        guild_id: int,
+        bank_name: str,
+        member_id: int,
+        amount: Optional[int],
+        *,
+        action: str = None,
+        change: int = None,
+        author_id: int = None,
+        note: str = None,
+    ) -> Optional[int]:
+        """
+        Set a donator's balance, or remove them if amount is None.
+
+        When an action is given the change is also appended to the ledger.
+        Returns the previous balance or None if they had none.
+        """
+        donators: Dict[str, int] = self.get(guild_id)[bank_name]["donators"]
+        key = str(member_id)
+        if amount is None:
+            previous = donators.pop(key, None)
+        else:
+            previous = donators.get(key)
+            donators[key] = amount
+        index = self._indexes.get(guild_id, {}).get(bank_name)
+        if index is not None:
+            index.update(member_id, previous, amount)
+        self._index_user(guild_id, bank_name, member_id, previous, amount)
+        self._track(guild_id, bank_name, member_id, amount)
+        self.touch(guild_id, bank_name)
+        if action and self.ledger:
+            self.ledger.append(
+                guild_id,
+                bank_name,
+                member_id,
+                action,
+                change if change is not None else abs((amount or 0) - (previous or 0)),
+                previous or 0,
+                amount,
+                author_id,
+                note,
+            )
+        return previous
+
+    def replace_donators(
+        self, guild_id: int, bank_name: str, donators: Dict[str, int]
+    ) -> None:
+        bank = self.get(guild_id)[bank_name]
+        for member_id, amount in bank["donators"].items():
+            self._index_user(guild_id, bank_name, int(member_id), amount, None)
+            self._track(guild_id, bank_name, int(member_id), None)
+        bank["donators"] = donators
+        for member_id, amount in donators.items():
+            self._index_user(guild_id, bank_name, int(member_id), None, amount)
+            self._track(guild_id, bank_name, int(member_id), amount)
+        self.invalidate(guild_id, bank_name)
+        self.mark_dirty(guild_id)
+
+    def _track(
+        self, guild_id: int, bank_name: str, member_id: int, amount: Optional[int]
+    ) -> None:
+        """Queue a donator row for the SQLite backend, or the guild's blob for config."""
+        if self.backend or self._migrating:
+            self._rows[(guild_id, bank_name, member_id)] = amount
+        if not self.backend:
+            self.mark_dirty(guild_id)
+
+    def reset_donators(
+        self, guild_id: int, bank_name: str, author_id: int = None
+    ) -> None:
+        self.replace_donators(guild_id, bank_name, {})
+        if self.ledger:
+            self.ledger.append(guild_id, bank_name, 0, "resetbank", 0, 0, 0, author_id)
+
+    def lock(self, guild_id: int) -> asyncio.Lock:
+        if (lock := self._locks.get(guild_id)) is None:
+            lock = self._locks[guild_id] = asyncio.Lock()
+        return lock
+
+    async def transact(
+        self,
+        guild_id: int,
+        bank_name: str,
+        member_id: int,
+        d_type: Literal["add", "remove", "set"],
+        amount: int,
+        author_id: int = None,
+        note: str = None,
+    ) -> DonationResult:
+        """
+        Apply a balance mutation atomically for the guild and commit it.
+
+        Transactions on the same guild are serialized in arrival order. Side effects such as role
+        edits, replies and log messages belong outside, after this returns.
+        """
+        async with self.lock(guild_id):
+            bank = self.get(guild_id)[bank_name]
+            previous = bank["donators"].get(str(member_id), 0)
+            amount, new, updated, multi = self._compute(bank, previous, d_type, amount)
+            self.set_donation(
+                guild_id,
+                bank_name,
+                member_id,
+                new,
+                action=d_type,
+                change=amount,
+                author_id=author_id,
+                note=note,
+            )
+            return DonationResult(
+                d_type=d_type,
+                bank_name=bank_name,
+                member_id=member_id,
+                amount=amount,
+                previous=previous,
+                updated=updated,
+                multi=multi,
+                emoji=bank["emoji"],
+                milestones=self.milestones(guild_id, bank_name),
+            )
+
+    async def transact_many(
+        self,
+        guild_id: int,
+        rows: List[Tuple[int, str, int, Literal["add", "remove", "set"], int]],
+        author_id: int = None,
+        note: str = None,
+    ) -> List[DonationResult]:
+        """
+        Apply many `(line, bank_name, member_id, d_type, amount)` rows as one transaction.
+
+        Every row is validated against the running balances first, if any row fails nothing is
+        applied and a TransactionFailure listing the failed lines is raised.
+        """
+        async with self.lock(guild_id):
+            banks = self.get(guild_id)
+            balances: Dict[Tuple[str, int], int] = {}
+            planned = []
+            errors = []
+            for line, bank_name, member_id, d_type, amount in rows:
+                bank = banks.get(bank_name)
+                if bank is None:
+                    errors.append(f'Line {line}: Bank "{bank_name}" does not exist.')
+                    continue
+                key = (bank_name, member_id)
+                previous = balances.get(key, bank["donators"].get(str(member_id), 0))
+                try:
+                    change, new, updated, multi = self._compute(
+                        bank, previous, d_type, amount
+                    )
+                except TransactionFailure as e:
+                    errors.append(f"Line {line}: {e}")
+                    continue
+                balances[key] = updated
+                planned.append(
+                    (
+                        bank_name,
+                        member_id,
+                        d_type,
+                        change,
+                        previous,
+                        new,
+                        updated,
+                        multi,
+                    )
+                )
+            if errors:
+                raise TransactionFailure("\n".join(errors))
+            results = []
+            for (
+                bank_name,
+                member_id,
+                d_type,
+                change,
+                prev,
+                new,
+                updated,
+                multi,
+            ) in planned:
+                self.set_donation(
+                    guild_id,
+                    bank_name,
+                    member_id,
+                    new,
+                    action=d_type,
+                    change=change,
+                    author_id=author_id,
+                    note=note,
+                )
+                results.append(
+                    DonationResult(
+                        d_type=d_type,
+                        bank_name=bank_name,
+                        member_id=member_id,
+                        amount=change,
+                        previous=prev,
+                        updated=updated,
+                        multi=multi,
+                        emoji=banks[bank_name]["emoji"],
+                        milestones=self.milestones(guild_id, bank_name),
+                    )
+                )
+            return results
+
+    @staticmethod
+    def _compute(
+        bank: Dict[str, Any], previous: int, d_type: str, amount: int
+    ) -> Tuple[int, Optional[int], int, Optional[float]]:
+        """Return `(amount, new, updated, multi)` for a mutation, new is None to remove."""
+        if bank["hidden"]:
+            raise TransactionFailure("This bank is hidden.")
+        multi = None
+        if d_type == "add":
+            if multi := bank.get("multi"):
+                amount = round(amount * multi)
+            if amount > 999999999999999:
+                raise TransactionFailure(
+                    "The amount you provided is way too high, consider adding something reasonable.",
+                    ephemeral=True,
+                )
+            updated = new = previous + amount
+        elif d_type == "remove":
+            if not previous:
+                raise TransactionFailure(
+                    "This member has 0 donation balance for this bank."
+                )
+            new = previous - amount
+            updated = max(new, 0)
+            if new < 0:
+                new = None
+        else:
+            updated = new = amount
+        return amount, new, updated, multi
+
+    def drop(self, guild_id: int) -> None:
+        self.touch(guild_id)
+        for bank in self._banks.get(guild_id, {}).values():
+            for member_id in bank["donators"]:
+                guilds = self._users.get(int(member_id), {})
+                guilds.pop(guild_id, None)
+                if not guilds:
+                    self._users.pop(int(member_id), None)
+        self._totals.pop(guild_id, None)
+        self._banks.pop(guild_id, None)
+        self._rows = {k: v for k, v in self._rows.items() if k[0] != guild_id}
+        self._dirty.discard(guild_id)
+        self._indexes.pop(guild_id, None)
+        self._milestones.pop(guild_id, None)
+        self._choices.pop(guild_id, None)
+
+    def clear(self) -> None:
+        for guild_id in list(self._banks):
+            self.touch(guild_id)
+        self._banks.clear()
+        self._rows.clear()
+        self._dirty.clear()
+        self._indexes.clear()
+        self._milestones.clear()
+        self._choices.clear()
+        self._users.clear()
+        self._totals.clear()
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._dirty or self._rows)
+
+    async def flush(self) -> None:
+        dirty, self._dirty = self._dirty, set()
+        failed = set()
+        for guild_id in dirty:
+            banks = self._banks.get(guild_id, {})
+            if self.backend:
+                # Donators live in SQLite, config only keeps the bank settings.
+                banks = {k: {**v, "donators": {}} for k, v in banks.items()}
+            try:
+                await self.config.guild_from_id(guild_id).banks.set(banks)
+            except Exception:
+                failed.add(guild_id)
+        if self.backend and self._rows:
+            rows, self._rows = self._rows, {}
+            try:
+                await self.backend.apply(rows)
+            except Exception as e:
+                self._rows = rows | self._rows
+                raise RuntimeError(
+                    f"Failed to flush {len(rows)} donator row(s), they will be retried."
+                ) from e
+        if failed:
+            self._dirty |= failed
+            raise RuntimeError(
+                f"Failed to flush banks for {len(failed)} guild(s), they will be retried."
+            )
+
+    async def migrate(
+        self,
+        backend: Optional[SQLiteDonatorStore],
+        commit: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """
+        Move every donator to the SQLite backend, or back to config when backend is None.
+
+        The in-memory banks are written in full to the new storage, then `commit` records the
+        switch, and only after that are donators stripped from the old storage. If anything
+        before the commit fails the old backend stays in use and the error is raised.
+        """
+        old = self.backend
+        await self.flush()
+        self._migrating = True
+        try:
+            if backend:
+                await backend.replace_all(self._banks)
+            else:
+                self.backend = None
+                self._dirty |= set(self._banks)
+                await self.flush()
+            await commit()
+        except BaseException:
+            self.backend = old
+            if not old:
+                self._rows.clear()
+            raise
+        finally:
+            self._migrating = False
+        self.backend = backend
+        if backend:
+            # Rows changed while copying are applied here, along with stripping config.
+            self._dirty |= set(self._banks)
+        else:
+            self._rows.clear()
+        await self.flush()
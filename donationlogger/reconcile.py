@@ -0,0 +1,175 @@
+import asyncio
+import bisect
+import discord
+import time
+
+from redbot.core.utils import mod
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .objects import MilestoneIndex
+
+if TYPE_CHECKING:
+    from . import DonationLogger
+
+
+BATCH_SIZE = 25
+MAX_IN_FLIGHT = 4
+
+
+class RoleReconciler:
+    """
+    Background job that brings a bank's donators' amount-roles in line with their balances.
+
+    Donators are walked in member ID order and progress is saved to config after every batch,
+    so the job resumes from the last saved member after a cog reload.
+    """
+
+    def __init__(
+        self, cog: "DonationLogger", guild: discord.Guild, state: Dict[str, Any]
+    ) -> None:
+        self.cog = cog
+        self.guild = guild
+        self.state = state
+        self.task: Optional[asyncio.Task] = None
+        self._session_start = time.monotonic()
+        self._session_done = state["done"]
+        self._semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    @classmethod
+    def new(
+        cls,
+        cog: "DonationLogger",
+        guild: discord.Guild,
+        bank_name: str,
+        author_id: int,
+    ) -> "RoleReconciler":
+        donators = cog.bank_store.get(guild.id)[bank_name]["donators"]
+        state = {
+            "bank": bank_name,
+            "author": author_id,
+            "cursor": 0,
+            "total": len(donators),
+            "done": 0,
+            "changed": 0,
+            "failed": 0,
+            "started": round(time.time()),
+        }
+        return cls(cog, guild, state)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left at the current rate, or None until a batch has completed."""
+        done = self.state["done"] - self._session_done
+        if done <= 0:
+            return None
+        rate = (time.monotonic() - self._session_start) / done
+        return max(self.state["total"] - self.state["done"], 0) * rate
+
+    def start(self) -> asyncio.Task:
+        self.task = asyncio.create_task(self.run())
+        return self.task
+
+    def cancel(self) -> None:
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+    async def save(self) -> None:
+        await self.cog.config.guild(self.guild).reconcile.set(self.state)
+
+    async def run(self) -> None:
+        bank_name = self.state["bank"]
+        try:
+            bank = self.cog.bank_store.get(self.guild.id).get(bank_name)
+            member_ids = sorted(int(k) for k in bank["donators"]) if bank else []
+            start = bisect.bisect_right(member_ids, self.state["cursor"])
+            for i in range(start, len(member_ids), BATCH_SIZE):
+                bank = self.cog.bank_store.get(self.guild.id).get(bank_name)
+                if bank is None:
+                    break
+                batch = member_ids[i : i + BATCH_SIZE]
+                milestones = self.cog.bank_store.milestones(self.guild.id, bank_name)
+                managed = milestones.all_role_ids()
+                results = await asyncio.gather(
+                    *(
+                        self.reconcile_member(
+                            member_id,
+                            bank["donators"].get(str(member_id), 0),
+                            milestones,
+                            managed,
+                        )
+                        for member_id in batch
+                    )
+                )
+                self.state["cursor"] = batch[-1]
+                self.state["done"] += len(batch)
+                self.state["total"] = max(self.state["total"], self.state["done"])
+                self.state["changed"] += results.count(True)
+                self.state["failed"] += results.count(None)
+                await self.save()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.cog.log.exception(
+                f"Amount-role reconciliation failed in guild {self.guild.id}.",
+                exc_info=e,
+            )
+            return
+        await self.cog.config.guild(self.guild).reconcile.clear()
+        if self.cog.reconcilers.get(self.guild.id) is self:
+            del self.cog.reconcilers[self.guild.id]
+        self.cog.log.info(
+            f"Amount-role reconciliation of bank {bank_name} in guild {self.guild.id} finished, "
+            f"{self.state['changed']} member(s) updated."
+        )
+
+    async def reconcile_member(
+        self, member_id: int, balance: int, milestones: MilestoneIndex, managed: set
+    ) -> Optional[bool]:
+        """Return True if roles were changed, False if none were needed, None on failure."""
+        member = self.guild.get_member(member_id)
+        if not member:
+            return False
+        top_role = self.guild.me.top_role
+        target = {
+            role_id
+            for role_id in milestones.reached(balance)
+            if (role := self.guild.get_role(role_id)) and role < top_role
+        }
+        current = {role.id: role for role in member.roles[1:]}
+        to_add = target - current.keys()
+        to_remove = {
+            role_id
+            for role_id in (managed & current.keys()) - target
+            if current[role_id] < top_role
+        }
+        if not to_add and not to_remove:
+            return False
+        author = self.guild.get_member(self.state["author"])
+        reason = mod.get_audit_reason(
+            author=author or self.guild.me,
+            reason="Amount-role reconciliation after donation milestones changed.",
+        )
+        # Only the managed roles that changed are sent, so roles that other bots or
+        # moderators edit in the meantime are left alone.
+        changes = (
+            (member.add_roles, [self.guild.get_role(role_id) for role_id in to_add]),
+            (member.remove_roles, [current[role_id] for role_id in to_remove]),
+        )
+        async with self._semaphore:
+            for action, roles in changes:
+                if roles and not await self._edit_roles(action, roles, reason):
+                    return None
+        return True
+
+    @staticmethod
+    async def _edit_roles(action, roles: List[discord.Role], reason: str) -> bool:
+        for _ in range(3):
+            try:
+                await action(*roles, reason=reason)
+                return True
+            except discord.HTTPException as e:
+                if e.status != 429:
+                    return False
+                await asyncio.sleep(float(e.response.headers.get("Retry-After", 1)))
+        return False
@@ -0,0 +1,125 @@
+import asyncio
+import sqlite3
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS donators (
+    guild_id INTEGER NOT NULL,
+    bank TEXT NOT NULL,
+    member_id INTEGER NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (guild_id, bank, member_id)
+);
+-- Rankings are served from the in-memory DonatorIndex, rows are only ever read in full on load.
+DROP INDEX IF EXISTS ix_donators_amount;
+DROP INDEX IF EXISTS ix_donators_member;
+"""
+
+
+class SQLiteDonatorStore:
+    """
+    Optional SQLite storage for donator balances, one row per donator per bank.
+
+    Bank settings stay in config, only the donators move here so a donation is a single-row
+    upsert instead of a rewrite of the guild's whole banks blob.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection = None
+        self._lock = asyncio.Lock()
+
+    async def open(self) -> None:
+        def _open():
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            return conn
+
+        self._conn = await asyncio.to_thread(_open)
+
+    async def close(self) -> None:
+        if self._conn:
+            async with self._lock:
+                await asyncio.to_thread(self._conn.close)
+            self._conn = None
+
+    async def _run(self, func, *args):
+        async with self._lock:
+            return await asyncio.to_thread(func, *args)
+
+    async def load(self) -> Dict[int, Dict[str, Dict[str, int]]]:
+        """Return `{guild_id: {bank: {member_id: amount}}}` for every stored donator."""
+
+        def _read():
+            data: Dict[int, Dict[str, Dict[str, int]]] = {}
+            for guild_id, bank, member_id, amount in self._conn.execute(
+                "SELECT guild_id, bank, member_id, amount FROM donators"
+            ):
+                data.setdefault(guild_id, {}).setdefault(bank, {})[
+                    str(member_id)
+                ] = amount
+            return data
+
+        return await self._run(_read)
+
+    async def apply(self, changes: Dict[Tuple[int, str, int], Optional[int]]) -> None:
+        """Upsert or, when the amount is None, delete each `(guild_id, bank, member_id)` row."""
+        upserts: List[tuple] = []
+        deletes: List[tuple] = []
+        for (guild_id, bank, member_id), amount in changes.items():
+            if amount is None:
+                deletes.append((guild_id, bank, member_id))
+            else:
+                upserts.append((guild_id, bank, member_id, amount))
+
+        def _write():
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO donators VALUES (?, ?, ?, ?) ON CONFLICT "
+                    "(guild_id, bank, member_id) DO UPDATE SET amount = excluded.amount",
+                    upserts,
+                )
+                self._conn.executemany(
+                    "DELETE FROM donators WHERE guild_id = ? AND bank = ? AND member_id = ?",
+                    deletes,
+                )
+
+        await self._run(_write)
+
+    async def replace_all(self, data: Dict[int, Dict[str, Dict[str, int]]]) -> None:
+        """Replace every stored donator, used when migrating from config."""
+
+        def _write(rows: List[Tuple[int, str, int, int]]):
+            with self._conn:
+                self._conn.execute("DELETE FROM donators")
+                self._conn.executemany("INSERT INTO donators VALUES (?, ?, ?, ?)", rows)
+
+        # The rows are read out on the event loop so donations running meanwhile can not
+        # change the banks while the worker thread is writing them.
+        async with self._lock:
+            rows = [
+                (guild_id, bank_name, int(member_id), amount)
+                for guild_id, banks in data.items()
+                for bank_name, bank in banks.items()
+                for member_id, amount in bank["donators"].items()
+            ]
+            await asyncio.to_thread(_write, rows)
+
+    async def delete_guild(self, guild_id: int = None) -> None:
+        """Delete a guild's donators, or every guild's when no guild is given."""
+
+        def _write():
+            with self._conn:
+                if guild_id is None:
+                    self._conn.execute("DELETE FROM donators")
+                else:
+                    self._conn.execute(
+                        "DELETE FROM donators WHERE guild_id = ?", (guild_id,)
+                    )
+
+        await self._run(_write)
@@ -1,9 +1,14 @@
+import asyncio
+import csv
 import discord
+import io
+import json
 import noobutils as nu
+import re
 
 from redbot.core.bot import commands
 
-from typing import Dict, List, Union
+from typing import Dict, IO, Iterator, List, Tuple, TYPE_CHECKING, Union
 
 from .converters import AmountConverter, DLEmojiConverter
 from .exceptions import (
@@ -11,6 +16,9 @@ from .exceptions import (
     MoreThanThreeRoles,
 )
 
+if TYPE_CHECKING:
+    from .objects import BankStore
+
 
 async def verify_channel(
     context: commands.Context, argument: str
@@ -72,3 +80,101 @@ async def verify_amount_roles(
             except AmountConversionFailure:
                 continue
     return dict(sorted(par.items(), key=lambda b: int(b[0])))
+
+
+async def parse_donation_csv(
+    context: commands.Context, banks: Dict[str, dict], content: str
+) -> Tuple[List[Tuple[int, str, int, str, int]], List[str]]:
+    """
+    Parse `member,bank,amount[,type]` rows where type is add, remove or set. (default add)
+
+    Returns the parsed `(line, bank_name, member_id, d_type, amount)` rows and the errors.
+    A first row that does not have a valid amount is treated as a header.
+    """
+    rows, errors = [], []
+    for line, row in enumerate(csv.reader(io.StringIO(content)), 1):
+        row = [col.strip() for col in row]
+        if not any(row):
+            continue
+        if len(row) < 3:
+            errors.append(f"Line {line}: Expected at least member, bank and amount.")
+            continue
+        raw_member, bank_name, raw_amount = row[0], row[1].lower(), row[2]
+        d_type = row[3].lower() if len(row) > 3 and row[3] else "add"
+        try:
+            amount = await AmountConverter.convert(context, raw_amount)
+        except AmountConversionFailure as e:
+            if line == 1:
+                continue
+            errors.append(f"Line {line}: {e}")
+            continue
+        if match := re.fullmatch(r"<@!?(\d+)>|(\d{15,21})", raw_member):
+            member = context.guild.get_member(int(match[1] or match[2]))
+        else:
+            member = context.guild.get_member_named(raw_member)
+        if not member:
+            errors.append(f'Line {line}: Member "{raw_member}" not found.')
+        elif member.bot:
+            errors.append(f"Line {line}: Bots are prohibited from donations.")
+        elif bank_name not in banks:
+            errors.append(f'Line {line}: Bank "{row[1]}" does not exist.')
+        elif d_type not in ("add", "remove", "set"):
+            errors.append(f'Line {line}: Unknown type "{row[3]}".')
+        else:
+            rows.append((line, bank_name, member.id, d_type, amount))
+    return rows, errors
+
+
+def iter_export_rows(
+    guild: discord.Guild,
+    store: "BankStore",
+    bank_names: List[str],
+    with_names: bool = False,
+) -> Iterator[Dict[str, Union[int, str]]]:
+    """Yield one row per donator of the given banks, highest amount first."""
+    for bank_name in bank_names:
+        index = store.index(guild.id, bank_name)
+        # A copy, so donations made while the export is being written can not shift the walk.
+        for member_id, amount in index.top(len(index)):
+            row = {"bank": bank_name, "member_id": member_id, "amount": amount}
+            if with_names:
+                # Cache only, exports never fetch members from the API.
+                member = guild.get_member(member_id)
+                row["name"] = str(member) if member else ""
+            yield row
+
+
+def iter_export_lines(
+    rows: Iterator[Dict[str, Union[int, str]]], fmt: str, with_names: bool = False
+) -> Iterator[str]:
+    if fmt == "jsonl":
+        for row in rows:
+            yield json.dumps(row, ensure_ascii=False) + "\n"
+        return
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["bank", "member_id", "amount"] + (["name"] if with_names else []))
+    for row in rows:
+        writer.writerow(row.values())
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def write_in_chunks(
+    lines: Iterator[str], fp: IO[bytes], chunk_size: int = 1000
+):
+    """
+    Write lines to a binary file, encoding and flushing them `chunk_size` at a time.
+
+    Lines are built on the event loop and each chunk is written in a worker thread, so a large
+    export does not block the bot while it is written.
+    """
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            await asyncio.to_thread(fp.write, "".join(chunk).encode("utf-8"))
+            chunk.clear()
+    await asyncio.to_thread(fp.write, "".join(chunk).encode("utf-8"))
@@ -1,14 +1,16 @@
 import asyncio
 import contextlib
 import discord
+import math
 import noobutils as nu
 
 from redbot.core.bot import commands, Red
 from redbot.core.utils import chat_formatting as cf
 
-from typing import Dict, List, TYPE_CHECKING, Union
+from typing import Dict, List, Tuple, TYPE_CHECKING, Union
 
 from .exceptions import MoreThanThreeRoles
+from .objects import DonatorIndex, Invocation
 from .utilities import verify_amount_roles, verify_channel, verify_emoji, verify_roles
 
 if TYPE_CHECKING:
@@ -311,15 +313,16 @@ class DonationLoggerSetupView(discord.ui.View):
         if not view.value:
             return
         config = self.cog.config.guild
-        async with config(interaction.guild).banks() as banks:
-            banks |= {
-                self.bank["name"].lower(): {
-                    "hidden": False,
-                    "emoji": str(self.bank["emoji"]),
-                    "roles": {},
-                    "donators": {},
-                }
+        banks = self.cog.bank_store.get(interaction.guild.id)
+        banks |= {
+            self.bank["name"].lower(): {
+                "hidden": False,
+                "emoji": str(self.bank["emoji"]),
+                "roles": {},
+                "donators": {},
             }
+        }
+        self.cog.bank_store.invalidate(interaction.guild.id, self.bank["name"].lower())
         async with config(interaction.guild).managers() as managers:
             managers: list = managers
             for j in self.manager_roles:
@@ -329,11 +332,15 @@ class DonationLoggerSetupView(discord.ui.View):
         if self.log_channel:
             await config(interaction.guild).log_channel.set(self.log_channel.id)
         if self.amount_roles:
-            async with config(interaction.guild).banks() as banks:
-                banks[self.bank["name"].lower()]["roles"] |= {
-                    k: [r.id for r in v] for k, v in self.amount_roles.items()
-                }
+            self.cog.bank_store.set_roles(
+                interaction.guild.id,
+                self.bank["name"].lower(),
+                {k: [r.id for r in v] for k, v in self.amount_roles.items()},
+            )
+        self.cog.bank_store.mark_dirty(interaction.guild.id)
+        await self.cog.flush_banks()
         await config(interaction.guild).setup.set(True)
+        self.cog.invalidate_guild_settings(interaction.guild.id)
         for x in self.children:
             x.disabled = True
         await self.message.edit(view=self)
@@ -377,9 +384,11 @@ class TotalDonoView(discord.ui.View):
         self.member: discord.Member = None
         self.message: discord.Message = None
 
-    async def start(self, context: commands.Context, member: discord.Member, **kwargs):
-        ref = context.message.to_reference(fail_if_not_exists=False)
-        kwargs.update(mention_author=False, view=self, reference=ref)
+    async def start(self, context: Invocation, member: discord.Member, **kwargs):
+        if context.message:
+            ref = context.message.to_reference(fail_if_not_exists=False)
+            kwargs.update(mention_author=False, reference=ref)
+        kwargs.update(view=self)
         msg = await context.send(**kwargs)
         self.message = msg
         self.member = member
@@ -388,41 +397,183 @@ class TotalDonoView(discord.ui.View):
     async def total_dono(
         self, interaction: discord.Interaction[Red], button: discord.ui.Button
     ):
-        final = {}
-        final_overall = []
-        async with self.cog.config.guild(interaction.guild).banks() as banks:
-            for k, v in banks.items():
-                if v["hidden"]:
-                    continue
-                donations = v["donators"].setdefault(str(self.member.id), 0)
-                final[k] = f"{v['emoji']} {cf.humanize_number(donations)}"
-                final_overall.append(donations)
-
-        overall = sum(final_overall)
+        embed = await self.cog.get_all_bank_member_dono(interaction.guild, self.member)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    async def on_timeout(self):
+        for x in self.children:
+            x.disabled = True
+        await self.message.edit(view=self)
+        self.stop()
+
+
+class DonatorPageSource:
+    """
+    Renders pages of a bank's donators straight from its ordered index.
+
+    Only the rows of the requested page are formatted, so any page of a huge bank costs the same.
+    """
+
+    per_page = 15
+
+    def __init__(
+        self,
+        guild: discord.Guild,
+        index: DonatorIndex,
+        *,
+        title: str,
+        colour: discord.Colour,
+        viewer_id: int,
+        at_least: int = None,
+        less_than: int = None,
+        empty: str = "There are no donators in this bank yet.",
+    ) -> None:
+        self.guild = guild
+        self.index = index
+        self.title = title
+        self.colour = colour
+        self.viewer_id = viewer_id
+        self.at_least = at_least
+        self.less_than = less_than
+        self.empty = empty
+
+    def bounds(self) -> Tuple[int, int]:
+        if self.less_than is not None:
+            return self.index.count_at_least(self.less_than), len(self.index)
+        if self.at_least is not None:
+            return 0, self.index.count_at_least(self.at_least)
+        return 0, len(self.index)
+
+    @property
+    def page_count(self) -> int:
+        start, stop = self.bounds()
+        return max(math.ceil((stop - start) / self.per_page), 1)
+
+    def format_page(self, page: int) -> discord.Embed:
+        start, stop = self.bounds()
+        rows = []
+        for offset in range(
+            page * self.per_page, min((page + 1) * self.per_page, stop - start)
+        ):
+            # Less-than listings go from the lowest amount up.
+            position = (
+                stop - 1 - offset if self.less_than is not None else start + offset
+            )
+            member_id, amount = self.index[position]
+            member = self.guild.get_member(member_id)
+            e = "➡️ " if member_id == self.viewer_id else ""
+            rows.append(
+                f"{e}{offset + 1}. {member.mention} (`{member_id}`): **{cf.humanize_number(amount)}**"
+                if member
+                else f"{offset + 1}. [Member not found in guild] (`{member_id}`): "
+                f"**{cf.humanize_number(amount)}**"
+            )
         embed = discord.Embed(
-            description=f"Overall combined bank donation amount: {cf.humanize_number(overall)}",
-            timestamp=discord.utils.utcnow(),
-            colour=self.member.colour,
-        )
-        embed.set_author(
-            name=f"{self.member} ({self.member.id})",
-            icon_url=nu.is_have_avatar(self.member),
+            title=self.title,
+            description="\n".join(rows or [self.empty]),
+            colour=self.colour,
         )
         embed.set_footer(
-            text=f"{interaction.guild.name} admires your donations!",
-            icon_url=nu.is_have_avatar(interaction.guild),
+            text=f"{self.guild.name} | Page ({page + 1}/{self.page_count})",
+            icon_url=nu.is_have_avatar(self.guild),
         )
-        if final:
-            for k, v in final.items():
-                embed.add_field(name=k.title(), value=v, inline=True)
+        return embed
+
+
+class PageJumpModal(discord.ui.Modal, title="Jump to page"):
+    page = discord.ui.TextInput(label="Page number", max_length=10)
+
+    def __init__(self, paginator: "LazyPaginator"):
+        super().__init__()
+        self.paginator = paginator
+
+    async def on_submit(self, interaction: discord.Interaction[Red]):
+        try:
+            page = int(self.page.value) - 1
+        except ValueError:
+            return await interaction.response.send_message(
+                content="That is not a valid page number.", ephemeral=True
+            )
+        await self.paginator.show_page(interaction, page)
+
+
+class LazyPaginator(discord.ui.View):
+    def __init__(self, source: DonatorPageSource, timeout: float = 60.0):
+        super().__init__(timeout=timeout)
+        self.source = source
+        self.page = 0
+        self.author_id: int = None
+        self.message: discord.Message = None
+
+    async def start(self, obj: Union[commands.Context, discord.Interaction[Red]]):
+        self.update_buttons()
+        embed = self.source.format_page(self.page)
+        if isinstance(obj, commands.Context):
+            self.author_id = obj.author.id
+            self.message = await obj.send(embed=embed, view=self)
+            return
+        self.author_id = obj.user.id
+        if obj.response.is_done():
+            self.message = await obj.followup.send(embed=embed, view=self, wait=True)
         else:
-            embed.description = (
-                "There are no banks registered yet, or banks are hidden."
+            await obj.response.send_message(embed=embed, view=self)
+            self.message = await obj.original_response()
+
+    def update_buttons(self):
+        count = self.source.page_count
+        self.page_button.label = f"{self.page + 1}/{count}"
+        self.first_button.disabled = self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = self.last_button.disabled = self.page >= count - 1
+        self.page_button.disabled = count == 1
+
+    async def show_page(self, interaction: discord.Interaction[Red], page: int):
+        self.page = min(max(page, 0), self.source.page_count - 1)
+        self.update_buttons()
+        await interaction.response.edit_message(
+            embed=self.source.format_page(self.page), view=self
+        )
+
+    async def interaction_check(self, interaction: discord.Interaction[Red]) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                content="You are not the author of this interaction.", ephemeral=True
             )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(emoji="⏪", style=nu.get_button_colour("grey"))
+    async def first_button(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, 0)
+
+    @discord.ui.button(emoji="◀️", style=nu.get_button_colour("grey"))
+    async def previous_button(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.page - 1)
+
+    @discord.ui.button(label="1/1", style=nu.get_button_colour("grey"))
+    async def page_button(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await interaction.response.send_modal(PageJumpModal(self))
+
+    @discord.ui.button(emoji="▶️", style=nu.get_button_colour("grey"))
+    async def next_button(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.page + 1)
+
+    @discord.ui.button(emoji="⏩", style=nu.get_button_colour("grey"))
+    async def last_button(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.source.page_count - 1)
 
     async def on_timeout(self):
         for x in self.children:
             x.disabled = True
-        await self.message.edit(view=self)
+        with contextlib.suppress(discord.HTTPException):
+            await self.message.edit(view=self)
         self.stop()
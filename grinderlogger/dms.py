@@ -0,0 +1,128 @@
+import asyncio
+import discord
+import time
+
+from collections import Counter, deque
+from typing import Any, Deque, Dict, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import GrinderLogger
+
+
+DM_RATE = 5
+DM_PER = 5.0
+DM_WORKERS = 3
+CLOSED_DM_TTL = 6 * 60 * 60
+
+
+class DMQueue:
+    """
+    Background queue that delivers member DMs no faster than `DM_RATE` every `DM_PER` seconds.
+
+    Up to `DM_WORKERS` DMs are in flight at once. Users whose DMs turned out to be closed are
+    skipped for `CLOSED_DM_TTL` seconds instead of being retried. `enqueue` returns a future
+    that resolves to whether the DM was delivered, so callers can wait for the outcome or
+    fire and forget.
+    """
+
+    def __init__(
+        self,
+        cog: "GrinderLogger",
+        rate: int = DM_RATE,
+        per: float = DM_PER,
+        workers: int = DM_WORKERS,
+        closed_ttl: float = CLOSED_DM_TTL,
+    ) -> None:
+        self.cog = cog
+        self.rate = rate
+        self.per = per
+        self.workers = workers
+        self.closed_ttl = closed_ttl
+        self.stats: Counter = Counter()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._sent: Deque[float] = deque(maxlen=rate)
+        self._throttle_lock = asyncio.Lock()
+        self._closed: Dict[int, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def closed_count(self) -> int:
+        now = time.monotonic()
+        return sum(expiry > now for expiry in self._closed.values())
+
+    def is_closed(self, user_id: int) -> bool:
+        if (expiry := self._closed.get(user_id)) is None:
+            return False
+        if expiry > time.monotonic():
+            return True
+        del self._closed[user_id]
+        return False
+
+    def enqueue(self, user: discord.abc.User, **kwargs) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((user, kwargs, future))
+        self.stats["queued"] += 1
+        # Finished workers may still be in the set until their done callback runs.
+        if sum(not task.done() for task in self._tasks) < self.workers:
+            task = asyncio.create_task(self._worker())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return future
+
+    def reset(self) -> None:
+        """Clear the delivery counters and the closed DM cache."""
+        self.stats.clear()
+        self._closed.clear()
+
+    def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_result(False)
+
+    async def _worker(self) -> None:
+        while not self._queue.empty():
+            user, kwargs, future = self._queue.get_nowait()
+            try:
+                delivered = await self._deliver(user, kwargs)
+            except Exception as e:
+                self.cog.log.exception(f"Failed to DM user {user.id}.", exc_info=e)
+                self.stats["failed"] += 1
+                delivered = False
+            if not future.done():
+                future.set_result(delivered)
+
+    async def _throttle(self) -> None:
+        async with self._throttle_lock:
+            if len(self._sent) == self.rate:
+                wait = self._sent[0] + self.per - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._sent.append(time.monotonic())
+
+    async def _deliver(self, user: discord.abc.User, kwargs: Dict[str, Any]) -> bool:
+        if self.is_closed(user.id):
+            self.stats["skipped"] += 1
+            return False
+        while True:
+            await self._throttle()
+            try:
+                await user.send(**kwargs)
+                self.stats["sent"] += 1
+                return True
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    self.stats["rate_limited"] += 1
+                    await asyncio.sleep(float(e.response.headers.get("Retry-After", 1)))
+                    continue
+                if e.status == 403:
+                    self._closed[user.id] = time.monotonic() + self.closed_ttl
+                    self.stats["closed"] += 1
+                else:
+                    self.stats["failed"] += 1
+                return False
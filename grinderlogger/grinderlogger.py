@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import datetime as dt
 import discord
@@ -8,9 +9,13 @@ from redbot.core.bot import commands, Red
 from redbot.core.utils import chat_formatting as cf, mod
 
 from discord.ext import tasks
-from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING, Union
+from typing import Dict, List, Literal, Optional, Set, TYPE_CHECKING, Union
 
 from .converters import AmountConverter
+from .dms import DMQueue
+from .objects import Grinder
+from .scheduler import DueScheduler
+from .views import GrinderLeaderboard, GrinderPageSource
 
 if TYPE_CHECKING:
     from donationlogger.donationlogger import DonationLogger
@@ -34,6 +39,7 @@ DEFAULT_MEMBER = {
     "last_time_as_grinder": None,
     "reason_for_left": None
 }
+FLUSH_DELAY = 5
 
 
 class GrinderLogger(nu.Cog):
@@ -58,7 +64,13 @@ class GrinderLogger(nu.Cog):
         self.config.register_member(**DEFAULT_MEMBER)
         self.config.init_custom(group_identifier="Grinders", identifier_count=1)
         self.init_done = False
-        self.data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.data: Dict[int, Dict[int, Grinder]] = {}
+        self.dirty: Dict[int, Set[int]] = {}
+        self.flush_task: Optional[asyncio.Task] = None
+        self.flush_lock = asyncio.Lock()
+        self.scheduler = DueScheduler(self)
+        self.dm_queue = DMQueue(self)
+        self.leaderboards: Dict[int, GrinderLeaderboard] = {}
 
     async def red_delete_data_for_user(
         self,
@@ -69,56 +81,136 @@ class GrinderLogger(nu.Cog):
         """
         This cog stores user ID for grinder logs. Users can remove their data at anytime.
         """
-        for guild_id, grinder_data in self.data.copy().items():
-            if grinder_data:
-                for member_id in grinder_data.keys():
-                    if user_id == int(member_id):
-                        if self.data.get(guild_id, {}).get(member_id):
-                            self.data[guild_id].pop(member_id)
-                        await self.config.member_from_ids(
-                            int(guild_id), int(member_id)
-                        ).clear()
-
-        await self.back_to_config()
+        for guild_id, grinders in self.data.items():
+            if user_id in grinders:
+                self.remove_from_data(guild_id, user_id)
+        await self.flush_data()
 
     async def cog_load(self):
         self.bot.add_dev_env_value("grinderlogger", lambda _: self)
         if self.init_done:
             return
 
-        if data := (await self.config.custom("Grinders").all()).copy():
-            before_time = time.perf_counter()
-            self.data = data
-            after_time = time.perf_counter()
-            self.log.info(
-                f"GrinderLogger data initialized in {round(after_time - before_time, 3)}s."
-            )
+        before_time = time.perf_counter()
+        await self.load_data()
+        after_time = time.perf_counter()
+        self.log.info(
+            f"GrinderLogger data initialized in {round(after_time - before_time, 3)}s."
+        )
 
         self.init_done = True
-        self.due_reminder_loop.start()
+        self.scheduler.start()
         self.save_data_to_config.start()
-        self.log.info("Due reminder loop task and Save data to config task started.")
+        self.log.info("Due reminder scheduler and Save data to config task started.")
 
     async def cog_unload(self):
         self.bot.remove_dev_env_value("grinderlogger")
         self.init_done = False
-        self.due_reminder_loop.cancel()
+        self.scheduler.cancel()
+        self.dm_queue.close()
         self.save_data_to_config.cancel()
-        await self.back_to_config()
-        self.log.info("Due reminder loop task and Save data to config task cancelled.")
+        if self.flush_task:
+            self.flush_task.cancel()
+        await self.flush_data()
+        self.log.info("Due reminder scheduler and Save data to config task cancelled.")
 
-    async def back_to_config(self):
-        old_data = (await self.config.custom("Grinders").all()).copy()
-        old_data.update(self.data)
-        await self.config.custom("Grinders").set(old_data)
+    async def load_data(self):
+        """
+        Load every grinder record, folding in stats still kept in the old per-member config.
 
-    def add_to_data(self, guild_id: str, member_id: str, member_data: dict):
-        self.data.setdefault(guild_id, {})
-        self.data[guild_id].update({member_id: member_data})
+        Member config is cleared once its stats have been saved in the Grinders group.
+        """
+        self.data = {
+            int(guild_id): {
+                int(member_id): Grinder(int(guild_id), int(member_id), **member_data)
+                for member_id, member_data in grinders.items()
+            }
+            for guild_id, grinders in (await self.config.custom("Grinders").all()).items()
+        }
+        legacy = await self.config.all_members()
+        for guild_id, members in legacy.items():
+            for member_id, member_data in members.items():
+                grinder = self.get_record(guild_id, member_id)
+                for key in DEFAULT_MEMBER:
+                    setattr(grinder, key, member_data[key])
+                self.mark_dirty(guild_id, member_id)
+        if legacy:
+            await self.flush_data()
+            if not self.dirty:
+                await self.config.clear_all_members()
+
+    def get_record(self, guild_id: int, member_id: int) -> Grinder:
+        """Return a member's record, creating an inactive one if there is none."""
+        grinders = self.data.setdefault(guild_id, {})
+        if (grinder := grinders.get(member_id)) is None:
+            grinder = grinders[member_id] = Grinder(guild_id, member_id)
+        return grinder
+
+    def get_grinder(self, guild_id: int, member_id: int) -> Optional[Grinder]:
+        """Return a member's record only if they are currently a grinder."""
+        grinder = self.data.get(guild_id, {}).get(member_id)
+        return grinder if grinder and grinder.active else None
+
+    def has_grinders(self, guild_id: int) -> bool:
+        """Return whether a guild has any current grinders, former ones do not count."""
+        return any(grinder.active for grinder in self.data.get(guild_id, {}).values())
+
+    def mark_dirty(self, guild_id: int, member_id: int):
+        """
+        Queue a grinder to be written to config.
 
-    def remove_from_data(self, guild_id: str, member_id: str):
+        Changes made within `FLUSH_DELAY` seconds of each other are written together.
+        """
+        self.dirty.setdefault(guild_id, set()).add(member_id)
+        self.leaderboards.pop(guild_id, None)
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self.delayed_flush())
+
+    async def delayed_flush(self):
+        await asyncio.sleep(FLUSH_DELAY)
+        await self.flush_data()
+
+    async def flush_data(self):
+        """Write only the grinders that changed since the last flush."""
+        async with self.flush_lock:
+            dirty, self.dirty = self.dirty, {}
+            try:
+                for guild_id, member_ids in dirty.items():
+                    group = self.config.custom("Grinders", str(guild_id))
+                    for member_id in list(member_ids):
+                        grinder = self.data.get(guild_id, {}).get(member_id)
+                        try:
+                            if grinder is None:
+                                await group.clear_raw(str(member_id))
+                            else:
+                                await group.set_raw(
+                                    str(member_id), value=grinder.to_dict()
+                                )
+                        except Exception as e:
+                            self.log.exception(
+                                f"Failed to save grinder {member_id} in guild {guild_id}.",
+                                exc_info=e,
+                            )
+                            continue
+                        member_ids.discard(member_id)
+            finally:
+                # Anything not written yet is retried on the next flush.
+                for guild_id, member_ids in dirty.items():
+                    if member_ids:
+                        self.dirty.setdefault(guild_id, set()).update(member_ids)
+
+    def add_to_data(self, guild_id: int, member_id: int, tier: str) -> Grinder:
+        grinder = self.get_record(guild_id, member_id)
+        grinder.join(tier, round(dt.datetime.now(dt.timezone.utc).timestamp()))
+        self.mark_dirty(guild_id, member_id)
+        self.scheduler.schedule(guild_id, member_id)
+        return grinder
+
+    def remove_from_data(self, guild_id: int, member_id: int):
+        """Forget everything stored about a member, used for data deletion requests."""
         with contextlib.suppress(KeyError):
             self.data[guild_id].pop(member_id)
+        self.mark_dirty(guild_id, member_id)
 
     async def add_or_remove_grinder_roles(
         self, _type: str, member: discord.Member, roles: list, reason: str
@@ -135,7 +227,7 @@ class GrinderLogger(nu.Cog):
         await action(*hybrid_roles, reason=reason)
         return hybrid_roles
 
-    async def dm_grinder(
+    def dm_grinder(
         self,
         guild: discord.Guild,
         member: discord.Member,
@@ -182,39 +274,42 @@ class GrinderLogger(nu.Cog):
                 .set_thumbnail(url=nu.is_have_avatar(guild))
                 .set_footer(text=guild.name, icon_url=nu.is_have_avatar(guild))
             )
-        with contextlib.suppress(
-            (discord.errors.Forbidden, discord.errors.HTTPException)
-        ):
-            await member.send(embed=embed)
-
-    async def remind_member(self, guild: discord.Guild, member_id: str):
-        tiers = await self.config.guild(guild).tiers()
-        managers = await self.config.guild(guild).managers()
-        channels = await self.config.guild(guild).channels()
-        mem = guild.get_member(int(member_id))
-        if mem:
-            c = mem.colour
-            av = nu.is_have_avatar(mem)
-        else:
-            c = self.bot._color
-            av = None
-        member_data = self.data[str(guild.id)][member_id]
-        member_data["reminded"] = True
-        await self.back_to_config()
-        tier = member_data.get("tier")
-        man_roles: List[discord.Role] = []
-        for rid in managers:
-            if role := guild.get_role(rid):
-                man_roles.append(role)
-        try:
-            at = f"**{tier}** ({cf.humanize_number(tiers[tier]['amount'])}/day)"
-        except KeyError:
-            at = "It seems this tier is not defined please report this to the admins."
+        self.dm_queue.enqueue(member, embed=embed)
+
+    async def remind_members(self, guild: discord.Guild, due: Dict[int, int]):
+        """
+        Remind every grinder of a guild that fell due in the same scheduler tick.
+
+        Each member is DMed through the DM queue and the managers get a single digest listing
+        all of them, split over several messages only when it does not fit in one embed.
+        The digest does not wait for the DMs, it marks members already known to be unreachable.
+        """
+        settings = await self.config.guild(guild).all()
+        tiers, managers, channels = (
+            settings["tiers"],
+            settings["managers"],
+            settings["channels"],
+        )
         ada = round(dt.datetime.now(dt.timezone.utc).timestamp())
         ad = f"<t:{ada}:R> (<t:{ada}:D>)"
-
-        dms_off = []
-        try:
+        reminded: Dict[int, str] = {}
+        dms_off: Set[int] = set()
+        for member_id in due:
+            if not (grinder := self.get_grinder(guild.id, member_id)):
+                continue
+            grinder.reminded = True
+            self.mark_dirty(guild.id, member_id)
+            try:
+                amt = cf.humanize_number(tiers[grinder.tier]["amount"])
+                at = f"**{grinder.tier}** ({amt}/day)"
+            except KeyError:
+                at = "It seems this tier is not defined please report this to the admins."
+            reminded[member_id] = at
+            if not (mem := guild.get_member(member_id)) or self.dm_queue.is_closed(
+                member_id
+            ):
+                dms_off.add(member_id)
+                continue
             grindembed = discord.Embed(
                 description=(
                     "# 🔔 Grinder Payment Reminder 🔔\n"
@@ -225,45 +320,60 @@ class GrinderLogger(nu.Cog):
                     "⚠️ `Note`: Feel free to pay early!"
                 ),
                 timestamp=dt.datetime.now(dt.timezone.utc),
-                colour=c,
+                colour=mem.colour,
             )
             grindembed.set_thumbnail(url=nu.is_have_avatar(guild))
             grindembed.set_footer(text=guild.name, icon_url=nu.is_have_avatar(guild))
-            await mem.send(embed=grindembed)
-        except (discord.errors.Forbidden, discord.errors.HTTPException, AttributeError):
-            dms_off.append(True)
-        if not channels["notifying"]:
+            self.dm_queue.enqueue(mem, embed=grindembed)
+        if not reminded or not channels["notifying"]:
             return
-        
-        notifchan = guild.get_channel_or_thread(channels["notifying"])
-        with contextlib.suppress(
-            (discord.errors.Forbidden, discord.errors.HTTPException)
-        ):
-            warn = (
-                "⚠️ Warning: I could not DM this member they might have DM's closed."
-                if dms_off
-                else ""
-            )
+        if not (notifchan := guild.get_channel_or_thread(channels["notifying"])):
+            return
+
+        lines = []
+        for member_id, at in reminded.items():
+            line = f"- <@{member_id}> (`{member_id}`): {at}, due <t:{due[member_id]}:R>"
+            if member_id in dms_off:
+                line += " ⚠️"
+            lines.append(line)
+        warn = (
+            "\n\n⚠️ Warning: I could not DM the marked members they might have DM's closed."
+            if dms_off
+            else ""
+        )
+        man_roles = [role for rid in managers if (role := guild.get_role(rid))]
+        pages = list(cf.pagify("\n".join(lines), page_length=3500))
+        for index, page in enumerate(pages, 1):
             adminembed = discord.Embed(
-                colour=c,
+                colour=self.bot._color,
                 description=(
                     "# 🔔 Grinder Manager Reminder 🔔\nHey **Grinder Managers.**\n\n"
-                    f"Notifying you that: <@{member_id}> (`{member_id}`) is due for payment.\n"
+                    f"Notifying you that **{len(reminded)}** grinder(s) are due for payment.\n"
                     "- Please verify their payment status, **update** the grinder log, "
-                    "and ensure their status remains intact.\n\n__**Payment Details**__\n"
-                    f"- `{'Member':<6}`: <@{member_id}>\n- `{'Tier':<6}`: {at}\n"
-                    f"- `{'Date':<6}`: {ad}\n\nThanks for your attention!\n{warn}"
+                    "and ensure their status remains intact.\n\n__**Due Grinders**__\n"
+                    f"{page}\n\nThanks for your attention!{warn}"
                 ),
                 timestamp=dt.datetime.now(dt.timezone.utc),
             )
-            adminembed.set_footer(text=guild.name, icon_url=nu.is_have_avatar(guild))
-            adminembed.set_thumbnail(url=av)
-            with contextlib.suppress(discord.errors.Forbidden):
+            footer = (
+                guild.name
+                if len(pages) == 1
+                else f"{guild.name} • Page {index}/{len(pages)}"
+            )
+            adminembed.set_footer(text=footer, icon_url=nu.is_have_avatar(guild))
+            adminembed.set_thumbnail(url=nu.is_have_avatar(guild))
+            try:
                 await notifchan.send(
-                    content=cf.humanize_list([role.mention for role in man_roles]),
+                    content=(
+                        cf.humanize_list([role.mention for role in man_roles])
+                        if index == 1
+                        else None
+                    ),
                     embed=adminembed,
                     allowed_mentions=discord.AllowedMentions(roles=man_roles),
                 )
+            except discord.HTTPException:
+                return
 
     async def log_grinder_history(
         self,
@@ -371,7 +481,7 @@ class GrinderLogger(nu.Cog):
                 embed=embed,
             )
 
-    async def dm_on_promote_or_demote(
+    def dm_on_promote_or_demote(
         self,
         member: discord.Member,
         _type: str,
@@ -411,10 +521,7 @@ class GrinderLogger(nu.Cog):
         embed.set_footer(
             text=member.guild.name, icon_url=nu.is_have_avatar(member.guild)
         )
-        with contextlib.suppress(
-            discord.errors.HTTPException, discord.errors.Forbidden
-        ):
-            await member.send(embed=embed)
+        self.dm_queue.enqueue(member, embed=embed)
 
     async def send_to_log_channel(
         self,
@@ -431,7 +538,7 @@ class GrinderLogger(nu.Cog):
         if not logchan:
             return
         lchan = context.guild.get_channel_or_thread(logchan)
-        tier = self.data[str(context.guild.id)][str(member.id)]["tier"]
+        tier = self.data[context.guild.id][member.id].tier
         view = discord.ui.View().add_item(
             discord.ui.Button(label="Jump To Command", url=context.message.jump_url)
         )
@@ -473,6 +580,33 @@ class GrinderLogger(nu.Cog):
                 content="⚠️ Log channel not found.", embed=embed, view=view
             )
 
+    async def mirror_to_donationlogger(
+        self,
+        context: commands.Context,
+        d_type: Literal["add", "remove"],
+        bank: str,
+        amount: int,
+        member: discord.Member,
+        note: str = None,
+    ):
+        """Apply a grinder donation to the linked DonationLogger bank, if that cog is loaded."""
+        if not (cog := context.bot.get_cog("DonationLogger")):
+            return
+        n = f"`From GrinderLogger`: {note}" if note else "From GrinderLogger."
+        try:
+            await cog.apply_donation(context, d_type, bank, amount, member, n)
+        except commands.CommandError as e:
+            await context.send(
+                content=f"Could not update the DonationLogger bank "
+                f"**{bank.title()}**: {e}"
+            )
+        except discord.HTTPException as e:
+            # The balance is committed before donation roles are edited.
+            await context.send(
+                content=f"The donation was recorded in the DonationLogger bank "
+                f"**{bank.title()}**, but its donation roles could not be updated: {e}"
+            )
+
     async def donoadd(
         self,
         context: commands.Context,
@@ -488,27 +622,23 @@ class GrinderLogger(nu.Cog):
 
         if member.bot:
             return await context.send(content="Bots are not allowed.")
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
+        if self.has_grinders(context.guild.id):
+            if grinder := self.get_grinder(context.guild.id, member.id):
                 if due_duration:
                     dat = (
-                        dt.datetime.fromtimestamp(
-                            member_data["due_timestamp"], dt.timezone.utc
-                        )
-                        if member_data["due_timestamp"]
+                        dt.datetime.fromtimestamp(grinder.due_timestamp, dt.timezone.utc)
+                        if grinder.due_timestamp
                         else dt.datetime.now(dt.timezone.utc)
                     )
                     stamp = dat + due_duration
-                    member_data["due_timestamp"] = round(stamp.timestamp())
-                if member_data["reminded"]:
-                    member_data["reminded"] = False
-                before = await self.config.member(member).donations()
+                    grinder.due_timestamp = round(stamp.timestamp())
+                grinder.reminded = False
+                before = grinder.donations
                 after = before + amount
-                await self.config.member(member).donations.set(after)
-                member_data["last_payed"] = round(
-                    dt.datetime.now(dt.timezone.utc).timestamp()
-                )
-                await self.back_to_config()
+                grinder.donations = after
+                grinder.last_payed = round(dt.datetime.now(dt.timezone.utc).timestamp())
+                self.mark_dirty(context.guild.id, member.id)
+                self.scheduler.schedule(context.guild.id, member.id)
                 await context.tick()
                 await self.send_to_log_channel(
                     context,
@@ -517,23 +647,13 @@ class GrinderLogger(nu.Cog):
                     after,
                     amount,
                     "added",
-                    member_data["due_timestamp"],
+                    grinder.due_timestamp,
                     note,
                 )
-                if bank and context.bot.get_cog("DonationLogger"):
-                    if cmd := self.bot.get_command("donationlogger add"):
-                        n = (
-                            f"`From GrinderLogger`: {note}"
-                            if note
-                            else "From GrinderLogger."
-                        )
-                        await context.invoke(
-                            cmd,
-                            bank_name=bank,
-                            amount=amount,
-                            member=member,
-                            note=n,
-                        )
+                if bank:
+                    await self.mirror_to_donationlogger(
+                        context, "add", bank, amount, member, note
+                    )
             else:
                 await context.send(content="This member is not a grinder.")
         else:
@@ -553,26 +673,25 @@ class GrinderLogger(nu.Cog):
         if member.bot:
             return await context.send(content="Bots are not allowed.")
         bank = await self.config.guild(context.guild).bank()
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
-                before = await self.config.member(member).donations()
+        if self.has_grinders(context.guild.id):
+            if grinder := self.get_grinder(context.guild.id, member.id):
+                before = grinder.donations
                 if before == 0:
                     return await context.send(
                         content="This grinder has 0 donation amount."
                     )
-                if time_to_remove and member_data["due_timestamp"]:
+                if time_to_remove and grinder.due_timestamp:
                     due_date = dt.datetime.fromtimestamp(
-                        member_data.get("due_timestamp"), dt.timezone.utc
+                        grinder.due_timestamp, dt.timezone.utc
                     )
                     new_date = due_date - time_to_remove
+                    grinder.due_timestamp = round(new_date.timestamp())
                     if new_date < dt.datetime.now(dt.timezone.utc):
-                        member_data["due_timestamp"] = round(new_date.timestamp())
-                        member_data["reminded"] = True
-                    else:
-                        member_data["due_timestamp"] = round(new_date.timestamp())
+                        grinder.reminded = True
                 after = max(before - amount, 0)
-                await self.config.member(member).donations.set(after)
-                await self.back_to_config()
+                grinder.donations = after
+                self.mark_dirty(context.guild.id, member.id)
+                self.scheduler.schedule(context.guild.id, member.id)
                 await context.tick()
                 await self.send_to_log_channel(
                     context,
@@ -581,102 +700,24 @@ class GrinderLogger(nu.Cog):
                     after,
                     amount,
                     "removed",
-                    member_data["due_timestamp"],
+                    grinder.due_timestamp,
                     note,
                 )
-                if bank and context.bot.get_cog("DonationLogger"):
-                    if cmd := self.bot.get_command("donationlogger remove"):
-                        n = (
-                            f"`From GrinderLogger`: {note}"
-                            if note
-                            else "From GrinderLogger."
-                        )
-                        await context.invoke(
-                            cmd,
-                            bank_name=bank,
-                            amount=amount,
-                            member=member,
-                            note=n,
-                        )
+                if bank:
+                    await self.mirror_to_donationlogger(
+                        context, "remove", bank, amount, member, note
+                    )
             else:
                 await context.send(content="This member is not a grinder.")
         else:
             await context.send(content="This guild has no grinders.")
 
-    async def lb_whatever(
-        self,
-        guild: discord.Guild,
-        sort_by: str,
-        all_m: Dict[Union[discord.Member, int], Dict[str, Any]],
-    ) -> List[str]:
-        tiers = await self.config.guild(guild).tiers()
-        all_mem = []
-        if sort_by == "dono":
-            k = lambda x: x[1]["donations"]
-        elif sort_by == "due":
-
-            def check(x):
-                d = x[1]["due"]
-                if d is None:
-                    d = 0
-                return d
-
-            k = check
-        else:
-            k = lambda x: int(x[1]["tier"])
-
-        for index, (mem, mem_dono) in enumerate(
-            sorted(all_m.items(), key=k, reverse=True), 1
-        ):
-            amt = tiers[mem_dono["tier"]]["amount"]
-            if isinstance(mem, discord.Member):
-                t = f"{mem_dono['tier']} ({cf.humanize_number(amt)}/day)"
-                msg = (
-                    f"` {index}. ` {mem.mention} (`{mem.id}`):\n"
-                    f"> - `{f'Tier':<9}`: **{t}**\n"
-                    f"> - `{f'Donations':<9}`: {cf.humanize_number(mem_dono['donations'])}"
-                )
-            else:
-                msg = (
-                    f"` {index}. ` Member not found in guild (`{mem}`):\n"
-                    f"> - `{f'Tier':<9}`: **{t}**\n"
-                    f"> - `{f'Donations':<9}`: {cf.humanize_number(mem_dono['donations'])}"
-                )
-            if mem_dono["due"]:
-                msg += f"\n> - `{f'Due':<9}`: <t:{mem_dono['due']}:R>"
-            all_mem.append(msg)
-        return all_mem
-
-    @tasks.loop(seconds=5)
-    async def due_reminder_loop(self):
-        if not self.init_done:
-            return
-        for guild_id, grinder_data in self.data.copy().items():
-            if guild := self.bot.get_guild(int(guild_id)):
-                for member_id in grinder_data.keys():
-                    if member_data := self.data.get(guild_id, {}).get(member_id):
-                        if (
-                            not member_data["reminded"]
-                            and member_data["due_timestamp"]
-                            and (
-                                dt.datetime.fromtimestamp(
-                                    member_data["due_timestamp"], dt.timezone.utc
-                                )
-                                < dt.datetime.now(dt.timezone.utc)
-                            )
-                        ):
-                            try:
-                                await self.remind_member(guild, member_id)
-                            except Exception as e:
-                                self.log.exception(str(e), exc_info=e)
-
     @tasks.loop(minutes=5)
     async def save_data_to_config(self):
-        if not self.init_done:
+        if not self.init_done or not self.dirty:
             return
-        await self.back_to_config()
+        await self.flush_data()
 
-    @due_reminder_loop.before_loop
     @save_data_to_config.before_loop
     async def tasks_before_loop(self):
         await self.bot.wait_until_red_ready()
@@ -739,21 +780,21 @@ class GrinderLogger(nu.Cog):
                 content="You haven't set any amount and role for this tier yet."
             )
 
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
-                if member_data["tier"] == tier:
+        if self.has_grinders(context.guild.id):
+            if grinder := self.get_grinder(context.guild.id, member.id):
+                if grinder.tier == tier:
                     return await context.send(
                         content="That grinder is already that tier."
                     )
-                if int(tier) < int(member_data["tier"]):
+                if int(tier) < int(grinder.tier):
                     return await context.send(
                         content="That tier is lower than this grinders tier did you mean to demote them"
                         f" instead?\n`{context.prefix}grinderlogger demote`"
                     )
-                before = member_data.get("tier")
-                member_data["tier"] = tier
-                after = member_data.get("tier")
-                await self.back_to_config()
+                before = grinder.tier
+                grinder.tier = tier
+                after = grinder.tier
+                self.mark_dirty(context.guild.id, member.id)
                 audit_reason = mod.get_audit_reason(
                     context.author, reason=f"Member promoted to a Tier {tier} grinder."
                 )
@@ -775,7 +816,7 @@ class GrinderLogger(nu.Cog):
                     reason,
                 )
                 if await self.config.guild(context.guild).dm_status():
-                    await self.dm_on_promote_or_demote(
+                    self.dm_on_promote_or_demote(
                         member,
                         "promote",
                         added_roles,
@@ -820,21 +861,21 @@ class GrinderLogger(nu.Cog):
                 content="You haven't set any amount and role for this tier yet."
             )
 
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
-                if member_data["tier"] == tier:
+        if self.has_grinders(context.guild.id):
+            if grinder := self.get_grinder(context.guild.id, member.id):
+                if grinder.tier == tier:
                     return await context.send(
                         content="That grinder is already that tier."
                     )
-                if int(tier) > int(member_data["tier"]):
+                if int(tier) > int(grinder.tier):
                     return await context.send(
                         content="That tier is higher than this grinders tier did you mean to promote them"
                         f" instead?\n`{context.prefix}grinderlogger promote`"
                     )
-                before = member_data.get("tier")
-                member_data["tier"] = tier
-                after = member_data.get("tier")
-                await self.back_to_config()
+                before = grinder.tier
+                grinder.tier = tier
+                after = grinder.tier
+                self.mark_dirty(context.guild.id, member.id)
                 audit_reason = mod.get_audit_reason(
                     context.author, reason=f"Member demoted to a Tier {tier} grinder."
                 )
@@ -856,7 +897,7 @@ class GrinderLogger(nu.Cog):
                     reason,
                 )
                 if await self.config.guild(context.guild).dm_status():
-                    await self.dm_on_promote_or_demote(
+                    self.dm_on_promote_or_demote(
                         member,
                         "demote",
                         removed_roles,
@@ -884,17 +925,19 @@ class GrinderLogger(nu.Cog):
         if member.bot:
             return await context.send(content="Bots are not allowed.")
 
-        donations = await self.config.member(member).donations()
-        times = await self.config.member(member).times_as_grinder()
+        grinder = self.data.get(context.guild.id, {}).get(member.id) or Grinder(
+            context.guild.id, member.id
+        )
+        donations = grinder.donations
+        times = grinder.times_as_grinder
         tiers = await self.config.guild(context.guild).tiers()
 
-        guild_data = self.data.get(str(context.guild.id), {})
-        if member_data := guild_data.get(str(member.id)):
+        if grinder.active:
             tier, due_stamp, grinder_since, last_pay = (
-                member_data.get("tier"),
-                member_data.get("due_timestamp"),
-                member_data.get("grinder_since"),
-                member_data.get("last_payed"),
+                grinder.tier,
+                grinder.due_timestamp,
+                grinder.grinder_since,
+                grinder.last_payed,
             )
             amount = tiers[tier]["amount"]
             description = (
@@ -906,8 +949,8 @@ class GrinderLogger(nu.Cog):
                 f"`{'Grinder Since':<13}`: <t:{grinder_since}:R> (<t:{grinder_since}:f>)"
             )
         else:
-            last_time = await self.config.member(member).last_time_as_grinder()
-            reason_for_left = await self.config.guild(context.guild).reason_for_left()
+            last_time = grinder.last_time_as_grinder
+            reason_for_left = grinder.reason_for_left
             description = (
                 f"`{'Donations':<12}`: {donations}\n"
                 f"`{'Times Joined':<12}`: {f'{times} times' if times > 1 else f'{times} time'}\n"
@@ -983,32 +1026,19 @@ class GrinderLogger(nu.Cog):
         """
         Show the grinderlogger leaderboard.
         """
-        all_members = self.data.get(str(context.guild.id), {})
-        if not all_members:
+        if (leaderboard := self.leaderboards.get(context.guild.id)) is None:
+            leaderboard = GrinderLeaderboard(self.data.get(context.guild.id, {}))
+            self.leaderboards[context.guild.id] = leaderboard
+        if not leaderboard.rows:
             return await context.send(content="This guild has no grinders.")
-
-        all_m = {}
-        for mid, md in all_members.copy().items():
-            member = context.guild.get_member(int(mid))
-            donations = await self.config.member_from_ids(
-                context.guild.id, int(mid)
-            ).donations()
-            all_m[member or mid] = {
-                "donations": donations,
-                "due": md["due_timestamp"],
-                "tier": md["tier"],
-            }
-
-        all_mem = await self.lb_whatever(context.guild, sort_by, all_m)
-
-        pagified = await nu.pagify_this(
-            "\n\n".join(all_mem),
-            "\n\n",
-            embed_title=f"GrinderLogger Leaderboard for [{context.guild.name}]",
-            embed_timestamp=dt.datetime.now(dt.timezone.utc),
-            embed_colour=context.bot._color,
+        source = GrinderPageSource(
+            context.guild,
+            leaderboard,
+            sort_by,
+            await self.config.guild(context.guild).tiers(),
+            context.bot._color,
         )
-        await nu.NoobPaginator(pagified).start(context)
+        await nu.NoobPaginator(source).start(context)
 
     @grinderlogger.command(name="addmember")
     @is_a_grinder_manager()
@@ -1038,23 +1068,10 @@ class GrinderLogger(nu.Cog):
         if member.bot:
             return await context.send(content="Bots are not allowed.")
 
-        if self.data.get(str(context.guild.id), {}).get(str(member.id)):
+        if self.get_grinder(context.guild.id, member.id):
             return await context.send(content="This member is already a grinder.")
 
-        member_data = {
-            "tier": tier,
-            "due_timestamp": None,
-            "grinder_since": round(dt.datetime.now(dt.timezone.utc).timestamp()),
-            "last_payed": None,
-            "reminded": True,
-        }
-
-        times = await self.config.member(member).times_as_grinder()
-        await self.config.member(member).times_as_grinder.set(times + 1)
-        await self.config.member(member).reason_for_left.clear()
-        self.add_to_data(str(context.guild.id), str(member.id), member_data)
-
-        await self.back_to_config()
+        self.add_to_data(context.guild.id, member.id, tier)
 
         audit_reason = mod.get_audit_reason(
             context.author, reason=f"Member is a Tier {tier} grinder."
@@ -1068,7 +1085,7 @@ class GrinderLogger(nu.Cog):
             "add", member, roles, audit_reason
         )
         await context.send(content=f"Added **{member.name}** as a Tier {tier} grinder.")
-        await self.dm_grinder(
+        self.dm_grinder(
             context.guild,
             member,
             tiers[tier]["amount"],
@@ -1101,29 +1118,19 @@ class GrinderLogger(nu.Cog):
                 content="Limit your damn reason to 2k characters."
             )
         tiers = await self.config.guild(context.guild).tiers()
-        if member_data := self.data.get(str(context.guild.id), {}).get(str(member.id)):
-            tier = member_data["tier"]
+        if grinder := self.get_grinder(context.guild.id, member.id):
+            tier = grinder.tier
             await self.log_grinder_history(
                 context,
                 member,
                 tier,
                 tiers[tier]["amount"],
                 "removed",
-                dt.datetime.now(dt.timezone.utc).timestamp()
-                - member_data["grinder_since"],
+                dt.datetime.now(dt.timezone.utc).timestamp() - grinder.grinder_since,
                 reason,
             )
-            self.remove_from_data(str(context.guild.id), str(member.id))
-            await self.back_to_config()
-            await self.config.member_from_ids(
-                context.guild.id, member.id
-            ).last_time_as_grinder.set(
-                round(dt.datetime.now(dt.timezone.utc).timestamp())
-            )
-            if reason:
-                await self.config.member_from_ids(
-                    context.guild.id, member.id
-                ).reason_for_left.set(reason)
+            grinder.leave(round(dt.datetime.now(dt.timezone.utc).timestamp()), reason)
+            self.mark_dirty(context.guild.id, member.id)
             audit_reason = mod.get_audit_reason(
                 context.author, reason=f"Member is no longer a Tier {tier} grinder."
             )
@@ -1135,7 +1142,7 @@ class GrinderLogger(nu.Cog):
             removed_roles = await self.add_or_remove_grinder_roles(
                 "remove", member, roles, audit_reason
             )
-            await self.dm_grinder(
+            self.dm_grinder(
                 context.guild,
                 member,
                 tiers[tier]["amount"],
@@ -1174,7 +1181,7 @@ class GrinderLogger(nu.Cog):
             return await context.send(
                 content="It seems DonationLogger has not been setup in this guild yet."
             )
-        banks = await cog.config.guild(context.guild).banks()
+        banks = cog.bank_store.get(context.guild.id)
         if bank_name:
             try:
                 banks[bank_name]
@@ -1201,6 +1208,39 @@ class GrinderLogger(nu.Cog):
         state = "will no longer" if current else "will now"
         await context.send(content=f"I {state} DM grinders their promotion/demotion.")
 
+    @grinderloggerset.command(name="dmstats")
+    @commands.is_owner()
+    async def grinderloggerset_dmstats(
+        self, context: commands.Context, reset: bool = False
+    ):
+        """
+        See how many grinder DMs were delivered, skipped or failed since the cog was loaded.
+
+        Members whose DMs are closed are not DMed again for a while, pass `True` to reset the counters and forget them.
+        """
+        if reset:
+            self.dm_queue.reset()
+            return await context.send(content="DM delivery stats have been reset.")
+        stats = self.dm_queue.stats
+        embed = discord.Embed(
+            title="GrinderLogger DM delivery",
+            description=(
+                f"`{'Queued':<12}`: {cf.humanize_number(stats['queued'])}\n"
+                f"`{'Pending':<12}`: {cf.humanize_number(len(self.dm_queue))}\n"
+                f"`{'Sent':<12}`: {cf.humanize_number(stats['sent'])}\n"
+                f"`{'DMs closed':<12}`: {cf.humanize_number(stats['closed'])}\n"
+                f"`{'Skipped':<12}`: {cf.humanize_number(stats['skipped'])}\n"
+                f"`{'Failed':<12}`: {cf.humanize_number(stats['failed'])}\n"
+                f"`{'Rate limited':<12}`: {cf.humanize_number(stats['rate_limited'])}"
+            ),
+            colour=await context.embed_colour(),
+            timestamp=dt.datetime.now(dt.timezone.utc),
+        )
+        embed.set_footer(
+            text=f"{self.dm_queue.closed_count} member(s) with closed DMs are being skipped."
+        )
+        await context.send(embed=embed)
+
     @grinderloggerset.command(name="manager")
     @commands.bot_has_permissions(manage_roles=True)
     async def grinderloggerset_manager(
@@ -1363,12 +1403,10 @@ class GrinderLogger(nu.Cog):
         await view.start(context, act, content=conf)
         await view.wait()
         if view.value:
-            with contextlib.suppress(KeyError):
-                self.data.pop(str(context.guild.id))
-            old_data = (await self.config.custom("Grinders").all()).copy()
-            with contextlib.suppress(KeyError):
-                old_data.pop(str(context.guild.id))
-            await self.config.custom("Grinders").set(old_data)
+            self.data.pop(context.guild.id, None)
+            self.dirty.pop(context.guild.id, None)
+            self.leaderboards.pop(context.guild.id, None)
+            await self.config.custom("Grinders", str(context.guild.id)).clear()
             await self.config.guild(context.guild).clear()
             await self.config.clear_all_members(context.guild)
 
@@ -1386,9 +1424,10 @@ class GrinderLogger(nu.Cog):
         if view.value:
             self.init_done = False
             self.save_data_to_config.restart()
-            self.due_reminder_loop.restart()
             self.data.clear()
-            await self.back_to_config()
+            self.dirty.clear()
+            self.leaderboards.clear()
+            self.scheduler.rebuild()
             await self.config.clear_all_guilds()
             await self.config.clear_all_custom("Grinders")
             await self.config.clear_all_members()
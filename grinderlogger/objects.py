@@ -0,0 +1,78 @@
+from typing import Any, Dict, Optional
+
+
+class Grinder:
+    """
+    Everything stored about a member in a guild's grinder program.
+
+    Former grinders keep their record with `tier` set to None so their history survives.
+    """
+
+    __slots__ = (
+        "guild_id",
+        "member_id",
+        "tier",
+        "due_timestamp",
+        "grinder_since",
+        "last_payed",
+        "reminded",
+        "donations",
+        "times_as_grinder",
+        "last_time_as_grinder",
+        "reason_for_left",
+    )
+
+    def __init__(self, guild_id: int, member_id: int, **payload) -> None:
+        self.guild_id = guild_id
+        self.member_id = member_id
+        self.tier: Optional[str] = payload.get("tier")
+        self.due_timestamp: Optional[int] = payload.get("due_timestamp")
+        self.grinder_since: Optional[int] = payload.get("grinder_since")
+        self.last_payed: Optional[int] = payload.get("last_payed")
+        self.reminded: bool = payload.get("reminded", True)
+        self.donations: int = payload.get("donations", 0)
+        self.times_as_grinder: int = payload.get("times_as_grinder", 0)
+        self.last_time_as_grinder: Optional[int] = payload.get("last_time_as_grinder")
+        self.reason_for_left: Optional[str] = payload.get("reason_for_left")
+
+    def __repr__(self) -> str:
+        return (
+            f"<Grinder guild_id={self.guild_id} member_id={self.member_id} "
+            f"tier={self.tier!r} donations={self.donations}>"
+        )
+
+    @property
+    def active(self) -> bool:
+        return self.tier is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tier": self.tier,
+            "due_timestamp": self.due_timestamp,
+            "grinder_since": self.grinder_since,
+            "last_payed": self.last_payed,
+            "reminded": self.reminded,
+            "donations": self.donations,
+            "times_as_grinder": self.times_as_grinder,
+            "last_time_as_grinder": self.last_time_as_grinder,
+            "reason_for_left": self.reason_for_left,
+        }
+
+    def join(self, tier: str, now: int) -> None:
+        self.tier = tier
+        self.due_timestamp = None
+        self.grinder_since = now
+        self.last_payed = None
+        self.reminded = True
+        self.times_as_grinder += 1
+        self.reason_for_left = None
+
+    def leave(self, now: int, reason: str = None) -> None:
+        self.tier = None
+        self.due_timestamp = None
+        self.grinder_since = None
+        self.last_payed = None
+        self.reminded = True
+        self.last_time_as_grinder = now
+        if reason:
+            self.reason_for_left = reason
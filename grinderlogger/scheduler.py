@@ -0,0 +1,101 @@
+import asyncio
+import discord
+import heapq
+import time
+
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import GrinderLogger
+
+
+class DueScheduler:
+    """
+    Min-heap of upcoming grinder due dates that sleeps until the earliest one.
+
+    Entries are never removed in place. When a grinder's due date changes a new entry is
+    pushed and the old one is dropped as stale once it reaches the top of the heap.
+    """
+
+    def __init__(self, cog: "GrinderLogger") -> None:
+        self.cog = cog
+        self.task: Optional[asyncio.Task] = None
+        self._heap: List[Tuple[int, int, int]] = []
+        self._wakeup = asyncio.Event()
+        self._reminders: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, guild_id: int, member_id: int) -> None:
+        """Queue a grinder's current due date if they still need a reminder."""
+        grinder = self.cog.get_grinder(guild_id, member_id)
+        if not grinder or grinder.reminded or not grinder.due_timestamp:
+            return
+        entry = (grinder.due_timestamp, guild_id, member_id)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+    def rebuild(self) -> None:
+        self._heap = [
+            (grinder.due_timestamp, guild_id, member_id)
+            for guild_id, grinders in self.cog.data.items()
+            for member_id, grinder in grinders.items()
+            if grinder.active and grinder.due_timestamp and not grinder.reminded
+        ]
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+
+    def start(self) -> asyncio.Task:
+        self.rebuild()
+        self.task = asyncio.create_task(self.run())
+        return self.task
+
+    def cancel(self) -> None:
+        if self.task and not self.task.done():
+            self.task.cancel()
+        for task in self._reminders:
+            task.cancel()
+
+    async def run(self) -> None:
+        await self.cog.bot.wait_until_red_ready()
+        while True:
+            delay = self._heap[0][0] - time.time() if self._heap else None
+            if delay is None or delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self.remind_due()
+
+    async def remind_due(self) -> None:
+        """
+        Pop everything that is due and hand it to the cog as one batch per guild.
+
+        Each guild's batch runs in its own task so a slow guild can not hold up the others.
+        """
+        now = time.time()
+        batches: Dict[int, Dict[int, int]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            due, guild_id, member_id = heapq.heappop(self._heap)
+            grinder = self.cog.get_grinder(guild_id, member_id)
+            if not grinder or grinder.reminded or grinder.due_timestamp != due:
+                continue
+            batches.setdefault(guild_id, {})[member_id] = due
+        for guild_id, due in batches.items():
+            if not (guild := self.cog.bot.get_guild(guild_id)):
+                continue
+            task = asyncio.create_task(self.remind_guild(guild, due))
+            self._reminders.add(task)
+            task.add_done_callback(self._reminders.discard)
+
+    async def remind_guild(self, guild: discord.Guild, due: Dict[int, int]) -> None:
+        try:
+            await self.cog.remind_members(guild, due)
+        except Exception as e:
+            self.cog.log.exception(
+                f"Failed to send due reminders in guild {guild.id}.", exc_info=e
+            )
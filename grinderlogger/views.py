@@ -0,0 +1,104 @@
+import datetime as dt
+import discord
+import math
+
+from collections.abc import Sequence
+from redbot.core.utils import chat_formatting as cf
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .objects import Grinder
+
+
+class GrinderLeaderboard:
+    """
+    A guild's current grinders, sorted once for every leaderboard order.
+
+    Each row is `(tier, donations, due_timestamp)` keyed by member ID.
+    """
+
+    __slots__ = ("rows", "orders")
+
+    def __init__(self, grinders: Dict[int, Grinder]) -> None:
+        self.rows: Dict[int, Tuple[str, int, Optional[int]]] = {
+            member_id: (grinder.tier, grinder.donations, grinder.due_timestamp)
+            for member_id, grinder in grinders.items()
+            if grinder.active
+        }
+        self.orders: Dict[str, List[int]] = {
+            "dono": sorted(self.rows, key=lambda m: self.rows[m][1], reverse=True),
+            "due": sorted(self.rows, key=lambda m: self.rows[m][2] or 0, reverse=True),
+            "tier": sorted(self.rows, key=lambda m: int(self.rows[m][0]), reverse=True),
+        }
+
+
+class GrinderPageSource(Sequence):
+    """
+    Pages of a precomputed leaderboard order, each formatted when it is indexed.
+
+    Passed to `nu.NoobPaginator` in place of a list of embeds. The sorting is done once by
+    `GrinderLeaderboard`, so even if every page is indexed only the formatting is repeated.
+    """
+
+    per_page = 10
+
+    def __init__(
+        self,
+        guild: discord.Guild,
+        leaderboard: GrinderLeaderboard,
+        sort_by: str,
+        tiers: Dict[str, Dict[str, Any]],
+        colour: discord.Colour,
+    ) -> None:
+        self.guild = guild
+        self.leaderboard = leaderboard
+        self.order = leaderboard.orders[sort_by]
+        self.tiers = tiers
+        self.colour = colour
+
+    @property
+    def page_count(self) -> int:
+        return max(math.ceil(len(self.order) / self.per_page), 1)
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    def __getitem__(self, page):
+        if isinstance(page, slice):
+            return [self.format_page(i) for i in range(*page.indices(len(self)))]
+        if page < 0:
+            page += len(self)
+        if not 0 <= page < len(self):
+            raise IndexError("page index out of range")
+        return self.format_page(page)
+
+    def format_page(self, page: int) -> discord.Embed:
+        rows = []
+        start = page * self.per_page
+        for index, member_id in enumerate(
+            self.order[start : start + self.per_page], start + 1
+        ):
+            tier, donations, due = self.leaderboard.rows[member_id]
+            amt = self.tiers.get(tier, {}).get("amount", 0)
+            t = f"{tier} ({cf.humanize_number(amt)}/day)"
+            mem = self.guild.get_member(member_id)
+            msg = (
+                f"` {index}. ` {mem.mention} (`{mem.id}`):\n"
+                if mem
+                else f"` {index}. ` Member not found in guild (`{member_id}`):\n"
+            )
+            msg += (
+                f"> - `{'Tier':<9}`: **{t}**\n"
+                f"> - `{'Donations':<9}`: {cf.humanize_number(donations)}"
+            )
+            if due:
+                msg += f"\n> - `{'Due':<9}`: <t:{due}:R>"
+            rows.append(msg)
+        embed = discord.Embed(
+            title=f"GrinderLogger Leaderboard for [{self.guild.name}]",
+            description="\n\n".join(rows),
+            colour=self.colour,
+            timestamp=dt.datetime.now(dt.timezone.utc),
+        )
+        embed.set_footer(text=f"Page ({page + 1}/{self.page_count})")
+        return embed